@@ -1,7 +1,5 @@
 """feed_reader package."""
 
-import asyncio
-import logging
 import sys
 from feed_reader.server.app import server, create_mcp_server
 
@@ -11,20 +9,21 @@ __all__ = ["server", "create_mcp_server"]
 def main(transport: str = "stdio"):
     """Entry point for MCP server
 
+    Delegates to the server app's entry point so the event loop setup and
+    shutdown cleanup are shared by every way of starting the server.
+
     Args:
         transport: Transport mode to use ("sse" or "stdio")
     """
-    try:
-        logger = logging.getLogger(__name__)
-        if transport == "stdio":
-            asyncio.run(server.run_stdio_async())
-        else:
-            asyncio.run(server.run_sse_async())
-    except KeyboardInterrupt:
-        logger.info("Server stopped by user")
-    except Exception as e:
-        logger.error(f"Failed to start MCP server: {e}", exc_info=True)
-        sys.exit(1)
+    from feed_reader.server.app import main as server_main
+
+    exit_code = server_main.callback(
+        port=3001,
+        host="127.0.0.1",
+        transport="stdio" if transport == "stdio" else "sse",
+    )
+    if exit_code:
+        sys.exit(exit_code)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -56,22 +56,18 @@ def tool_logger(func: Callable[..., Awaitable[Any]] = None, config: dict = None)
     """
     
     def decorator(f: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        # Find the Context parameter once at decoration time, not per call
+        context_param_name = None
+        for param_name, param in inspect.signature(f).parameters.items():
+            if param.annotation == Context or param_name == 'ctx':
+                context_param_name = param_name
+                break
+
         @wraps(f)
         async def wrapper(*args, **kwargs) -> Any:
             # Check if MCP client provided a correlation ID via context metadata
             correlation_id = None
             
-            # Get function signature to find Context parameter
-            sig = inspect.signature(f)
-            params = sig.parameters
-            
-            # Check if function expects a Context parameter
-            context_param_name = None
-            for param_name, param in params.items():
-                if param.annotation == Context or param_name == 'ctx':
-                    context_param_name = param_name
-                    break
-            
             # Extract Context from kwargs if present
             ctx = None
             if context_param_name and context_param_name in kwargs:
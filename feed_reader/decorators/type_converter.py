@@ -17,7 +17,7 @@ unchanged to maintain MCP compatibility.
 import inspect
 import json
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Union, get_args, get_origin
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, get_args, get_origin
 import asyncio
 
 
@@ -42,16 +42,18 @@ def type_converter(func: Callable) -> Callable:
         The decorated function with type conversion applied
     """
     sig = inspect.signature(func)
+    # Resolve annotations once at decoration time, not per call
+    plan = _build_conversion_plan(sig)
     
     @wraps(func)
     async def async_wrapper(*args, **kwargs):
         """Async wrapper that performs type conversion."""
-        return await _convert_and_call(func, sig, args, kwargs, is_async=True)
+        return await _convert_and_call(func, plan, kwargs)
     
     @wraps(func)
     def sync_wrapper(*args, **kwargs):
         """Sync wrapper that performs type conversion."""
-        return _convert_and_call(func, sig, args, kwargs, is_async=False)
+        return _convert_and_call(func, plan, kwargs)
     
     # Return appropriate wrapper based on function type
     if asyncio.iscoroutinefunction(func):
@@ -65,28 +67,59 @@ def type_converter(func: Callable) -> Callable:
         return sync_wrapper
 
 
-def _convert_and_call(func: Callable, sig: inspect.Signature, args: tuple, kwargs: dict, is_async: bool) -> Any:
+def _build_conversion_plan(sig: inspect.Signature) -> List[Tuple[str, Any, Any, Optional[type]]]:
+    """Precompute per-parameter conversion info from a function signature.
+    
+    Args:
+        sig: The function signature
+        
+    Returns:
+        List of (name, default, annotation, origin) tuples, with Optional[X]
+        unwrapped to X. annotation is inspect.Parameter.empty when absent.
+    """
+    plan = []
+    
+    for param_name, param in sig.parameters.items():
+        annotation = param.annotation
+        origin = None
+        
+        if annotation != inspect.Parameter.empty:
+            # Handle Optional types
+            origin = get_origin(annotation)
+            if origin is Union:
+                # For Optional[X], get the non-None type
+                args_types = get_args(annotation)
+                # Filter out NoneType
+                non_none_types = [t for t in args_types if t != type(None)]
+                if non_none_types:
+                    annotation = non_none_types[0]
+                    origin = get_origin(annotation)
+        
+        plan.append((param_name, param.default, annotation, origin))
+    
+    return plan
+
+
+def _convert_and_call(func: Callable, plan: List[Tuple[str, Any, Any, Optional[type]]], kwargs: dict) -> Any:
     """Convert parameters and call the function.
     
     Args:
         func: The original function
-        sig: The function signature
-        args: Positional arguments
+        plan: Conversion plan from _build_conversion_plan
         kwargs: Keyword arguments
-        is_async: Whether the function is async
         
     Returns:
-        The function result
+        The function result (a coroutine for async functions)
     """
     # Convert kwargs based on function signature
     converted_kwargs = {}
     
-    for param_name, param in sig.parameters.items():
+    for param_name, default, annotation, origin in plan:
         # Skip if parameter not provided
         if param_name not in kwargs:
             # Use default if available
-            if param.default != inspect.Parameter.empty:
-                converted_kwargs[param_name] = param.default
+            if default != inspect.Parameter.empty:
+                converted_kwargs[param_name] = default
             continue
         
         value = kwargs[param_name]
@@ -96,25 +129,11 @@ def _convert_and_call(func: Callable, sig: inspect.Signature, args: tuple, kwarg
             converted_kwargs[param_name] = None
             continue
         
-        # Get the annotation for type conversion
-        annotation = param.annotation
-        
         # Skip if no annotation
         if annotation == inspect.Parameter.empty:
             converted_kwargs[param_name] = value
             continue
         
-        # Handle Optional types
-        origin = get_origin(annotation)
-        if origin is Union:
-            # For Optional[X], get the non-None type
-            args_types = get_args(annotation)
-            # Filter out NoneType
-            non_none_types = [t for t in args_types if t != type(None)]
-            if non_none_types:
-                annotation = non_none_types[0]
-                origin = get_origin(annotation)
-        
         # Perform type conversion
         try:
             converted_value = _convert_value(value, annotation, origin)
@@ -125,10 +144,7 @@ def _convert_and_call(func: Callable, sig: inspect.Signature, args: tuple, kwarg
             converted_kwargs[param_name] = value
     
     # Call the function with converted parameters
-    if is_async:
-        return func(**converted_kwargs)
-    else:
-        return func(**converted_kwargs)
+    return func(**converted_kwargs)
 
 
 def _convert_value(value: Any, target_type: type, origin: Optional[type]) -> Any:
@@ -15,6 +15,25 @@ from typing import Dict, Any, List, Optional
 from ..destinations.base import LogDestination, LogEntry
 from feed_reader.config import ServerConfig
 
+try:
+    import orjson
+except ImportError:  # optional "fast" extra
+    orjson = None
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a log field to JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+
+def _loads(value: str) -> Any:
+    """Deserialize a JSON log field, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
 
 class SQLiteDestination(LogDestination):
     """SQLite implementation of LogDestination.
@@ -104,8 +123,8 @@ class SQLiteDestination(LogDestination):
         conn = self._get_connection()
         
         # Serialize complex fields to JSON
-        input_args_json = json.dumps(entry.input_args) if entry.input_args else None
-        extra_data_json = json.dumps(entry.extra_data) if entry.extra_data else None
+        input_args_json = _dumps(entry.input_args) if entry.input_args else None
+        extra_data_json = _dumps(entry.extra_data) if entry.extra_data else None
         
         # Convert timestamp to string format for SQLite
         timestamp_str = entry.timestamp.isoformat() if isinstance(entry.timestamp, datetime) else str(entry.timestamp)
@@ -215,8 +234,8 @@ class SQLiteDestination(LogDestination):
         
         for row in cursor:
             # Parse JSON fields
-            input_args = json.loads(row['input_args']) if row['input_args'] else None
-            extra_data = json.loads(row['extra_data']) if row['extra_data'] else {}
+            input_args = _loads(row['input_args']) if row['input_args'] else None
+            extra_data = _loads(row['extra_data']) if row['extra_data'] else {}
             
             # Parse timestamp
             timestamp = datetime.fromisoformat(row['timestamp']) if row['timestamp'] else datetime.now()
@@ -153,6 +153,22 @@ class UnifiedLogger:
         
         return logger.bind(**bindings)
     
+    @classmethod
+    def get_module_logger(cls, name: str):
+        """Get a correlation-aware logger that can be created once per module.
+        
+        Unlike get_logger, the correlation ID is looked up each time a message
+        is logged rather than when the logger is created, so the result can be
+        bound at import time and reused across requests.
+        
+        Args:
+            name: Logger name for identification
+            
+        Returns:
+            A Loguru logger instance bound with the name
+        """
+        return logger.bind(logger_name=name).patch(_patch_correlation_id)
+    
     @classmethod
     def set_event_loop(cls, loop: asyncio.AbstractEventLoop):
         """Set the event loop for async operations.
@@ -207,6 +223,11 @@ class UnifiedLogger:
         return LogDestinationFactory.get_available_types()
 
 
+def _patch_correlation_id(record):
+    """Loguru patcher that stamps the current correlation ID onto a record."""
+    record["extra"]["correlation_id"] = get_correlation_id()
+
+
 class InterceptHandler(logging.Handler):
     """Intercept standard library logging and route to Loguru.
     
@@ -6,6 +6,7 @@ This module implements the core MCP server using FastMCP with multi-transport su
 """
 
 import asyncio
+import logging
 import os
 import sys
 from typing import Optional, Callable, Any
@@ -24,9 +25,14 @@ from feed_reader.log_system.correlation import (
 )
 from feed_reader.log_system.unified_logger import UnifiedLogger
 
+from feed_reader.services.http_client import close_client
 from feed_reader.tools.feed_tools import feed_tools
 
 
+# Standard library logger routed through the unified logging system
+unified_logger = logging.getLogger('feed_reader')
+
+
 def create_mcp_server(config: Optional[ServerConfig] = None) -> FastMCP:
     """Create and configure the MCP server with decorators.
     
@@ -68,8 +74,6 @@ def create_mcp_server(config: Optional[ServerConfig] = None) -> FastMCP:
     # setup_logging(config)  # Temporarily disabled to test unified logging
     
     # Log startup info using unified logger
-    import logging
-    unified_logger = logging.getLogger('feed_reader')
     unified_logger.info(f"Unified logging initialized with {len(UnifiedLogger.get_available_destinations())} available destination types")
     unified_logger.info(f"Server config: {config.name} at log level {config.log_level}")
 
@@ -110,10 +114,6 @@ def register_tools(mcp_server: FastMCP, config: ServerConfig) -> None:
     for proper parameter introspection.
     """
     
-    # Get unified logger for registration logs
-    import logging
-    unified_logger = logging.getLogger('feed_reader')
-    
     # Import decorators
     from feed_reader.decorators.exception_handler import exception_handler
     from feed_reader.decorators.tool_logger import tool_logger
@@ -137,8 +137,14 @@ def register_tools(mcp_server: FastMCP, config: ServerConfig) -> None:
     unified_logger.info(f"Server '{mcp_server.name}' initialized with decorators")
 
 
-# Create a server instance that can be imported by the MCP CLI
-server = create_mcp_server()
+# Create a server instance that can be imported by the MCP CLI. When run via
+# `python -m feed_reader.server.app`, importing the parent package has already
+# created one under the regular module name, so reuse it instead of running
+# the full initialization a second time.
+if __name__ == "__main__":
+    from feed_reader.server import server
+else:
+    server = create_mcp_server()
 
 
 @click.command()
@@ -183,6 +189,8 @@ def main(port: int, host: str, transport: str) -> int:
             else:
                 raise ValueError(f"Unknown transport: {transport}")
         finally:
+            # Close shared HTTP client used by feed services
+            await close_client()
             # Clean up unified logger
             await UnifiedLogger.close()
     
@@ -198,15 +206,15 @@ def main(port: int, host: str, transport: str) -> int:
 
 def main_stdio() -> int:
     """Entry point for STDIO transport (convenience wrapper)."""
-    return main.callback(port=3001, transport="stdio")
+    return main.callback(port=3001, host="127.0.0.1", transport="stdio")
 
 def main_http() -> int:
     """Entry point for Streamable HTTP transport (convenience wrapper)."""
-    return main.callback(port=3001, transport="streamable-http")
+    return main.callback(port=3001, host="127.0.0.1", transport="streamable-http")
 
 def main_sse() -> int:
     """Entry point for SSE transport (convenience wrapper)."""
-    return main.callback(port=3001, transport="sse")
+    return main.callback(port=3001, host="127.0.0.1", transport="sse")
 
 
 if __name__ == "__main__":
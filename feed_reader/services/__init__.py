@@ -1,12 +1,26 @@
-"""Services for feed_reader."""
-
-from .feed_discovery import discover_feed_url
-from .feed_parser import parse_feed, ParsedArticle
-from .scraper import scrape_blog
-
-__all__ = [
-    "discover_feed_url",
-    "parse_feed",
-    "ParsedArticle",
-    "scrape_blog",
-]
+"""Services for feed_reader.
+
+Service modules depend on feedparser, lxml and BeautifulSoup, so the
+package exports are resolved lazily on first access.
+"""
+
+from importlib import import_module
+
+# Default cap on articles returned from a single feed or page. Defined here
+# rather than in feed_parser so tools can use it without loading the services.
+DEFAULT_MAX_ARTICLES = 200
+
+_EXPORTS = {
+    "discover_feed_url": "feed_discovery",
+    "parse_feed": "feed_parser",
+    "ParsedArticle": "feed_parser",
+    "scrape_blog": "scraper",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
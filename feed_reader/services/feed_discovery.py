@@ -3,16 +3,31 @@
 This module discovers RSS/Atom feed URLs from a blog homepage.
 """
 
+import asyncio
+import html
+import re
+import time
 import httpx
-from typing import Optional
-from bs4 import BeautifulSoup
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 import feedparser
+import lxml.html
+from lxml import etree
 
 from feed_reader.log_system.unified_logger import UnifiedLogger
+from feed_reader.services.http_client import get_client
+
+
+logger = UnifiedLogger.get_module_logger(__name__)
+
+
+class _DiscoveryUnavailable(Exception):
+    """No feed was found, but only because the homepage couldn't be fetched."""
 
 
 # Common feed paths to probe
-COMMON_FEED_PATHS = [
+COMMON_FEED_PATHS = (
     "/feed",
     "/rss",
     "/feed.xml",
@@ -25,16 +40,62 @@ COMMON_FEED_PATHS = [
     "/?feed=rss2",  # WordPress
     "/blog/feed",
     "/blog/rss",
-]
+)
 
 # Feed MIME types to look for in <link> tags
-FEED_MIME_TYPES = [
+FEED_MIME_TYPES = frozenset({
     "application/rss+xml",
     "application/atom+xml",
     "application/feed+json",
     "application/xml",
     "text/xml",
-]
+})
+
+# Matches any FEED_MIME_TYPES entry, ignoring case and parameters such as charset
+_FEED_MIME_RE = re.compile(
+    r"\s*(?:" + "|".join(map(re.escape, sorted(FEED_MIME_TYPES))) + r")\s*(?:;.*)?",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Byte-level scan for <link> tags and their attributes, used before falling
+# back to a full HTML parse
+_LINK_RE = re.compile(rb"<link\b[^>]*>", re.IGNORECASE)
+_ATTR_RE = re.compile(
+    rb"""([a-zA-Z_:][-a-zA-Z0-9_:.]*)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))"""
+)
+
+# End of the document head; the scan stops here since feed links belong in <head>
+_HEAD_END_RE = re.compile(rb"</head\s*>|<body\b", re.IGNORECASE)
+
+# Start of a JSON Feed document, which feedparser doesn't read
+_JSON_FEED_RE = re.compile(rb'\s*\{.*?"version"\s*:\s*"https?://jsonfeed\.org/version/', re.DOTALL)
+
+# Content types that rule out a probe URL being a feed
+_HTML_CONTENT_TYPE_RE = re.compile(r"\s*(?:text/html|application/xhtml\+xml)\b", re.IGNORECASE)
+
+# Bytes of a candidate feed requested and parsed during validation
+VALIDATION_PREFIX_BYTES = 8192
+
+# How long discovery results are served before being refreshed in the background
+DISCOVERY_TTL_SECONDS = 6 * 60 * 60
+NEGATIVE_DISCOVERY_TTL_SECONDS = 15 * 60
+
+# Most discovery results kept; the least recently used are evicted first
+DISCOVERY_CACHE_MAX_ENTRIES = 1024
+
+# Normalized URL -> (feed_url or None, expires_at monotonic time), in LRU order
+_discovery_cache: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
+# Normalized URL -> [lock, number of callers holding or waiting for it]
+_discovery_locks: Dict[str, list] = {}
+_refresh_tasks: Dict[str, asyncio.Task] = {}
+
+# Shared HTML parser; skipping the id table saves work on large pages
+_HTML_PARSER = lxml.html.HTMLParser(collect_ids=False)
+
+# <link> elements whose space-separated rel attribute contains "alternate"
+_ALTERNATE_LINK_XPATH = etree.XPath(
+    "//link[contains(concat(' ', normalize-space(@rel), ' '), ' alternate ')]"
+)
 
 
 async def discover_feed_url(url: str) -> Optional[str]:
@@ -42,90 +103,360 @@ async def discover_feed_url(url: str) -> Optional[str]:
 
     1. Fetches the homepage HTML
     2. Looks for <link rel="alternate"> with feed MIME types
-    3. If not found, probes common feed paths
+    3. If not found, probes common feed paths concurrently
     4. Validates by attempting to parse as feed
 
+    Results (including misses, but not failures to reach the site) are
+    cached per URL, up to DISCOVERY_CACHE_MAX_ENTRIES. A stale entry is
+    still returned immediately while a background task refreshes it.
+
     Args:
         url: Homepage URL of the blog
 
     Returns:
         Feed URL if found and valid, None otherwise
     """
-    logger = UnifiedLogger.get_logger(__name__)
     logger.info(f"Discovering feed URL for: {url}")
 
     # Normalize URL
     if not url.startswith(("http://", "https://")):
         url = "https://" + url
 
+    cached = _discovery_cache.get(url)
+    if cached is not None:
+        _discovery_cache.move_to_end(url)
+        feed_url, expires_at = cached
+        if expires_at <= time.monotonic():
+            _schedule_refresh(url)
+        logger.info(f"Using cached discovery result for {url}: {feed_url}")
+        return feed_url
+
+    async with _url_lock(url):
+        # Another caller may have finished discovery while we waited
+        cached = _discovery_cache.get(url)
+        if cached is not None:
+            return cached[0]
+
+        return await _discover_and_cache(url)
+
+
+def clear_discovery_cache() -> None:
+    """Clear all cached feed discovery results."""
+    _discovery_cache.clear()
+    # Locks still held by a running discovery stay until it releases them
+    for url in [url for url, (lock, _) in _discovery_locks.items() if not lock.locked()]:
+        del _discovery_locks[url]
+    _refresh_tasks.clear()
+
+
+@asynccontextmanager
+async def _url_lock(url: str) -> AsyncIterator[None]:
+    """Serialize discovery per URL, dropping the lock once nobody needs it."""
+    entry = _discovery_locks.get(url)
+    if entry is None:
+        entry = _discovery_locks[url] = [asyncio.Lock(), 0]
+
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            yield
+    finally:
+        entry[1] -= 1
+        # clear_discovery_cache may already have dropped an idle entry
+        if not entry[1] and _discovery_locks.get(url) is entry:
+            del _discovery_locks[url]
+
+
+def _schedule_refresh(url: str) -> None:
+    """Refresh a stale cache entry in the background, once per URL."""
+    task = _refresh_tasks.get(url)
+    if task is not None and not task.done():
+        return
+
+    _refresh_tasks[url] = asyncio.create_task(_refresh(url))
+
+
+async def _refresh(url: str) -> None:
+    """Re-run discovery for a stale cache entry."""
+
+    try:
+        async with _url_lock(url):
+            await _discover_and_cache(url)
+    except Exception as e:
+        logger.warning(f"Background feed discovery refresh failed for {url}: {e}")
+    finally:
+        _refresh_tasks.pop(url, None)
+
+
+async def _discover_and_cache(url: str) -> Optional[str]:
+    """Run discovery for a normalized URL and cache the result.
+
+    Misses caused by a network error are not cached, so the next call
+    retries instead of serving the failure as "no feed".
+
+    Args:
+        url: Homepage URL including scheme
+
+    Returns:
+        Feed URL if found and valid, None otherwise
+    """
+    try:
+        feed_url = await _discover(url)
+    except _DiscoveryUnavailable:
+        return None
+
+    ttl = DISCOVERY_TTL_SECONDS if feed_url else NEGATIVE_DISCOVERY_TTL_SECONDS
+    _discovery_cache[url] = (feed_url, time.monotonic() + ttl)
+    _discovery_cache.move_to_end(url)
+    while len(_discovery_cache) > DISCOVERY_CACHE_MAX_ENTRIES:
+        _discovery_cache.popitem(last=False)
+
+    return feed_url
+
+
+async def _discover(url: str) -> Optional[str]:
+    """Discover the feed URL for a normalized homepage URL, bypassing the cache.
+
+    Args:
+        url: Homepage URL including scheme
+
+    Returns:
+        Feed URL if found and valid, None otherwise
+
+    Raises:
+        _DiscoveryUnavailable: If no feed was found and the homepage fetch
+            failed with a network error or a server error status
+    """
+
     # Remove trailing slash for consistent path joining
     base_url = url.rstrip("/")
 
-    async with httpx.AsyncClient(
-        follow_redirects=True,
-        timeout=30.0,
-        headers={"User-Agent": "FeedReader/1.0 (RSS Feed Discovery)"},
-    ) as client:
-        # Step 1: Fetch homepage and look for <link> tags
-        try:
-            response = await client.get(url)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "lxml")
-
-            # Look for feed links in <link> tags
-            for link in soup.find_all("link", rel=lambda x: x and "alternate" in x):
-                link_type = link.get("type", "").lower()
-                href = link.get("href", "")
-
-                if any(mime in link_type for mime in FEED_MIME_TYPES) and href:
-                    # Resolve relative URLs
-                    if href.startswith("/"):
-                        feed_url = base_url + href
-                    elif href.startswith("http"):
-                        feed_url = href
-                    else:
-                        feed_url = base_url + "/" + href
-
-                    # Validate the feed
-                    if await _validate_feed(client, feed_url):
-                        logger.info(f"Found feed via link tag: {feed_url}")
-                        return feed_url
-
-        except httpx.HTTPError as e:
-            logger.warning(f"Failed to fetch homepage: {e}")
-
-        # Step 2: Probe common feed paths
-        for path in COMMON_FEED_PATHS:
-            feed_url = base_url + path
-            if await _validate_feed(client, feed_url):
-                logger.info(f"Found feed via path probing: {feed_url}")
-                return feed_url
+    client = await get_client()
+    homepage_error: Optional[httpx.HTTPError] = None
+
+    # Step 1: Fetch homepage and look for <link> tags
+    try:
+        response = await client.get(url)
+        response.raise_for_status()
+
+        # Look for feed links in <link> tags
+        links = await asyncio.to_thread(_find_alternate_links, response.content)
+        candidates = []
+        for link_type, href in links:
+            if _is_feed_mime_type(link_type) and href:
+                # Resolve relative URLs
+                if href.startswith("/"):
+                    feed_url = base_url + href
+                elif href.startswith("http"):
+                    feed_url = href
+                else:
+                    feed_url = base_url + "/" + href
+
+                if feed_url not in candidates:
+                    candidates.append(feed_url)
+
+        feed_url = await _first_valid_link(client, candidates)
+        if feed_url:
+            logger.info(f"Found feed via link tag: {feed_url}")
+            return feed_url
+
+    except httpx.HTTPError as e:
+        logger.warning(f"Failed to fetch homepage: {e}")
+        if _is_transient_error(e):
+            homepage_error = e
+
+    # Step 2: Probe common feed paths concurrently
+    feed_url = await _probe_common_paths(client, base_url)
+    if feed_url:
+        logger.info(f"Found feed via path probing: {feed_url}")
+        return feed_url
+
+    if homepage_error is not None:
+        raise _DiscoveryUnavailable(url) from homepage_error
 
     logger.info(f"No feed found for: {url}")
     return None
 
 
-async def _validate_feed(client: httpx.AsyncClient, feed_url: str) -> bool:
-    """Validate that a URL returns a valid RSS/Atom feed.
+def _is_transient_error(error: httpx.HTTPError) -> bool:
+    """Check whether a failed request is worth retrying soon.
+
+    Args:
+        error: Error raised for the request
+
+    Returns:
+        True for timeouts, connection failures, 429 and 5xx responses
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+def _find_alternate_links(content: bytes) -> List[Tuple[str, str]]:
+    """Find <link rel="alternate"> tags in an HTML document.
+
+    Scans the raw bytes of the document head with a regex first, so the
+    body is never tokenized in the common case, and only builds an lxml
+    tree of the whole page if the scan finds no alternate links.
+
+    Args:
+        content: Raw HTML document bytes
+
+    Returns:
+        List of (type, href) tuples for each alternate link
+    """
+    head_end = _HEAD_END_RE.search(content)
+
+    links = []
+    for match in _LINK_RE.finditer(content, 0, head_end.start() if head_end else len(content)):
+        attrs = {
+            name.decode("ascii").lower(): html.unescape(
+                (double or single or bare).decode("utf-8", errors="replace")
+            )
+            for name, double, single, bare in _ATTR_RE.findall(match.group(0))
+        }
+        if "alternate" in attrs.get("rel", "").split():
+            links.append((attrs.get("type", ""), attrs.get("href", "")))
+
+    if links:
+        return links
+
+    try:
+        tree = lxml.html.fromstring(content, parser=_HTML_PARSER)
+    except (etree.ParserError, ValueError):
+        return []
+
+    return [
+        (link.get("type", ""), link.get("href", ""))
+        for link in _ALTERNATE_LINK_XPATH(tree)
+    ]
+
+
+def _is_feed_mime_type(link_type: str) -> bool:
+    """Check whether a <link> type attribute names a feed MIME type.
+
+    Args:
+        link_type: Value of the type attribute, possibly with parameters
+
+    Returns:
+        True if the base MIME type is one of FEED_MIME_TYPES
+    """
+    return _FEED_MIME_RE.fullmatch(link_type) is not None
+
+
+async def _first_valid_link(client: httpx.AsyncClient, candidates: List[str]) -> Optional[str]:
+    """Validate feeds advertised by a page concurrently, preferring the page's order.
+
+    A feed advertised by the page is worth a GET straight away, so the HEAD
+    check is skipped. Once a candidate validates, the ones after it are
+    cancelled.
+
+    Args:
+        client: HTTP client
+        candidates: Feed URLs from <link> tags, in document order
+
+    Returns:
+        First candidate that validates, None if none do
+    """
+    tasks = [
+        asyncio.create_task(_validate_feed(client, feed_url, check_head=False))
+        for feed_url in candidates
+    ]
+
+    try:
+        for feed_url, task in zip(candidates, tasks):
+            if await task:
+                return feed_url
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    return None
+
+
+async def _probe_common_paths(client: httpx.AsyncClient, base_url: str) -> Optional[str]:
+    """Probe all common feed paths concurrently, preferring COMMON_FEED_PATHS order.
+
+    The result doesn't depend on which server responds fastest: once a path
+    validates and every path before it has failed, the rest are cancelled.
+
+    Args:
+        client: HTTP client
+        base_url: Blog URL without trailing slash
+
+    Returns:
+        Highest-priority feed URL that validates, None if none do
+    """
+    probe_urls = [f"{base_url}{path}" for path in COMMON_FEED_PATHS]
+    tasks = [asyncio.create_task(_validate_feed(client, feed_url)) for feed_url in probe_urls]
+
+    try:
+        for feed_url, task in zip(probe_urls, tasks):
+            if await task:
+                return feed_url
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    return None
+
+
+async def _validate_feed(client: httpx.AsyncClient, feed_url: str, check_head: bool = True) -> bool:
+    """Validate that a URL returns a valid RSS, Atom or JSON feed.
 
     Args:
         client: HTTP client
         feed_url: URL to validate
+        check_head: Send a HEAD request first and skip the GET for missing
+            pages and HTML responses
 
     Returns:
         True if the URL returns a valid feed
     """
     try:
-        response = await client.get(feed_url)
-        if response.status_code != 200:
-            return False
+        if check_head:
+            head = await client.head(feed_url)
+            # Servers that don't support HEAD get a plain GET instead
+            if head.status_code not in (405, 501):
+                if head.status_code != 200:
+                    return False
+                if _HTML_CONTENT_TYPE_RE.match(head.headers.get("content-type", "")):
+                    return False
+
+        # Only the start of the document is needed to spot a title or first
+        # entry; stream it so error pages and oversized bodies aren't downloaded
+        async with client.stream(
+            "GET",
+            feed_url,
+            headers={"Range": f"bytes=0-{VALIDATION_PREFIX_BYTES - 1}"},
+        ) as response:
+            if response.status_code not in (200, 206):
+                return False
+
+            # Servers that ignore Range send the whole body, so stop early
+            content = bytearray()
+            async for chunk in response.aiter_bytes():
+                content += chunk
+                if len(content) > VALIDATION_PREFIX_BYTES:
+                    break
+
+        truncated = response.status_code == 206 or len(content) > VALIDATION_PREFIX_BYTES
+
+        if _JSON_FEED_RE.match(content, 0, VALIDATION_PREFIX_BYTES):
+            return True
 
-        # Try to parse as feed
-        feed = feedparser.parse(response.text)
+        # Try to parse as feed, off the event loop
+        feed = await asyncio.to_thread(
+            feedparser.parse,
+            bytes(content[:VALIDATION_PREFIX_BYTES]),
+            sanitize_html=False,
+            resolve_relative_uris=False,
+        )
 
-        # Check if it has entries or feed metadata
-        if feed.bozo and not feed.entries:
+        # Check if it has entries or feed metadata. A truncated document is
+        # always malformed, so accept it if feedparser recognized the format.
+        if feed.bozo and not feed.entries and not (truncated and feed.version):
             return False
 
         # Valid feed should have title or entries
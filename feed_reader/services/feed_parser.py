@@ -3,88 +3,453 @@
 This module parses RSS/Atom feeds and extracts articles.
 """
 
+import asyncio
 import httpx
+import json
 import feedparser
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from email.utils import parsedate_to_datetime
+from dateutil import parser as dateutil_parser
+from lxml import etree
 
 from feed_reader.log_system.unified_logger import UnifiedLogger
+from feed_reader.services import DEFAULT_MAX_ARTICLES
+from feed_reader.services.http_client import get_client
 
+try:
+    import orjson
+except ImportError:  # optional "fast" extra
+    orjson = None
 
-@dataclass
+
+logger = UnifiedLogger.get_module_logger(__name__)
+
+# Entry date fields, in order of preference
+DATE_FIELDS = ("published", "updated", "created")
+
+# UTC offsets of zone abbreviations found in feed dates, for dateutil
+DATE_TZINFOS = {
+    "EST": -5 * 3600, "EDT": -4 * 3600,
+    "CST": -6 * 3600, "CDT": -5 * 3600,
+    "MST": -7 * 3600, "MDT": -6 * 3600,
+    "PST": -8 * 3600, "PDT": -7 * 3600,
+}
+
+# Namespaces of the feed formats read directly with lxml
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+RSS1_NS = "{http://purl.org/rss/1.0/}"
+DC_NS = "{http://purl.org/dc/elements/1.1/}"
+
+# Root element -> entry element for the feed formats read with lxml
+ENTRY_TAGS = {
+    "rss": "item",
+    f"{ATOM_NS}feed": f"{ATOM_NS}entry",
+    "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}RDF": f"{RSS1_NS}item",
+}
+
+
+class _NotRssOrAtom(Exception):
+    """Raised when a well-formed document isn't an RSS or Atom feed lxml can read."""
+
+
+@dataclass(slots=True, frozen=True)
 class ParsedArticle:
-    """Represents a parsed article from a feed."""
+    """Represents a parsed article from a feed.
+
+    Slotted to keep large feeds small in memory, and frozen so articles
+    replayed from the conditional request cache can be shared safely.
+    """
 
     title: str
     url: str
     published_date: Optional[datetime]
 
 
-async def parse_feed(feed_url: str) -> List[ParsedArticle]:
+# Most feeds kept for conditional requests; the least recently used are evicted first
+FEED_CACHE_MAX_ENTRIES = 256
+
+# (feed_url, max_articles) -> (ETag, Last-Modified, articles) from the last
+# full fetch, replayed when the server answers a conditional GET with 304.
+# Kept in LRU order.
+_feed_cache: "OrderedDict[Tuple[str, int], Tuple[Optional[str], Optional[str], List[ParsedArticle]]]" = OrderedDict()
+
+
+async def parse_feed(feed_url: str, max_articles: int = DEFAULT_MAX_ARTICLES) -> List[ParsedArticle]:
     """Parse an RSS/Atom feed and extract articles.
 
+    The body is parsed as it downloads. Feeds that sent an ETag or
+    Last-Modified header are re-fetched with a conditional GET; if the
+    server answers 304 Not Modified, the articles from the previous fetch
+    are returned without parsing anything.
+
     Args:
         feed_url: URL of the feed to parse
+        max_articles: Stop after this many articles (0 for no limit)
 
     Returns:
         List of ParsedArticle objects
     """
-    logger = UnifiedLogger.get_logger(__name__)
     logger.info(f"Parsing feed: {feed_url}")
 
-    async with httpx.AsyncClient(
-        follow_redirects=True,
-        timeout=30.0,
-        headers={"User-Agent": "FeedReader/1.0 (RSS Feed Reader)"},
-    ) as client:
-        try:
-            response = await client.get(feed_url)
-            response.raise_for_status()
-        except httpx.HTTPError as e:
-            logger.error(f"Failed to fetch feed: {e}")
-            return []
+    client = await get_client()
 
-    # Parse the feed
-    feed = feedparser.parse(response.text)
+    cache_key = (feed_url, max_articles)
+    cached = _feed_cache.get(cache_key)
+    headers = {}
+    if cached is not None:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
 
-    if feed.bozo and not feed.entries:
-        logger.warning(f"Feed parsing error: {feed.bozo_exception}")
+    try:
+        async with client.stream("GET", feed_url, headers=headers) as response:
+            if response.status_code == 304 and cached is not None:
+                _feed_cache.move_to_end(cache_key)
+                logger.info(f"Feed not modified, reusing {len(cached[2])} articles")
+                return list(cached[2])
+            response.raise_for_status()
+
+            articles = await _stream_articles(response, max_articles)
+    except httpx.HTTPError as e:
+        logger.error(f"Failed to fetch feed: {e}")
         return []
 
-    articles = []
-    for entry in feed.entries:
-        # Extract title
-        title = entry.get("title", "").strip()
-        if not title:
-            continue
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        _feed_cache[cache_key] = (etag, last_modified, articles)
+        _feed_cache.move_to_end(cache_key)
+        while len(_feed_cache) > FEED_CACHE_MAX_ENTRIES:
+            _feed_cache.popitem(last=False)
+    else:
+        _feed_cache.pop(cache_key, None)
+
+    logger.info(f"Parsed {len(articles)} articles from feed")
+    return list(articles)
+
+
+def clear_feed_cache() -> None:
+    """Forget the validators and articles kept for conditional feed requests."""
+    _feed_cache.clear()
+
+
+def forget_feed(feed_url: str) -> None:
+    """Forget the conditional request state kept for one feed, at any article limit.
+
+    Args:
+        feed_url: URL of the feed
+    """
+    for key in [key for key in _feed_cache if key[0] == feed_url]:
+        del _feed_cache[key]
+
+
+async def _stream_articles(response: httpx.Response, max_articles: int) -> List[ParsedArticle]:
+    """Parse articles from a feed response as its body arrives.
 
-        # Extract URL
-        url = entry.get("link", "").strip()
-        if not url:
-            # Try alternate link
-            for link in entry.get("links", []):
-                if link.get("rel") == "alternate" or link.get("href"):
-                    url = link.get("href", "")
+    RSS and Atom bytes go through an incremental lxml parser chunk by chunk,
+    so parsing overlaps the download and the rest of the body is never
+    read once max_articles is reached. Each chunk is small enough to parse
+    on the event loop. JSON Feed documents, and feeds lxml rejects, are
+    read in full and parsed in a worker thread instead.
+
+    Args:
+        response: Streamed response with a successful status
+        max_articles: Stop after this many articles (0 for no limit)
+
+    Returns:
+        List of ParsedArticle objects
+    """
+    content = bytearray()
+    reader = _FeedReader()
+    articles: List[ParsedArticle] = []
+    chunks = response.aiter_bytes()
+    sniffed = False
+
+    def add(entries: Iterable[Dict[str, Any]]) -> bool:
+        """Add articles for entries, returning True once max_articles is reached."""
+        for entry in entries:
+            article = _entry_to_article(entry)
+            if article is not None:
+                articles.append(article)
+                if max_articles and len(articles) >= max_articles:
+                    return True
+        return False
+
+    try:
+        async for chunk in chunks:
+            content += chunk
+
+            if not sniffed and chunk.strip():
+                sniffed = True
+                # JSON Feed documents are objects; XML can't start with "{"
+                if content.lstrip()[:1] == b"{":
                     break
 
-        if not url:
+            if add(reader.feed(chunk)):
+                return articles
+        else:
+            add(reader.close())
+            return articles
+    except (etree.XMLSyntaxError, _NotRssOrAtom):
+        pass
+
+    # Read the rest of the body and parse it as a whole, off the event loop.
+    # Anything lxml already read is discarded and the feed re-read leniently.
+    async for chunk in chunks:
+        content += chunk
+    return await asyncio.to_thread(_parse_articles_leniently, bytes(content), max_articles)
+
+
+def _parse_articles_leniently(content: bytes, max_articles: int = DEFAULT_MAX_ARTICLES) -> List[ParsedArticle]:
+    """Parse a feed the streaming lxml reader couldn't handle.
+
+    JSON Feed documents are read as JSON and anything else with feedparser,
+    without another strict lxml pass. Runs in a worker thread via
+    asyncio.to_thread.
+
+    Args:
+        content: Raw feed document bytes
+        max_articles: Stop after this many articles (0 for no limit)
+
+    Returns:
+        List of ParsedArticle objects
+    """
+    # JSON Feed documents are objects; XML can't start with "{"
+    if content.lstrip()[:1] == b"{":
+        return _collect_articles(_read_json_entries(content), max_articles)
+
+    return _collect_articles(_read_entries_with_feedparser(content), max_articles)
+
+
+def _collect_articles(entries: Iterable[Dict[str, Any]], max_articles: int) -> List[ParsedArticle]:
+    """Build articles from entry dicts, skipping entries without a title or URL.
+
+    Args:
+        entries: Entries from lxml or feedparser
+        max_articles: Stop after this many articles (0 for no limit)
+
+    Returns:
+        List of ParsedArticle objects
+    """
+    articles = []
+    for entry in entries:
+        article = _entry_to_article(entry)
+        if article is None:
             continue
 
-        # Extract published date
-        published_date = _parse_date(entry)
+        articles.append(article)
 
-        articles.append(ParsedArticle(
-            title=title,
-            url=url,
-            published_date=published_date,
-        ))
+        if max_articles and len(articles) >= max_articles:
+            break
 
-    logger.info(f"Parsed {len(articles)} articles from feed")
     return articles
 
 
+def _entry_to_article(entry: Dict[str, Any]) -> Optional[ParsedArticle]:
+    """Build an article from an entry dict.
+
+    Args:
+        entry: Entry from lxml, JSON Feed or feedparser
+
+    Returns:
+        ParsedArticle, or None if the entry has no title or URL
+    """
+    # Extract title
+    title = entry.get("title", "").strip()
+    if not title:
+        return None
+
+    # Extract URL
+    url = entry.get("link", "").strip()
+    if not url:
+        # Try alternate link
+        for link in entry.get("links", []):
+            if link.get("rel") == "alternate" or link.get("href"):
+                url = link.get("href", "")
+                break
+
+    if not url:
+        return None
+
+    # Extract published date
+    published_date = _parse_date(entry)
+
+    return ParsedArticle(
+        title=title,
+        url=url,
+        published_date=published_date,
+    )
+
+
+class _FeedReader:
+    """Incremental lxml reader for RSS and Atom documents.
+
+    Entries are yielded as dicts shaped like feedparser's, holding only the
+    title, link and raw date strings. Each entry element is cleared once
+    read, so memory stays bounded by one entry however large the feed.
+    """
+
+    def __init__(self):
+        self._parser = etree.XMLPullParser(
+            events=("start", "end"),
+            tag=(*ENTRY_TAGS, *ENTRY_TAGS.values()),
+            resolve_entities=False,
+            no_network=True,
+            load_dtd=False,
+            huge_tree=False,
+        )
+        self._entry_tag: Optional[str] = None
+        self._convert = _rss_entry
+
+    def feed(self, data: bytes) -> Iterator[Dict[str, Any]]:
+        """Parse the next piece of the document and yield the entries it completes.
+
+        Raises:
+            etree.XMLSyntaxError: If the document isn't well-formed
+            _NotRssOrAtom: If the root element isn't rss, rdf:RDF or an Atom feed
+        """
+        self._parser.feed(data)
+        return self._read_events()
+
+    def close(self) -> Iterator[Dict[str, Any]]:
+        """Finish the document and yield any remaining entries.
+
+        Raises:
+            etree.XMLSyntaxError: If the document is incomplete
+            _NotRssOrAtom: If no root element was seen
+        """
+        self._parser.close()
+        yield from self._read_events()
+        if self._entry_tag is None:
+            raise _NotRssOrAtom("no root element")
+
+    def _read_events(self) -> Iterator[Dict[str, Any]]:
+        """Yield entries for the parse events queued so far."""
+        for event, element in self._parser.read_events():
+            if self._entry_tag is None:
+                # The first event is the root's start if it's a format we read
+                if element.getparent() is not None or element.tag not in ENTRY_TAGS:
+                    raise _NotRssOrAtom(element.tag)
+                self._entry_tag = ENTRY_TAGS[element.tag]
+                self._convert = _atom_entry if element.tag == f"{ATOM_NS}feed" else _rss_entry
+                continue
+
+            if event != "end" or element.tag != self._entry_tag:
+                continue
+
+            yield self._convert(element)
+
+            # Release the entry and any siblings already read
+            element.clear(keep_tail=False)
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+
+def _text(element: Optional[etree._Element]) -> str:
+    """Return all text inside an element, or an empty string if it's missing."""
+    if element is None:
+        return ""
+    return "".join(element.itertext())
+
+
+def _rss_entry(item: etree._Element) -> Dict[str, Any]:
+    """Convert an RSS 2.0 or RSS 1.0 <item> into an entry dict."""
+    ns = RSS1_NS if item.tag.startswith(RSS1_NS) else ""
+    link = _text(item.find(f"{ns}link"))
+    if not link.strip():
+        # Like feedparser, fall back to a permalink guid
+        guid = item.find("guid")
+        if guid is not None and guid.get("isPermaLink", "true") == "true":
+            link = _text(guid)
+    return {
+        "title": _text(item.find(f"{ns}title")),
+        "link": link,
+        "published": _text(item.find("pubDate")),
+        "updated": _text(item.find(f"{DC_NS}date")),
+    }
+
+
+def _atom_entry(entry: etree._Element) -> Dict[str, Any]:
+    """Convert an Atom <entry> into an entry dict."""
+    links = [
+        {"rel": link.get("rel", "alternate"), "href": link.get("href", "")}
+        for link in entry.iterchildren(f"{ATOM_NS}link")
+    ]
+    return {
+        "title": _text(entry.find(f"{ATOM_NS}title")),
+        "link": next((link["href"] for link in links if link["rel"] == "alternate"), ""),
+        "links": links,
+        "published": _text(entry.find(f"{ATOM_NS}published")),
+        "updated": _text(entry.find(f"{ATOM_NS}updated")),
+    }
+
+
+def _read_json_entries(content: bytes) -> List[Dict[str, Any]]:
+    """Read entries from a JSON Feed (https://jsonfeed.org) document.
+
+    Args:
+        content: Raw feed document bytes
+
+    Returns:
+        List of entry dicts shaped like feedparser's, empty if the document
+        isn't valid JSON
+    """
+    try:
+        data = orjson.loads(content) if orjson is not None else json.loads(content)
+    except ValueError as e:
+        logger.warning(f"Feed parsing error: {e}")
+        return []
+
+    items = data.get("items") if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        return []
+
+    return [
+        {
+            "title": _json_str(item.get("title")),
+            "link": _json_str(item.get("url")),
+            "published": _json_str(item.get("date_published")),
+            "updated": _json_str(item.get("date_modified")),
+        }
+        for item in items
+        if isinstance(item, dict)
+    ]
+
+
+def _json_str(value: Any) -> str:
+    """Return a JSON Feed field if it's a string, otherwise an empty string."""
+    return value if isinstance(value, str) else ""
+
+
+def _read_entries_with_feedparser(content: bytes) -> List[Dict[str, Any]]:
+    """Read entries with feedparser, for feeds lxml can't parse strictly.
+
+    Args:
+        content: Raw feed document bytes
+
+    Returns:
+        List of feedparser entries, empty if the feed couldn't be parsed
+    """
+    # Parse the raw bytes so feedparser decodes once; we only read titles,
+    # links and dates, so skip HTML sanitization and URI resolution
+    feed = feedparser.parse(
+        content,
+        sanitize_html=False,
+        resolve_relative_uris=False,
+    )
+
+    if feed.bozo and not feed.entries:
+        logger.warning(f"Feed parsing error: {feed.bozo_exception}")
+        return []
+
+    return feed.entries
+
+
 def _parse_date(entry: dict) -> Optional[datetime]:
     """Parse the publication date from a feed entry.
 
@@ -94,30 +459,55 @@ def _parse_date(entry: dict) -> Optional[datetime]:
     Returns:
         datetime if parsed successfully, None otherwise
     """
-    # Try various date fields
-    for field in ["published", "updated", "created"]:
-        date_str = entry.get(field, "") or entry.get(f"{field}_parsed")
+    # Prefer the time structs feedparser already parsed (normalized to UTC)
+    for field in DATE_FIELDS:
+        parsed = entry.get(f"{field}_parsed")
+        if parsed:
+            try:
+                return datetime(*parsed[:6], tzinfo=timezone.utc)
+            except (ValueError, TypeError):
+                continue
+
+    # Fall back to parsing the raw date strings, cheapest formats first
+    for field in DATE_FIELDS:
+        date_str = entry.get(field, "").strip()
 
         if not date_str:
             continue
 
-        # If it's already a time struct (from feedparser)
-        if isinstance(date_str, tuple):
+        # Try the format the string looks like first, so the common case
+        # doesn't pay for a failed parse: ISO 8601 starts with a four-digit
+        # year, RFC 2822 (common in RSS) with a weekday or day of month
+        if date_str[4:5] == "-" and date_str[:4].isdigit():
+            attempts = (_parse_iso_date, parsedate_to_datetime)
+        else:
+            attempts = (parsedate_to_datetime, _parse_iso_date)
+
+        for attempt in attempts:
             try:
-                return datetime(*date_str[:6])
+                return attempt(date_str)
             except (ValueError, TypeError):
-                continue
-
-        # Try RFC 2822 format (common in RSS)
-        try:
-            return parsedate_to_datetime(date_str)
-        except (ValueError, TypeError):
-            pass
+                pass
 
-        # Try ISO format
+        # Last resort: dateutil for the less common formats (partial W3C
+        # dates, dates without a weekday, ...). Missing fields start at the
+        # beginning of the current year, and dates without a zone are UTC.
+        default = datetime.now(timezone.utc).replace(
+            month=1, day=1, hour=0, minute=0, second=0, microsecond=0
+        )
         try:
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
-            pass
+            parsed = dateutil_parser.parse(date_str, default=default, tzinfos=DATE_TZINFOS)
+        except (ValueError, OverflowError):
+            continue
+        return parsed
 
     return None
+
+
+def _parse_iso_date(date_str: str) -> datetime:
+    """Parse an ISO 8601 date, accepting a trailing Z for UTC.
+
+    Raises:
+        ValueError: If the string isn't ISO 8601
+    """
+    return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
@@ -0,0 +1,54 @@
+"""Shared HTTP client for feed_reader services.
+
+This module provides a lazily-created singleton httpx.AsyncClient so that
+feed discovery, feed parsing, and scraping reuse keep-alive connections
+instead of paying connection setup costs on every call.
+"""
+
+import httpx
+from typing import Optional
+
+try:
+    import h2  # noqa: F401  (httpx only checks that it can be imported)
+except ImportError:  # optional "fast" extra
+    HTTP2_AVAILABLE = False
+else:
+    HTTP2_AVAILABLE = True
+
+
+USER_AGENT = "FeedReader/1.0 (RSS Feed Reader)"
+
+# Singleton client
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client.
+
+    HTTP/2 is negotiated when the h2 package is installed, so requests to
+    the same host share one multiplexed connection.
+
+    Returns:
+        Active httpx.AsyncClient with connection pooling
+    """
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            follow_redirects=True,
+            http2=HTTP2_AVAILABLE,
+            timeout=30.0,
+            headers={"User-Agent": USER_AGENT},
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+
+    return _http_client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client."""
+    global _http_client
+
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
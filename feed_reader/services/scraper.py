@@ -3,80 +3,96 @@
 This module scrapes blog pages to extract article links using CSS selectors.
 """
 
+import asyncio
 import httpx
+import lxml.html
 from bs4 import BeautifulSoup
-from typing import List
-from urllib.parse import urljoin
-
-from feed_reader.services.feed_parser import ParsedArticle
+from cssselect import SelectorError
+from functools import lru_cache
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from typing import List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from feed_reader.services.feed_parser import DEFAULT_MAX_ARTICLES, ParsedArticle
 from feed_reader.log_system.unified_logger import UnifiedLogger
+from feed_reader.services.http_client import get_client
+
+
+logger = UnifiedLogger.get_module_logger(__name__)
+
+# hrefs that never point at an article; checked with one str.startswith call
+SKIPPED_HREF_PREFIXES = ("#", "javascript:", "mailto:", "tel:")
 
 
-async def scrape_blog(url: str, css_selector: str) -> List[ParsedArticle]:
+async def scrape_blog(
+    url: str,
+    css_selector: str,
+    max_articles: int = DEFAULT_MAX_ARTICLES,
+) -> List[ParsedArticle]:
     """Scrape a blog page for article links using a CSS selector.
 
     Args:
         url: URL of the page to scrape
         css_selector: CSS selector to find article links
+        max_articles: Stop after this many articles (0 for no limit)
 
     Returns:
         List of ParsedArticle objects (without published dates)
     """
-    logger = UnifiedLogger.get_logger(__name__)
     logger.info(f"Scraping blog: {url} with selector: {css_selector}")
 
-    async with httpx.AsyncClient(
-        follow_redirects=True,
-        timeout=30.0,
-        headers={"User-Agent": "FeedReader/1.0 (Blog Scraper)"},
-    ) as client:
-        try:
-            response = await client.get(url)
-            response.raise_for_status()
-        except httpx.HTTPError as e:
-            logger.error(f"Failed to fetch page: {e}")
-            return []
+    client = await get_client()
 
-    soup = BeautifulSoup(response.text, "lxml")
+    try:
+        response = await client.get(url)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.error(f"Failed to fetch page: {e}")
+        return []
 
-    # Find all elements matching the selector
-    elements = soup.select(css_selector)
+    # Find (href, title) pairs for all elements matching the selector,
+    # parsing in a worker thread to keep the event loop free
+    links = await asyncio.to_thread(
+        _extract_links, response.content, css_selector, response.charset_encoding
+    )
 
-    if not elements:
+    if not links:
         logger.warning(f"No elements found matching selector: {css_selector}")
         return []
 
     articles = []
     seen_urls = set()
+    # Raw hrefs already handled; index pages often repeat the same link
+    # (title, image, "read more"), and those resolve to the same URL
+    seen_hrefs = set()
 
-    for element in elements:
-        # Find the link - either the element itself or a child <a> tag
-        if element.name == "a":
-            link = element
-        else:
-            link = element.find("a")
-
-        if not link:
-            continue
+    # Precompute URL parts for resolving common href forms without urljoin
+    base_parts = urlsplit(url)
+    base_root = f"{base_parts.scheme}://{base_parts.netloc}"
 
-        href = link.get("href", "").strip()
-        if not href or href.startswith("#") or href.startswith("javascript:"):
+    for href, title in links:
+        if not href or href in seen_hrefs or href.startswith(SKIPPED_HREF_PREFIXES):
             continue
-
-        # Resolve to absolute URL
-        absolute_url = urljoin(url, href)
+        seen_hrefs.add(href)
+
+        # Resolve to absolute URL, leaving relative paths and dot segments to urljoin
+        if "/." in href:
+            absolute_url = urljoin(url, href)
+        elif href.startswith(("http://", "https://")):
+            absolute_url = href
+        elif href.startswith("//"):
+            absolute_url = f"{base_parts.scheme}:{href}"
+        elif href.startswith("/"):
+            absolute_url = base_root + href
+        else:
+            absolute_url = urljoin(url, href)
 
         # Skip duplicates
         if absolute_url in seen_urls:
             continue
         seen_urls.add(absolute_url)
 
-        # Extract title from link text or parent element
-        title = link.get_text(strip=True)
-        if not title:
-            # Try getting text from parent element
-            title = element.get_text(strip=True)
-
         if not title:
             # Use URL as fallback title
             title = absolute_url.split("/")[-1] or absolute_url
@@ -87,5 +103,95 @@ async def scrape_blog(url: str, css_selector: str) -> List[ParsedArticle]:
             published_date=None,  # Scraping doesn't provide dates
         ))
 
+        if max_articles and len(articles) >= max_articles:
+            break
+
     logger.info(f"Scraped {len(articles)} articles from page")
     return articles
+
+
+def _extract_links(
+    content: bytes,
+    css_selector: str,
+    encoding: Optional[str] = None,
+) -> List[Tuple[str, str]]:
+    """Extract (href, title) pairs for elements matching a CSS selector.
+
+    Uses lxml directly, falling back to BeautifulSoup for selectors that
+    cssselect doesn't support.
+
+    Args:
+        content: Raw HTML document bytes
+        css_selector: CSS selector to find article links
+        encoding: Charset from the Content-Type header, None to detect it
+
+    Returns:
+        List of (href, title) tuples; title may be empty
+    """
+    try:
+        selector = _compile_selector(css_selector)
+    except SelectorError:
+        return _extract_links_bs4(content, css_selector, encoding)
+
+    try:
+        elements = selector(lxml.html.fromstring(content, parser=_html_parser(encoding)))
+    except (etree.ParserError, ValueError):
+        return []
+
+    links = []
+    for element in elements:
+        # Find the link - either the element itself or a child <a> tag
+        link = element if element.tag == "a" else next(element.iter("a"), None)
+        if link is None:
+            continue
+
+        # Extract title from link text or parent element
+        title = _element_text(link) or _element_text(element)
+        links.append(((link.get("href") or "").strip(), title))
+
+    return links
+
+
+@lru_cache(maxsize=8)
+def _html_parser(encoding: Optional[str]) -> lxml.html.HTMLParser:
+    """Get a shared HTML parser for a charset; skipping the id table saves work on large pages."""
+    try:
+        return lxml.html.HTMLParser(encoding=encoding, collect_ids=False)
+    except LookupError:
+        # Unknown charset in the header, let lxml detect it instead
+        return _html_parser(None)
+
+
+@lru_cache(maxsize=256)
+def _compile_selector(css_selector: str) -> CSSSelector:
+    """Compile a CSS selector to XPath, cached since blogs are rescanned with the same selector.
+
+    Raises:
+        SelectorError: If cssselect doesn't support the selector
+    """
+    return CSSSelector(css_selector, translator="html")
+
+
+def _extract_links_bs4(
+    content: bytes,
+    css_selector: str,
+    encoding: Optional[str] = None,
+) -> List[Tuple[str, str]]:
+    """BeautifulSoup fallback for _extract_links."""
+    soup = BeautifulSoup(content, "lxml", from_encoding=encoding)
+
+    links = []
+    for element in soup.select(css_selector):
+        link = element if element.name == "a" else element.find("a")
+        if not link:
+            continue
+
+        title = link.get_text(strip=True) or element.get_text(strip=True)
+        links.append((link.get("href", "").strip(), title))
+
+    return links
+
+
+def _element_text(element: etree._Element) -> str:
+    """Get an element's text with each text node stripped, like BS4's get_text(strip=True)."""
+    return "".join(text.strip() for text in element.itertext())
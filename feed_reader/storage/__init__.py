@@ -2,14 +2,17 @@
 
 from .database import (
     get_database,
+    get_reader,
     init_database,
     add_blog,
     remove_blog,
     get_blog_by_name,
+    get_all_blogs,
     list_blogs,
     add_articles,
     get_existing_article_urls,
     list_articles,
+    list_article_rows,
     mark_article_read,
     mark_article_unread,
     mark_all_read,
@@ -18,14 +21,17 @@ from .database import (
 
 __all__ = [
     "get_database",
+    "get_reader",
     "init_database",
     "add_blog",
     "remove_blog",
     "get_blog_by_name",
+    "get_all_blogs",
     "list_blogs",
     "add_articles",
     "get_existing_article_urls",
     "list_articles",
+    "list_article_rows",
     "mark_article_read",
     "mark_article_unread",
     "mark_all_read",
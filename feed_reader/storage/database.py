@@ -4,11 +4,15 @@ This module provides async SQLite database operations for managing blogs and art
 Database location: ~/.feed_reader/feed_reader.db (or FEED_READER_DB_PATH env var)
 """
 
+import json
 import os
+import sqlite3
+import time
 import aiosqlite
-from datetime import datetime, timedelta
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from feed_reader.models.schemas import Blog, Article
 
@@ -21,9 +25,74 @@ def _get_db_path() -> Path:
     return Path.home() / ".feed_reader" / "feed_reader.db"
 
 
-# Singleton connection
+# Connection settings applied when the database is opened. WAL lets reads
+# proceed alongside the writer and makes NORMAL sync safe; foreign_keys is
+# required for the schema's ON DELETE CASCADE.
+PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -64000",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA foreign_keys = ON",
+)
+
+# Settings for the read-only pool connections
+READER_PRAGMAS = (
+    "PRAGMA query_only = 1",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -16000",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA busy_timeout = 5000",
+)
+
+# Number of read-only connections; with WAL they read alongside the writer
+READER_POOL_SIZE = 2
+
+# Bumped whenever init_database gains a data migration (stored in PRAGMA user_version)
+SCHEMA_VERSION = 3
+
+# Statements run on every scan or tool call. Each must keep the same text
+# for every call so sqlite3's per-connection statement cache reuses its
+# prepared statement.
+_SQL_SELECT_BLOG_BY_NAME = "SELECT * FROM blogs WHERE name = ?"
+
+_SQL_INSERT_ARTICLE = """
+    INSERT OR IGNORE INTO articles (blog_id, title, url, published_date, discovered_date)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+# Candidate URLs are bound as one JSON array so the text never depends on
+# their number and never hits SQLITE_MAX_VARIABLE_NUMBER
+_SQL_SELECT_EXISTING_URLS = """
+    SELECT url FROM articles
+    WHERE blog_id = ? AND url IN (SELECT value FROM json_each(?))
+"""
+
+# Article columns in Article field order, so rows unpack straight into it
+_ARTICLE_COLUMNS = ("id", "blog_id", "title", "url", "published_date", "discovered_date", "is_read")
+
+_SQL_SET_READ = f"UPDATE articles SET is_read = ? WHERE id = ? RETURNING {', '.join(_ARTICLE_COLUMNS)}"
+
+_SQL_UPDATE_LAST_SCANNED = """
+    UPDATE blogs SET last_scanned = ?
+    WHERE id IN (SELECT value FROM json_each(?))
+"""
+
+# Singleton connection, used for all writes
 _db_connection: Optional[aiosqlite.Connection] = None
 
+# Read-only connections, handed out round-robin by get_reader
+_reader_connections: List[aiosqlite.Connection] = []
+_next_reader = 0
+
+# Blogs by name, kept in sync with this process's writes. Another process
+# sharing the database file can still remove a blog behind it, so
+# add_articles drops the entry when the blog's id no longer exists. Callers
+# get copies, never the cached instances.
+_blog_cache: Dict[str, Blog] = {}
+
 
 async def get_database() -> aiosqlite.Connection:
     """Get or create a singleton database connection.
@@ -38,13 +107,75 @@ async def get_database() -> aiosqlite.Connection:
         # Ensure directory exists
         db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        _db_connection = await aiosqlite.connect(db_path)
-        _db_connection.row_factory = aiosqlite.Row
-        await init_database(_db_connection)
+        # Only publish the connection once its schema exists, so concurrent
+        # first callers never see a connection without tables
+        db = await aiosqlite.connect(db_path)
+        db.row_factory = aiosqlite.Row
+        await _apply_pragmas(db, in_memory=str(db_path) == ":memory:")
+        await init_database(db)
+
+        if _db_connection is None:
+            _db_connection = db
+        else:
+            # Another caller finished opening the writer while we were
+            await db.close()
 
     return _db_connection
 
 
+async def get_reader() -> aiosqlite.Connection:
+    """Get a read-only connection so reads don't queue behind writes.
+
+    Connections come from a small round-robin pool opened on first use. An
+    in-memory database can't be shared, so the writer connection is
+    returned instead.
+
+    Returns:
+        Active read-only database connection
+    """
+    global _reader_connections, _next_reader
+
+    if not _reader_connections:
+        # Opening the writer first creates the file, schema and WAL
+        writer = await get_database()
+        db_path = _get_db_path()
+        if str(db_path) == ":memory:":
+            return writer
+
+        readers = []
+        for _ in range(READER_POOL_SIZE):
+            conn = await aiosqlite.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+            conn.row_factory = aiosqlite.Row
+            for pragma in READER_PRAGMAS:
+                await conn.execute(pragma)
+            readers.append(conn)
+
+        if _reader_connections:
+            # Another caller opened the pool while we were connecting
+            for conn in readers:
+                await conn.close()
+        else:
+            _reader_connections = readers
+
+    reader = _reader_connections[_next_reader % len(_reader_connections)]
+    _next_reader += 1
+    return reader
+
+
+async def _apply_pragmas(db: aiosqlite.Connection, in_memory: bool = False) -> None:
+    """Apply connection PRAGMAS.
+
+    Args:
+        db: Database connection
+        in_memory: Skip journal settings, which don't apply to :memory: databases
+    """
+    for pragma in PRAGMAS:
+        if in_memory and "journal_mode" in pragma:
+            continue
+        await db.execute(pragma)
+    await db.commit()
+
+
 async def init_database(db: Optional[aiosqlite.Connection] = None) -> None:
     """Initialize database tables if they don't exist.
 
@@ -61,7 +192,7 @@ async def init_database(db: Optional[aiosqlite.Connection] = None) -> None:
             url TEXT NOT NULL UNIQUE,
             feed_url TEXT,
             scrape_selector TEXT,
-            last_scanned TIMESTAMP
+            last_scanned INTEGER
         )
     """)
 
@@ -71,8 +202,8 @@ async def init_database(db: Optional[aiosqlite.Connection] = None) -> None:
             blog_id INTEGER NOT NULL,
             title TEXT NOT NULL,
             url TEXT NOT NULL UNIQUE,
-            published_date TIMESTAMP,
-            discovered_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            published_date INTEGER,
+            discovered_date INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
             is_read BOOLEAN DEFAULT FALSE,
             FOREIGN KEY (blog_id) REFERENCES blogs(id) ON DELETE CASCADE
         )
@@ -83,10 +214,49 @@ async def init_database(db: Optional[aiosqlite.Connection] = None) -> None:
         CREATE INDEX IF NOT EXISTS idx_articles_blog_id ON articles(blog_id)
     """)
 
+    # Serves list_articles' blog/read-status filter and date ordering in one
+    # index range scan, without a temp B-tree for the ORDER BY
+    await db.execute("""
+        CREATE INDEX IF NOT EXISTS idx_articles_listing ON articles(
+            blog_id, is_read, COALESCE(published_date, discovered_date) DESC, id DESC
+        )
+    """)
+
     await db.execute("""
-        CREATE INDEX IF NOT EXISTS idx_articles_is_read ON articles(is_read)
+        CREATE INDEX IF NOT EXISTS idx_articles_date
+        ON articles(COALESCE(published_date, discovered_date) DESC, id DESC)
     """)
 
+    cursor = await db.execute("PRAGMA user_version")
+    (version,) = await cursor.fetchone()
+
+    if version < 1:
+        # Article dates used to be stored as ISO 8601 text; convert them to
+        # Unix seconds. Naive text was written as UTC by CURRENT_TIMESTAMP.
+        for column in ("published_date", "discovered_date"):
+            await db.execute(f"""
+                UPDATE articles
+                SET {column} = CAST(strftime('%s', {column}) AS INTEGER)
+                WHERE typeof({column}) = 'text'
+            """)
+
+    if version < 2:
+        # Superseded by idx_articles_listing; refresh planner statistics once
+        await db.execute("DROP INDEX IF EXISTS idx_articles_is_read")
+        await db.execute("ANALYZE")
+
+    if version < 3:
+        # last_scanned used to be naive local-time ISO 8601 text; the 'utc'
+        # modifier converts it from local time before taking Unix seconds
+        await db.execute("""
+            UPDATE blogs
+            SET last_scanned = CAST(strftime('%s', last_scanned, 'utc') AS INTEGER)
+            WHERE typeof(last_scanned) = 'text'
+        """)
+
+    if version < SCHEMA_VERSION:
+        await db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
     await db.commit()
 
 
@@ -112,26 +282,34 @@ async def add_blog(
     """
     db = await get_database()
 
-    try:
-        cursor = await db.execute(
-            """
-            INSERT INTO blogs (name, url, feed_url, scrape_selector)
-            VALUES (?, ?, ?, ?)
-            """,
-            (name, url, feed_url, scrape_selector),
-        )
-        await db.commit()
-
-        return Blog(
-            id=cursor.lastrowid,
-            name=name,
-            url=url,
-            feed_url=feed_url,
-            scrape_selector=scrape_selector,
-            last_scanned=None,
-        )
-    except aiosqlite.IntegrityError as e:
-        raise ValueError(f"Blog with name '{name}' or URL '{url}' already exists") from e
+    # A duplicate name or URL inserts nothing and returns no row, instead of
+    # raising IntegrityError across the aiosqlite thread. execute_fetchall
+    # finishes the RETURNING statement in one step, so a concurrent caller's
+    # commit never finds it still in progress.
+    rows = await db.execute_fetchall(
+        """
+        INSERT INTO blogs (name, url, feed_url, scrape_selector)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT DO NOTHING
+        RETURNING id
+        """,
+        (name, url, feed_url, scrape_selector),
+    )
+    await db.commit()
+
+    if not rows:
+        raise ValueError(f"Blog with name '{name}' or URL '{url}' already exists")
+
+    blog = Blog(
+        id=rows[0]["id"],
+        name=name,
+        url=url,
+        feed_url=feed_url,
+        scrape_selector=scrape_selector,
+        last_scanned=None,
+    )
+    _blog_cache[name] = blog
+    return replace(blog)
 
 
 async def remove_blog(name: str) -> Tuple[bool, int]:
@@ -145,30 +323,25 @@ async def remove_blog(name: str) -> Tuple[bool, int]:
     """
     db = await get_database()
 
-    # Get blog id first
-    cursor = await db.execute("SELECT id FROM blogs WHERE name = ?", (name,))
+    # Get blog id and its article count in one query
+    cursor = await db.execute(
+        """
+        SELECT id, (SELECT COUNT(*) FROM articles WHERE blog_id = blogs.id) as count
+        FROM blogs WHERE name = ?
+        """,
+        (name,),
+    )
     row = await cursor.fetchone()
 
     if row is None:
         return (False, 0)
 
-    blog_id = row["id"]
-
-    # Count articles to be deleted
-    cursor = await db.execute(
-        "SELECT COUNT(*) as count FROM articles WHERE blog_id = ?", (blog_id,)
-    )
-    count_row = await cursor.fetchone()
-    article_count = count_row["count"]
-
-    # Delete articles first (foreign key constraint)
-    await db.execute("DELETE FROM articles WHERE blog_id = ?", (blog_id,))
-
-    # Delete blog
-    await db.execute("DELETE FROM blogs WHERE id = ?", (blog_id,))
+    # Articles are removed by ON DELETE CASCADE (requires PRAGMA foreign_keys)
+    await db.execute("DELETE FROM blogs WHERE id = ?", (row["id"],))
     await db.commit()
+    _blog_cache.pop(name, None)
 
-    return (True, article_count)
+    return (True, row["count"])
 
 
 async def get_blog_by_name(name: str) -> Optional[Blog]:
@@ -180,22 +353,57 @@ async def get_blog_by_name(name: str) -> Optional[Blog]:
     Returns:
         Blog object if found, None otherwise
     """
-    db = await get_database()
+    blog = _blog_cache.get(name)
+    if blog is not None:
+        return replace(blog)
 
-    cursor = await db.execute("SELECT * FROM blogs WHERE name = ?", (name,))
+    db = await get_reader()
+
+    cursor = await db.execute(_SQL_SELECT_BLOG_BY_NAME, (name,))
     row = await cursor.fetchone()
 
     if row is None:
         return None
 
+    blog = _blog_cache[name] = _row_to_blog(row)
+    return replace(blog)
+
+
+async def get_all_blogs() -> List[Blog]:
+    """Get all blogs, without the article counts list_blogs computes.
+
+    Returns:
+        List of Blog objects ordered by name
+    """
+    db = await get_reader()
+
+    cursor = await db.execute("SELECT * FROM blogs ORDER BY name")
+
+    blogs = []
+    for row in await cursor.fetchall():
+        blog = _blog_cache[row["name"]] = _row_to_blog(row)
+        blogs.append(replace(blog))
+
+    return blogs
+
+
+def _row_to_blog(row: aiosqlite.Row) -> Blog:
+    """Build a Blog from a blogs table row.
+
+    Args:
+        row: Row with the blogs table columns
+
+    Returns:
+        Blog object
+    """
     return Blog(
         id=row["id"],
         name=row["name"],
         url=row["url"],
         feed_url=row["feed_url"],
         scrape_selector=row["scrape_selector"],
-        last_scanned=datetime.fromisoformat(row["last_scanned"])
-        if row["last_scanned"]
+        last_scanned=datetime.fromtimestamp(row["last_scanned"], tz=timezone.utc)
+        if row["last_scanned"] is not None
         else None,
     )
 
@@ -203,23 +411,27 @@ async def get_blog_by_name(name: str) -> Optional[Blog]:
 async def list_blogs() -> List[dict]:
     """List all blogs with article counts.
 
+    last_scanned is formatted by SQLite as an ISO 8601 string in UTC with
+    an explicit +00:00 offset, as list_article_rows does for article dates.
+
     Returns:
         List of dicts with blog info and article counts
     """
-    db = await get_database()
+    db = await get_reader()
 
+    # Per-blog counts are index range counts (idx_articles_blog_id and
+    # idx_articles_listing) rather than an aggregate over every article
     cursor = await db.execute("""
-        SELECT b.*,
-               COUNT(a.id) as total_articles,
-               SUM(CASE WHEN a.is_read = 0 THEN 1 ELSE 0 END) as unread_articles
+        SELECT b.id, b.name, b.url, b.feed_url, b.scrape_selector,
+               strftime('%Y-%m-%dT%H:%M:%S+00:00', b.last_scanned, 'unixepoch') as last_scanned,
+               (SELECT COUNT(*) FROM articles WHERE blog_id = b.id) as total_articles,
+               (SELECT COUNT(*) FROM articles WHERE blog_id = b.id AND is_read = 0) as unread_articles
         FROM blogs b
-        LEFT JOIN articles a ON b.id = a.blog_id
-        GROUP BY b.id
         ORDER BY b.name
     """)
 
     blogs = []
-    async for row in cursor:
+    for row in await cursor.fetchall():
         blogs.append({
             "id": row["id"],
             "name": row["name"],
@@ -228,7 +440,7 @@ async def list_blogs() -> List[dict]:
             "scrape_selector": row["scrape_selector"],
             "last_scanned": row["last_scanned"],
             "total_articles": row["total_articles"],
-            "unread_articles": row["unread_articles"] or 0,
+            "unread_articles": row["unread_articles"],
         })
 
     return blogs
@@ -240,34 +452,50 @@ async def add_articles(blog_id: int, articles: List[dict]) -> int:
     Args:
         blog_id: ID of the blog these articles belong to
         articles: List of article dicts with title, url, published_date
+            (a datetime or ISO 8601 string, optional)
 
     Returns:
         Number of articles actually added (excludes duplicates)
+
+    Raises:
+        ValueError: If no blog with this id exists
     """
+    if not articles:
+        return 0
+
     db = await get_database()
-    added_count = 0
 
-    for article in articles:
-        try:
-            await db.execute(
-                """
-                INSERT INTO articles (blog_id, title, url, published_date)
-                VALUES (?, ?, ?, ?)
-                """,
+    discovered_date = int(time.time())
+
+    # One batched statement in a single transaction; OR IGNORE skips
+    # duplicate URLs (including duplicates within the batch)
+    try:
+        cursor = await db.executemany(
+            _SQL_INSERT_ARTICLE,
+            [
                 (
                     blog_id,
                     article["title"],
                     article["url"],
-                    article.get("published_date"),
-                ),
-            )
-            added_count += 1
-        except aiosqlite.IntegrityError:
-            # Duplicate URL, skip
-            pass
-
+                    _to_timestamp(article.get("published_date")),
+                    discovered_date,
+                )
+                for article in articles
+            ],
+        )
+    except sqlite3.IntegrityError:
+        # OR IGNORE doesn't cover foreign keys: the blog is gone, possibly
+        # removed by another process, so stop serving it from the cache.
+        # SQLite has already undone just the failed statement; the open
+        # transaction is left alone, since concurrent add_articles calls on
+        # the shared writer may have queued their rows in it.
+        for name in [name for name, blog in _blog_cache.items() if blog.id == blog_id]:
+            del _blog_cache[name]
+        raise ValueError(f"Blog with id {blog_id} not found") from None
     await db.commit()
-    return added_count
+
+    # executemany's rowcount is the total number of rows inserted
+    return cursor.rowcount
 
 
 async def get_existing_article_urls(blog_id: int, urls: List[str]) -> Set[str]:
@@ -283,22 +511,12 @@ async def get_existing_article_urls(blog_id: int, urls: List[str]) -> Set[str]:
     if not urls:
         return set()
 
-    db = await get_database()
-
-    placeholders = ",".join("?" * len(urls))
-    cursor = await db.execute(
-        f"""
-        SELECT url FROM articles
-        WHERE blog_id = ? AND url IN ({placeholders})
-        """,
-        [blog_id] + urls,
-    )
+    db = await get_reader()
 
-    existing = set()
-    async for row in cursor:
-        existing.add(row["url"])
+    cursor = await db.execute(_SQL_SELECT_EXISTING_URLS, (blog_id, json.dumps(urls)))
 
-    return existing
+    cursor.row_factory = None
+    return {url for (url,) in await cursor.fetchall()}
 
 
 async def list_articles(
@@ -325,14 +543,95 @@ async def list_articles(
     Returns:
         List of Article objects, ordered by date (newest first)
     """
-    db = await get_database()
+    db = await get_reader()
+
+    query, params = _build_article_query(
+        ", ".join(f"a.{column}" for column in _ARTICLE_COLUMNS),
+        blog_name, include_read, limit, since, before, days,
+    )
+    cursor = await db.execute(query, params)
+    # Rows are unpacked positionally, so skip building sqlite3.Row objects
+    cursor.row_factory = None
+    # One hop to the aiosqlite thread for the whole result set
+    return [_row_to_article(row) for row in await cursor.fetchall()]
+
+
+async def list_article_rows(
+    blog_name: Optional[str] = None,
+    include_read: bool = False,
+    limit: int = 50,
+    since: Optional[datetime] = None,
+    before: Optional[datetime] = None,
+    days: Optional[int] = None,
+) -> List[dict]:
+    """List articles as plain dicts with ISO 8601 date strings.
+
+    Same filters and ordering as list_articles, but dates are formatted by
+    SQLite, in UTC with an explicit +00:00 offset, so callers that
+    serialize the result skip building datetimes.
+
+    Args:
+        blog_name: Optional blog name to filter by
+        include_read: Whether to include read articles (default: False)
+        limit: Maximum number of articles to return (default: 50)
+        since: Only return articles published/discovered after this datetime
+        before: Only return articles published/discovered before this datetime
+        days: Shorthand for "last N days" - overrides `since` if provided
+
+    Returns:
+        List of article dicts, ordered by date (newest first)
+    """
+    db = await get_reader()
+
+    query, params = _build_article_query(
+        """
+        a.id, a.blog_id, a.title, a.url,
+        strftime('%Y-%m-%dT%H:%M:%S+00:00', a.published_date, 'unixepoch') as published_date,
+        strftime('%Y-%m-%dT%H:%M:%S+00:00', a.discovered_date, 'unixepoch') as discovered_date,
+        a.is_read
+        """,
+        blog_name, include_read, limit, since, before, days,
+    )
+    cursor = await db.execute(query, params)
+
+    articles = []
+    for row in await cursor.fetchall():
+        article = dict(row)
+        article["is_read"] = bool(article["is_read"])
+        articles.append(article)
+
+    return articles
+
+
+def _build_article_query(
+    columns: str,
+    blog_name: Optional[str],
+    include_read: bool,
+    limit: int,
+    since: Optional[datetime],
+    before: Optional[datetime],
+    days: Optional[int],
+) -> Tuple[str, List]:
+    """Build the filtered, date-ordered article listing query.
+
+    Args:
+        columns: SELECT list over the articles table aliased as ``a``
+        blog_name: Optional blog name to filter by
+        include_read: Whether to include read articles
+        limit: Maximum number of articles to return
+        since: Only match articles published/discovered after this datetime
+        before: Only match articles published/discovered before this datetime
+        days: Shorthand for "last N days" - overrides `since` if provided
 
+    Returns:
+        Tuple of (query, params)
+    """
     # Handle `days` shorthand - converts to `since`
     if days is not None:
-        since = datetime.now() - timedelta(days=days)
+        since = datetime.now(timezone.utc) - timedelta(days=days)
 
-    query = """
-        SELECT a.*, b.name as blog_name
+    query = f"""
+        SELECT {columns}
         FROM articles a
         JOIN blogs b ON a.blog_id = b.id
         WHERE 1=1
@@ -349,34 +648,16 @@ async def list_articles(
     # Date filtering: use published_date if available, otherwise discovered_date
     if since:
         query += " AND COALESCE(a.published_date, a.discovered_date) >= ?"
-        params.append(since.isoformat())
+        params.append(_to_timestamp(since))
 
     if before:
         query += " AND COALESCE(a.published_date, a.discovered_date) < ?"
-        params.append(before.isoformat())
+        params.append(_to_timestamp(before))
 
     query += " ORDER BY COALESCE(a.published_date, a.discovered_date) DESC, a.id DESC LIMIT ?"
     params.append(limit)
 
-    cursor = await db.execute(query, params)
-
-    articles = []
-    async for row in cursor:
-        articles.append(Article(
-            id=row["id"],
-            blog_id=row["blog_id"],
-            title=row["title"],
-            url=row["url"],
-            published_date=datetime.fromisoformat(row["published_date"])
-            if row["published_date"]
-            else None,
-            discovered_date=datetime.fromisoformat(row["discovered_date"])
-            if row["discovered_date"]
-            else None,
-            is_read=bool(row["is_read"]),
-        ))
-
-    return articles
+    return query, params
 
 
 async def mark_article_read(article_id: int) -> Optional[Article]:
@@ -388,70 +669,89 @@ async def mark_article_read(article_id: int) -> Optional[Article]:
     Returns:
         Updated Article object if found, None otherwise
     """
-    db = await get_database()
+    return await _set_article_read(article_id, True)
 
-    await db.execute(
-        "UPDATE articles SET is_read = 1 WHERE id = ?",
-        (article_id,),
-    )
-    await db.commit()
 
-    cursor = await db.execute("SELECT * FROM articles WHERE id = ?", (article_id,))
-    row = await cursor.fetchone()
+async def mark_article_unread(article_id: int) -> Optional[Article]:
+    """Mark an article as unread.
 
-    if row is None:
-        return None
+    Args:
+        article_id: ID of the article
 
-    return Article(
-        id=row["id"],
-        blog_id=row["blog_id"],
-        title=row["title"],
-        url=row["url"],
-        published_date=datetime.fromisoformat(row["published_date"])
-        if row["published_date"]
-        else None,
-        discovered_date=datetime.fromisoformat(row["discovered_date"])
-        if row["discovered_date"]
-        else None,
-        is_read=bool(row["is_read"]),
-    )
+    Returns:
+        Updated Article object if found, None otherwise
+    """
+    return await _set_article_read(article_id, False)
 
 
-async def mark_article_unread(article_id: int) -> Optional[Article]:
-    """Mark an article as unread.
+async def _set_article_read(article_id: int, is_read: bool) -> Optional[Article]:
+    """Set an article's read status and return the updated row in one statement.
 
     Args:
         article_id: ID of the article
+        is_read: New read status
 
     Returns:
         Updated Article object if found, None otherwise
     """
     db = await get_database()
 
-    await db.execute(
-        "UPDATE articles SET is_read = 0 WHERE id = ?",
-        (article_id,),
-    )
+    # Fetched in the same step as the UPDATE, as in add_blog
+    rows = await db.execute_fetchall(_SQL_SET_READ, (int(is_read), article_id))
     await db.commit()
 
-    cursor = await db.execute("SELECT * FROM articles WHERE id = ?", (article_id,))
-    row = await cursor.fetchone()
+    if not rows:
+        return None
 
-    if row is None:
+    return _row_to_article(rows[0])
+
+
+def _to_timestamp(value: Union[datetime, str, None]) -> Optional[int]:
+    """Convert a datetime or ISO 8601 string to Unix seconds for storage.
+
+    Naive values are taken as UTC, as the schema migration does for the
+    ISO 8601 text it converts.
+
+    Args:
+        value: Date to convert
+
+    Returns:
+        Unix timestamp in seconds, or None if no date was given
+    """
+    if not value:
         return None
 
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            # Unparseable dates are dropped rather than failing the whole batch
+            return None
+
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+
+    return int(value.timestamp())
+
+
+def _row_to_article(row: aiosqlite.Row) -> Article:
+    """Build an Article from a row of _ARTICLE_COLUMNS.
+
+    Args:
+        row: Row with the _ARTICLE_COLUMNS columns, in that order
+
+    Returns:
+        Article object
+    """
+    article_id, blog_id, title, url, published_date, discovered_date, is_read = row
     return Article(
-        id=row["id"],
-        blog_id=row["blog_id"],
-        title=row["title"],
-        url=row["url"],
-        published_date=datetime.fromisoformat(row["published_date"])
-        if row["published_date"]
-        else None,
-        discovered_date=datetime.fromisoformat(row["discovered_date"])
-        if row["discovered_date"]
-        else None,
-        is_read=bool(row["is_read"]),
+        article_id,
+        blog_id,
+        title,
+        url,
+        datetime.fromtimestamp(published_date, tz=timezone.utc) if published_date is not None else None,
+        datetime.fromtimestamp(discovered_date, tz=timezone.utc) if discovered_date is not None else None,
+        bool(is_read),
     )
 
 
@@ -467,16 +767,13 @@ async def mark_all_read(blog_name: Optional[str] = None) -> int:
     db = await get_database()
 
     if blog_name:
-        # Get blog id
-        cursor = await db.execute("SELECT id FROM blogs WHERE name = ?", (blog_name,))
-        row = await cursor.fetchone()
-        if row is None:
-            return 0
-        blog_id = row["id"]
-
+        # Resolve the blog inside the UPDATE; an unknown name matches no rows
         cursor = await db.execute(
-            "UPDATE articles SET is_read = 1 WHERE blog_id = ? AND is_read = 0",
-            (blog_id,),
+            """
+            UPDATE articles SET is_read = 1
+            WHERE blog_id = (SELECT id FROM blogs WHERE name = ?) AND is_read = 0
+            """,
+            (blog_name,),
         )
     else:
         cursor = await db.execute(
@@ -487,24 +784,36 @@ async def mark_all_read(blog_name: Optional[str] = None) -> int:
     return cursor.rowcount
 
 
-async def update_last_scanned(blog_id: int) -> None:
-    """Update the last_scanned timestamp for a blog.
+async def update_last_scanned(*blog_ids: int) -> None:
+    """Update the last_scanned timestamp for one or more blogs in a single commit.
 
     Args:
-        blog_id: ID of the blog
+        blog_ids: IDs of the blogs
     """
+    if not blog_ids:
+        return
+
     db = await get_database()
+    # Stored as Unix seconds, like article dates
+    now = datetime.now(timezone.utc).replace(microsecond=0)
 
-    await db.execute(
-        "UPDATE blogs SET last_scanned = ? WHERE id = ?",
-        (datetime.now().isoformat(), blog_id),
-    )
+    await db.execute(_SQL_UPDATE_LAST_SCANNED, (int(now.timestamp()), json.dumps(blog_ids)))
     await db.commit()
 
+    for name, blog in _blog_cache.items():
+        if blog.id in blog_ids:
+            _blog_cache[name] = replace(blog, last_scanned=now)
+
 
 async def close_database() -> None:
-    """Close the database connection."""
-    global _db_connection
+    """Close the writer and all read-only database connections."""
+    global _db_connection, _reader_connections, _next_reader
+
+    _blog_cache.clear()
+
+    readers, _reader_connections, _next_reader = _reader_connections, [], 0
+    for conn in readers:
+        await conn.close()
 
     if _db_connection is not None:
         await _db_connection.close()
@@ -6,15 +6,27 @@ NOTE: Never use Optional parameters in MCP tools - they break MCP clients.
 Use empty string "" for optional strings and 0 for optional integers.
 """
 
+import asyncio
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 from mcp.server.fastmcp import Context
 
 from feed_reader.log_system.unified_logger import UnifiedLogger
+from feed_reader.services import DEFAULT_MAX_ARTICLES
 from feed_reader.storage import database
-from feed_reader.services.feed_discovery import discover_feed_url
-from feed_reader.services.feed_parser import parse_feed
-from feed_reader.services.scraper import scrape_blog
+
+
+logger = UnifiedLogger.get_module_logger(__name__)
+
+# Feed services pull in feedparser, lxml and BeautifulSoup, so they are
+# imported inside the tools that use them rather than at server startup.
+
+# Tools are annotated with the builtin dict[str, Any] rather than typing.Dict:
+# FastMCP only sends a dict return as the tool's structuredContent unwrapped
+# when the annotation is a builtin generic.
+
+# Maximum number of blogs fetched at once by scan_blogs
+SCAN_CONCURRENCY = 8
 
 
 async def add_blog(
@@ -23,7 +35,7 @@ async def add_blog(
     feed_url: str = "",
     scrape_selector: str = "",
     ctx: Context = None,
-) -> Dict[str, Any]:
+) -> dict[str, Any]:
     """Add a new blog or RSS feed to track.
 
     If no feed_url is provided, the tool will attempt to auto-discover the RSS/Atom
@@ -43,7 +55,6 @@ async def add_blog(
         - feed_discovered: bool indicating if feed was auto-discovered
         - error: string if success is False
     """
-    logger = UnifiedLogger.get_logger(__name__)
     logger.info(f"add_blog called: name={name}, url={url}")
 
     # Normalize URL
@@ -53,6 +64,8 @@ async def add_blog(
     # Auto-discover feed if not provided
     discovered_feed = None
     if not feed_url:
+        from feed_reader.services.feed_discovery import discover_feed_url
+
         logger.info("Attempting feed auto-discovery...")
         discovered_feed = await discover_feed_url(url)
         if discovered_feed:
@@ -92,7 +105,7 @@ async def add_blog(
         }
 
 
-async def remove_blog(name: str, ctx: Context = None) -> Dict[str, Any]:
+async def remove_blog(name: str, ctx: Context = None) -> dict[str, Any]:
     """Remove a blog and all its tracked articles from the database.
 
     This permanently deletes the blog and all associated articles. This action
@@ -109,12 +122,17 @@ async def remove_blog(name: str, ctx: Context = None) -> Dict[str, Any]:
         - articles_deleted: count of articles removed
         - error: string if blog not found
     """
-    logger = UnifiedLogger.get_logger(__name__)
     logger.info(f"remove_blog called: name={name}")
 
+    blog = await database.get_blog_by_name(name)
     success, article_count = await database.remove_blog(name)
 
     if success:
+        if blog is not None and blog.feed_url:
+            from feed_reader.services.feed_parser import forget_feed
+
+            forget_feed(blog.feed_url)
+
         return {
             "success": True,
             "message": f"Removed blog '{name}' and {article_count} articles",
@@ -127,7 +145,7 @@ async def remove_blog(name: str, ctx: Context = None) -> Dict[str, Any]:
         }
 
 
-async def list_blogs(ctx: Context = None) -> Dict[str, Any]:
+async def list_blogs(ctx: Context = None) -> dict[str, Any]:
     """List all configured blogs/feeds with article counts.
 
     Returns summary information about each tracked blog including total and
@@ -143,7 +161,6 @@ async def list_blogs(ctx: Context = None) -> Dict[str, Any]:
         - blogs: list of blog objects with id, name, url, feed_url, scrape_selector,
           last_scanned, total_articles, unread_articles
     """
-    logger = UnifiedLogger.get_logger(__name__)
     logger.info("list_blogs called")
 
     blogs = await database.list_blogs()
@@ -157,8 +174,9 @@ async def list_blogs(ctx: Context = None) -> Dict[str, Any]:
 
 async def scan_blogs(
     blog_name: str = "",
+    max_articles: int = DEFAULT_MAX_ARTICLES,
     ctx: Context = None,
-) -> Dict[str, Any]:
+) -> dict[str, Any]:
     """Fetch new articles from RSS feeds and add them to the database.
 
     Scans all configured blogs or a specific blog. For each blog, fetches the
@@ -167,6 +185,7 @@ async def scan_blogs(
 
     Args:
         blog_name: Scan only this blog (empty string scans all blogs)
+        max_articles: Maximum articles to read from each feed or page (default: 200, 0 for no limit)
         ctx: MCP Context object (injected automatically)
 
     Returns:
@@ -176,8 +195,7 @@ async def scan_blogs(
         - total_new_articles: total new articles added across all blogs
         - results: list of per-blog results with blog name, new_articles count, errors
     """
-    logger = UnifiedLogger.get_logger(__name__)
-    logger.info(f"scan_blogs called: blog_name={blog_name}")
+    logger.info(f"scan_blogs called: blog_name={blog_name}, max_articles={max_articles}")
 
     # Get blogs to scan
     if blog_name:
@@ -189,67 +207,63 @@ async def scan_blogs(
             }
         blogs_to_scan = [blog]
     else:
-        all_blogs = await database.list_blogs()
-        # Convert dict results to Blog-like objects
-        from feed_reader.models.schemas import Blog
-        blogs_to_scan = [
-            Blog(
-                id=b["id"],
-                name=b["name"],
-                url=b["url"],
-                feed_url=b["feed_url"],
-                scrape_selector=b["scrape_selector"],
-                last_scanned=None,
-            )
-            for b in all_blogs
-        ]
-
-    results = []
-    total_new = 0
-
-    for blog in blogs_to_scan:
+        blogs_to_scan = await database.get_all_blogs()
+
+    from feed_reader.services.feed_parser import parse_feed
+    from feed_reader.services.scraper import scrape_blog
+
+    semaphore = asyncio.Semaphore(SCAN_CONCURRENCY)
+
+    async def scan_one(blog) -> Tuple[Dict[str, Any], bool]:
         scan_result = {"blog": blog.name, "new_articles": 0, "errors": []}
 
-        try:
-            articles = []
-
-            # Try feed first
-            if blog.feed_url:
-                parsed = await parse_feed(blog.feed_url)
-                articles = [
-                    {
-                        "title": a.title,
-                        "url": a.url,
-                        "published_date": a.published_date.isoformat() if a.published_date else None,
-                    }
-                    for a in parsed
-                ]
-
-            # Fall back to scraping if no feed or no articles
-            if not articles and blog.scrape_selector:
-                scraped = await scrape_blog(blog.url, blog.scrape_selector)
-                articles = [
-                    {
-                        "title": a.title,
-                        "url": a.url,
-                        "published_date": None,
-                    }
-                    for a in scraped
-                ]
-
-            if articles:
-                added = await database.add_articles(blog.id, articles)
-                scan_result["new_articles"] = added
-                total_new += added
-
-            # Update last scanned timestamp
-            await database.update_last_scanned(blog.id)
-
-        except Exception as e:
-            logger.error(f"Error scanning {blog.name}: {e}")
-            scan_result["errors"].append(str(e))
-
-        results.append(scan_result)
+        async with semaphore:
+            try:
+                articles = []
+
+                # Try feed first
+                if blog.feed_url:
+                    parsed = await parse_feed(blog.feed_url, max_articles=max_articles)
+                    articles = [
+                        {
+                            "title": a.title,
+                            "url": a.url,
+                            "published_date": a.published_date,
+                        }
+                        for a in parsed
+                    ]
+
+                # Fall back to scraping if no feed or no articles
+                if not articles and blog.scrape_selector:
+                    scraped = await scrape_blog(blog.url, blog.scrape_selector, max_articles=max_articles)
+                    articles = [
+                        {
+                            "title": a.title,
+                            "url": a.url,
+                            "published_date": None,
+                        }
+                        for a in scraped
+                    ]
+
+                if articles:
+                    scan_result["new_articles"] = await database.add_articles(blog.id, articles)
+
+            except Exception as e:
+                logger.error(f"Error scanning {blog.name}: {e}")
+                scan_result["errors"].append(str(e))
+                return scan_result, False
+
+        return scan_result, True
+
+    # Fetch blogs concurrently; results keep the order of blogs_to_scan
+    scans = await asyncio.gather(*(scan_one(blog) for blog in blogs_to_scan))
+
+    results = [scan_result for scan_result, _ in scans]
+    total_new = sum(scan_result["new_articles"] for scan_result in results)
+    scanned_ids = [blog.id for blog, (_, ok) in zip(blogs_to_scan, scans) if ok]
+
+    # Update last scanned timestamps for all successful scans in one commit
+    await database.update_last_scanned(*scanned_ids)
 
     return {
         "success": True,
@@ -267,12 +281,13 @@ async def list_articles(
     before: str = "",
     days: int = 0,
     ctx: Context = None,
-) -> Dict[str, Any]:
+) -> dict[str, Any]:
     """List articles with optional filters for blog, read status, and date range.
 
     Date filtering uses published_date when available, falling back to
     discovered_date for articles without a published_date. Results are
-    ordered by date (newest first).
+    ordered by date (newest first). Dates without an offset are taken as
+    UTC, and returned dates are UTC with an explicit +00:00 offset.
 
     Args:
         blog_name: Filter to articles from this blog only (empty string for all blogs)
@@ -296,7 +311,6 @@ async def list_articles(
         - list_articles(since="2025-01-01") -> articles since Jan 1, 2025
         - list_articles(blog_name="Simon Willison", days=7) -> last week from one blog
     """
-    logger = UnifiedLogger.get_logger(__name__)
     logger.info(f"list_articles called: blog_name={blog_name}, include_read={include_read}, limit={limit}, since={since}, before={before}, days={days}")
 
     # Parse date strings to datetime objects
@@ -321,8 +335,9 @@ async def list_articles(
                 "error": f"Invalid 'before' date format: {before}. Use ISO format like '2025-01-01' or '2025-01-01T00:00:00'",
             }
 
-    # Convert empty/zero values to None for database layer
-    articles = await database.list_articles(
+    # Convert empty/zero values to None for database layer; rows come back
+    # with dates already formatted as ISO strings
+    articles = await database.list_article_rows(
         blog_name=blog_name or None,
         include_read=include_read,
         limit=limit,
@@ -345,22 +360,11 @@ async def list_articles(
         "success": True,
         "count": len(articles),
         "filters_applied": filters_applied,
-        "articles": [
-            {
-                "id": a.id,
-                "blog_id": a.blog_id,
-                "title": a.title,
-                "url": a.url,
-                "published_date": a.published_date.isoformat() if a.published_date else None,
-                "discovered_date": a.discovered_date.isoformat() if a.discovered_date else None,
-                "is_read": a.is_read,
-            }
-            for a in articles
-        ],
+        "articles": articles,
     }
 
 
-async def mark_article_read(article_id: int, ctx: Context = None) -> Dict[str, Any]:
+async def mark_article_read(article_id: int, ctx: Context = None) -> dict[str, Any]:
     """Mark a specific article as read.
 
     Updates the article's is_read status to true. Use this to track which
@@ -376,7 +380,6 @@ async def mark_article_read(article_id: int, ctx: Context = None) -> Dict[str, A
         - article: object with id, title, url, is_read (if found)
         - error: string if article not found
     """
-    logger = UnifiedLogger.get_logger(__name__)
     logger.info(f"mark_article_read called: article_id={article_id}")
 
     article = await database.mark_article_read(article_id)
@@ -401,7 +404,7 @@ async def mark_article_read(article_id: int, ctx: Context = None) -> Dict[str, A
 async def mark_all_read(
     blog_name: str = "",
     ctx: Context = None,
-) -> Dict[str, Any]:
+) -> dict[str, Any]:
     """Mark all unread articles as read, optionally filtered to a specific blog.
 
     Bulk operation to clear your unread queue. Can mark all articles across
@@ -418,14 +421,13 @@ async def mark_all_read(
         - blog_filter: the blog_name filter if provided, null otherwise
         - error: string if specified blog not found
     """
-    logger = UnifiedLogger.get_logger(__name__)
     logger.info(f"mark_all_read called: blog_name={blog_name}")
 
     # Convert empty string to None for database layer
     count = await database.mark_all_read(blog_name or None)
 
     if blog_name and count == 0:
-        # Check if blog exists
+        # Nothing was updated; only now check whether the blog exists
         blog = await database.get_blog_by_name(blog_name)
         if not blog:
             return {
@@ -440,7 +442,7 @@ async def mark_all_read(
     }
 
 
-async def mark_article_unread(article_id: int, ctx: Context = None) -> Dict[str, Any]:
+async def mark_article_unread(article_id: int, ctx: Context = None) -> dict[str, Any]:
     """Mark a specific article as unread.
 
     Reverts an article's read status back to unread. Use this if you want
@@ -456,7 +458,6 @@ async def mark_article_unread(article_id: int, ctx: Context = None) -> Dict[str,
         - article: object with id, title, url, is_read (if found)
         - error: string if article not found
     """
-    logger = UnifiedLogger.get_logger(__name__)
     logger.info(f"mark_article_unread called: article_id={article_id}")
 
     article = await database.mark_article_unread(article_id)
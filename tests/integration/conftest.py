@@ -8,6 +8,8 @@ Production database (~/.feed_reader/feed_reader.db) is NEVER touched by tests.
 """
 
 import asyncio
+import importlib.util
+import json
 import os
 import sys
 import subprocess
@@ -18,11 +20,16 @@ import psutil
 import shutil
 import tempfile
 from pathlib import Path
-from typing import AsyncGenerator, Tuple, Optional, List
+from typing import Any, AsyncGenerator, Callable, Tuple, Optional, List
 import pytest
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client, get_default_environment
 
+try:
+    import orjson
+except ImportError:  # optional "fast" extra
+    orjson = None
+
 # Conditional import for streamable_http
 try:
     from mcp.client.streamable_http import streamablehttp_client
@@ -90,25 +97,39 @@ def test_database_isolation():
     _cleanup_test_db()
 
 
-@pytest.fixture(autouse=True)
-async def clean_database_between_tests(test_database_isolation):
-    """Clean the test database before each test for isolation.
+@pytest.fixture(scope="module")
+def anyio_backend():
+    """Run each module on one event loop, using uvloop when it is installed.
 
-    This ensures each test starts with a fresh, empty database.
+    The module scope also lets class-scoped async fixtures use the backend.
+    uvloop is POSIX-only, so Windows keeps the default asyncio loop.
+    """
+    if sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None:
+        return "asyncio", {"use_uvloop": True}
+    return "asyncio"
+
+
+@pytest.fixture(scope="class", autouse=True)
+async def clean_database_between_classes(test_database_isolation):
+    """Clean the test database before each test class for isolation.
+
+    Servers live for a whole class, so the file is only removed before any of
+    them has opened it. Within a class, mcp_session resets state between tests.
     """
     from feed_reader.storage.database import close_database, _get_db_path
 
-    # Close any existing connection before test
+    # Close any existing connection before the class
     await close_database()
 
-    # Delete the test database file if it exists
+    # Delete the test database file and its WAL sidecars, which SQLite would
+    # otherwise replay into the next class's new database
     db_path = _get_db_path()
-    if db_path.exists():
-        db_path.unlink()
+    for suffix in ("", "-wal", "-shm"):
+        db_path.with_name(db_path.name + suffix).unlink(missing_ok=True)
 
     yield
 
-    # Close connection after test
+    # Close connection after the class
     await close_database()
 
 
@@ -243,18 +264,53 @@ class StreamableHTTPServer:
 atexit.register(StreamableHTTPServer.cleanup_all)
 
 
+def _http_port() -> int:
+    """Pick the Streamable HTTP port for this test process.
+
+    Under pytest-xdist each worker (gw0, gw1, ...) gets its own port so
+    parallel workers never share or kill each other's servers.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    return 3001 + int(worker[2:])
+
+
+def pytest_collection_modifyitems(items):
+    """Mark every integration test that isn't ``fast`` as ``slow``.
+
+    CI can then run ``-m fast`` without starting any server subprocess.
+
+    Each test class is also put in its own ``xdist_group``, so under
+    ``--dist loadgroup`` (the mode the unit tests need too) every test in a
+    class runs on the worker that owns the class's MCP server.
+    """
+    integration_dir = Path(__file__).parent
+    for item in items:
+        if integration_dir not in item.path.parents:
+            continue
+        if item.get_closest_marker("fast") is None:
+            item.add_marker(pytest.mark.slow)
+        if item.get_closest_marker("xdist_group") is None:
+            scope = item.cls.__qualname__ if item.cls is not None else "module"
+            item.add_marker(pytest.mark.xdist_group(f"{item.path.stem}::{scope}"))
+
+
 # Skip streamable-http if not available
 TRANSPORTS = ["stdio"]
 if HAS_STREAMABLE_HTTP:
     TRANSPORTS.append("streamable-http")
 
-@pytest.fixture(params=TRANSPORTS)
-async def mcp_session(request) -> AsyncGenerator[Tuple[ClientSession, str], None]:
-    """Provide an MCP client session for testing with multiple transports.
+@pytest.fixture(scope="class", params=TRANSPORTS)
+async def mcp_server_session(request) -> AsyncGenerator[Tuple[ClientSession, str], None]:
+    """Provide an MCP client session shared by every test in a class.
     
     This fixture is parameterized to run tests with both STDIO and Streamable HTTP
-    transports automatically. Includes bulletproof cleanup that guarantees
-    all resources are released even if tests fail catastrophically.
+    transports automatically. The server is started once per class and transport,
+    so tests pay for a tool call rather than a server start and handshake.
+    Includes bulletproof cleanup that guarantees all resources are released even
+    if tests fail catastrophically.
+
+    Classes marked ``transport_agnostic`` only run once, and classes marked
+    ``fast`` connect to an in-process server instead of a subprocess.
     
     Args:
         request: pytest request object containing the transport parameter
@@ -263,6 +319,11 @@ async def mcp_session(request) -> AsyncGenerator[Tuple[ClientSession, str], None
         Tuple of (ClientSession, transport_name)
     """
     transport = request.param
+    if transport != "stdio" and request.node.get_closest_marker("transport_agnostic"):
+        # Server-side properties like the tool list don't depend on how the
+        # client connects, so one transport is enough
+        pytest.skip("transport-agnostic test, covered by a single run")
+
     session = None
     cleanup_funcs = []
     server_instance = None  # Track server for guaranteed cleanup
@@ -292,7 +353,22 @@ async def mcp_session(request) -> AsyncGenerator[Tuple[ClientSession, str], None
     request.addfinalizer(emergency_cleanup)
     
     try:
-        if transport == "stdio":
+        if request.node.get_closest_marker("fast"):
+            # Fast tests only read server-side state, so they talk to the
+            # server object in this process instead of spawning one
+            from mcp.shared.memory import create_connected_server_and_client_session
+            from feed_reader.server.app import server as in_process_server
+
+            transport = "in-process"
+            memory_context = create_connected_server_and_client_session(in_process_server)
+            session = await memory_context.__aenter__()
+
+            async def cleanup_memory():
+                await memory_context.__aexit__(None, None, None)
+
+            cleanup_funcs.append(cleanup_memory)
+
+        elif transport == "stdio":
             # Setup STDIO transport
             project_root = Path(__file__).parent.parent.parent
             server_module = "feed_reader.server.app"
@@ -361,7 +437,7 @@ async def mcp_session(request) -> AsyncGenerator[Tuple[ClientSession, str], None
                 pytest.skip("streamable_http module not available")
             
             # Setup Streamable HTTP transport
-            port = 3001
+            port = _http_port()
             
             # Start server in subprocess
             server = StreamableHTTPServer(port)
@@ -416,13 +492,126 @@ async def mcp_session(request) -> AsyncGenerator[Tuple[ClientSession, str], None
                 print(f"Cleanup error: {e}", file=sys.stderr)
 
 
+@pytest.fixture
+async def mcp_session(mcp_server_session) -> AsyncGenerator[Tuple[ClientSession, str], None]:
+    """Provide the class's MCP client session, reset after each test.
+
+    Every blog except class-level seeded ones is removed once the test
+    finishes (articles cascade with them), so tests sharing a server still
+    start from the same feed list.
+
+    Args:
+        mcp_server_session: The class-scoped (session, transport) fixture
+
+    Yields:
+        Tuple of (ClientSession, transport_name)
+    """
+    session, transport = mcp_server_session
+
+    yield session, transport
+
+    blogs = parse_result(await session.call_tool("list_blogs", {}))["blogs"]
+    await asyncio.gather(*[
+        session.call_tool("remove_blog", {"name": blog["name"]})
+        for blog in blogs
+        if blog["name"] not in _seeded_blogs
+    ])
+
+
+# Names of blogs owned by seeded_blog, which mcp_session leaves in place
+_seeded_blogs: set = set()
+
+
+@pytest.fixture(scope="class")
+async def seeded_blog(mcp_server_session) -> AsyncGenerator[dict, None]:
+    """Add one blog for the whole test class and remove it afterwards.
+
+    Args:
+        mcp_server_session: The class-scoped (session, transport) fixture
+
+    Yields:
+        The blog as returned by the add_blog tool
+    """
+    session, transport = mcp_server_session
+    name = f"Seeded Blog {transport}"
+
+    data = parse_result(await session.call_tool("add_blog", {
+        "name": name,
+        "url": f"https://seeded-{transport}.example.com",
+        "feed_url": f"https://seeded-{transport}.example.com/feed.xml",
+    }))
+    _seeded_blogs.add(name)
+
+    try:
+        yield data["blog"]
+    finally:
+        _seeded_blogs.discard(name)
+        try:
+            await session.call_tool("remove_blog", {"name": name})
+        except Exception as e:
+            print(f"Seeded blog cleanup error: {e}", file=sys.stderr)
+
+
+# Tool listings are fixed for the lifetime of the server build under test, so
+# they are fetched once per transport and shared by the discovery tests.
+_tools_cache: dict = {}
+
+
+@pytest.fixture
+async def tools_response(mcp_session):
+    """Provide the ``list_tools`` response for the current transport.
+
+    The first test on each transport performs the round-trip; later tests reuse
+    the cached response instead of asking the server again.
+
+    Args:
+        mcp_session: The parameterized (session, transport) fixture
+
+    Returns:
+        The MCP ListToolsResult for the transport
+    """
+    session, transport = mcp_session
+    if transport not in _tools_cache:
+        _tools_cache[transport] = await session.list_tools()
+    return _tools_cache[transport]
+
+
+@pytest.fixture
+def tools_by_name(tools_response) -> dict:
+    """Index the cached tool listing by tool name.
+
+    Args:
+        tools_response: The cached ListToolsResult for the current transport
+
+    Returns:
+        Mapping of tool name to MCP Tool definition
+    """
+    return {tool.name: tool for tool in tools_response.tools}
+
+
+@pytest.fixture
+def schema_props(tools_response) -> dict:
+    """Map each tool name to the property names of its input schema.
+
+    Args:
+        tools_response: The cached ListToolsResult for the current transport
+
+    Returns:
+        Mapping of tool name to a frozenset of input property names
+    """
+    return {
+        tool.name: frozenset((tool.inputSchema or {}).get("properties", {}))
+        for tool in tools_response.tools
+    }
+
+
 @pytest.fixture
 async def stdio_session() -> AsyncGenerator[ClientSession, None]:
     """Provide a STDIO-only MCP client session for specific tests.
     
     Use this fixture when you need to test STDIO-specific functionality.
     """
-    async for session, transport in mcp_session(pytest.FixtureRequest(param="stdio")):
+    async for session, transport in mcp_server_session(pytest.FixtureRequest(param="stdio")):
         if transport == "stdio":
             yield session
 
@@ -433,7 +622,7 @@ async def streamable_http_session() -> AsyncGenerator[ClientSession, None]:
     
     Use this fixture when you need to test Streamable HTTP-specific functionality.
     """
-    async for session, transport in mcp_session(pytest.FixtureRequest(param="streamable-http")):
+    async for session, transport in mcp_server_session(pytest.FixtureRequest(param="streamable-http")):
         if transport == "streamable-http":
             yield session
 
@@ -468,4 +657,47 @@ def extract_error_text(result) -> Optional[str]:
     """
     if result.isError and result.content:
         return extract_text_content(result)
-    return None
\ No newline at end of file
+    return None
+
+
+def parse_result(result) -> Any:
+    """Parse the JSON payload of an MCP tool result.
+
+    Feed tools return their payload as structuredContent, which needs no
+    decoding. Results without it (e.g. from older servers) fall back to the
+    JSON text item, decoded with orjson when it is installed. Feed tools
+    reply with a single text item, so that is read directly before falling
+    back to a search of the content list.
+
+    Args:
+        result: MCP CallToolResult
+
+    Returns:
+        The decoded JSON payload
+    """
+    from mcp import types
+
+    if result.structuredContent is not None:
+        return result.structuredContent
+
+    first = result.content[0] if result.content else None
+    if isinstance(first, types.TextContent):
+        text = first.text
+    else:
+        text = extract_text_content(result)
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def parse_as(result, schema: Callable[..., Any] = dict) -> Any:
+    """Parse an MCP tool result's JSON payload into ``schema``.
+
+    Args:
+        result: MCP CallToolResult
+        schema: Callable built from the payload's keys, e.g. a dataclass
+
+    Returns:
+        ``schema(**payload)``
+    """
+    return schema(**parse_result(result))
@@ -2,92 +2,153 @@
 
 This test suite validates the feed reader MCP tools work correctly when accessed
 via the actual MCP client, testing the complete protocol flow.
+
+Test classes are independent and can run in parallel with pytest-xdist,
+together with the unit tests:
+
+    python -m pytest tests -n auto --dist loadgroup
+
+conftest puts each class in its own xdist_group, so loadgroup keeps the
+class on one worker and its shared MCP server is reused.
+Each worker has its own database and HTTP port, and tests that create blogs
+name them with unique_id() so nothing depends on state from another test.
 """
 
-import json
-import uuid
+import asyncio
+import itertools
+import os
+from dataclasses import dataclass, field
+from typing import Tuple
+from typing_extensions import TypedDict
 import pytest
+from pydantic import ConfigDict, TypeAdapter, with_config
 from mcp import types
-from .conftest import extract_text_content, extract_error_text
+from .conftest import parse_as, parse_result
+
+
+_ID_COUNTER = itertools.count()
 
 
 def unique_id() -> str:
-    """Generate a unique ID for test isolation."""
-    return str(uuid.uuid4())[:8]
+    """Generate a unique ID for test isolation.
+
+    Uniqueness only has to hold within one pytest process, so the process id
+    plus a counter is enough.
+    """
+    return f"{os.getpid():x}{next(_ID_COUNTER):x}"
+
+
+def _blog_urls(test_id: str, label: str = "Test Blog") -> Tuple[str, str, str]:
+    """Build the name, homepage URL and feed URL for a test blog.
+
+    Args:
+        test_id: Value from unique_id()
+        label: Prefix for the blog name
+
+    Returns:
+        Tuple of (name, url, feed_url)
+    """
+    base = f"https://example-{test_id}.com"
+    return f"{label} {test_id}", base, f"{base}/feed.xml"
 
 
 # Use anyio instead of pytest-asyncio to match SDK approach
 pytestmark = pytest.mark.anyio
 
+EXPECTED_TOOLS = (
+    "add_blog",
+    "remove_blog",
+    "list_blogs",
+    "scan_blogs",
+    "list_articles",
+    "mark_article_read",
+    "mark_all_read",
+    "mark_article_unread",
+)
+EXPECTED_TOOL_SET = frozenset(EXPECTED_TOOLS)
 
-class TestFeedToolDiscovery:
-    """Test feed tool discovery functionality."""
 
-    async def test_all_feed_tools_discoverable(self, mcp_session):
-        """Verify all 8 feed tools are registered.
+@dataclass(slots=True, frozen=True)
+class ListArticlesResult:
+    """Payload returned by the list_articles tool."""
 
-        This test runs with both STDIO and Streamable HTTP transports.
-        """
-        session, transport = mcp_session
-        tools_response = await session.list_tools()
+    success: bool
+    count: int = 0
+    articles: list = field(default_factory=list)
+    filters_applied: dict = field(default_factory=dict)
+    error: str = ""
 
-        tool_names = [tool.name for tool in tools_response.tools]
 
-        expected_tools = [
-            "add_blog",
-            "remove_blog",
-            "list_blogs",
-            "scan_blogs",
-            "list_articles",
-            "mark_article_read",
-            "mark_all_read",
-            "mark_article_unread",
-        ]
+@with_config(ConfigDict(strict=True))
+class ListBlogsResponse(TypedDict):
+    """Payload returned by the list_blogs tool."""
 
-        for expected in expected_tools:
-            assert expected in tool_names, (
-                f"Feed tool {expected} not found in {tool_names} (transport: {transport})"
-            )
+    success: bool
+    count: int
+    blogs: list
 
-    async def test_no_kwargs_in_feed_tool_schemas(self, mcp_session):
-        """Test that no feed tool has a 'kwargs' parameter (MCP compatibility).
 
-        This test runs with both STDIO and Streamable HTTP transports.
-        """
-        session, transport = mcp_session
-        tools_response = await session.list_tools()
+@with_config(ConfigDict(strict=True))
+class ListArticlesResponse(TypedDict):
+    """Payload returned by the list_articles tool."""
 
-        feed_tool_names = [
-            "add_blog", "remove_blog", "list_blogs", "scan_blogs",
-            "list_articles", "mark_article_read", "mark_all_read", "mark_article_unread",
-        ]
+    success: bool
+    count: int
+    filters_applied: dict
+    articles: list
 
-        for tool in tools_response.tools:
-            if tool.name in feed_tool_names:
-                if tool.inputSchema:
-                    properties = tool.inputSchema.get("properties", {})
-                    assert "kwargs" not in properties, (
-                        f"Feed tool {tool.name} has kwargs parameter which breaks MCP compatibility (transport: {transport})"
-                    )
 
-    async def test_feed_tools_have_descriptions(self, mcp_session):
-        """Test that all feed tools have descriptions.
+@with_config(ConfigDict(strict=True))
+class ScanBlogsResponse(TypedDict):
+    """Payload returned by the scan_blogs tool."""
 
-        This test runs with both STDIO and Streamable HTTP transports.
-        """
+    success: bool
+    blogs_scanned: int
+    total_new_articles: int
+    results: list
+
+
+# Validators are built once at import and reused by every test
+LIST_BLOGS_RESPONSE = TypeAdapter(ListBlogsResponse)
+LIST_ARTICLES_RESPONSE = TypeAdapter(ListArticlesResponse)
+SCAN_BLOGS_RESPONSE = TypeAdapter(ScanBlogsResponse)
+
+
+@pytest.mark.fast
+@pytest.mark.transport_agnostic
+class TestFeedToolDiscovery:
+    """Test feed tool discovery functionality.
+
+    Tool registration is decided by the server code, not the transport, so
+    these tests run once against an in-process server.
+    """
+
+    async def test_all_feed_tools_discoverable(self, mcp_session, tools_by_name):
+        """Verify all 8 feed tools are registered."""
         session, transport = mcp_session
-        tools_response = await session.list_tools()
 
-        feed_tool_names = [
-            "add_blog", "remove_blog", "list_blogs", "scan_blogs",
-            "list_articles", "mark_article_read", "mark_all_read", "mark_article_unread",
-        ]
+        missing = EXPECTED_TOOL_SET - tools_by_name.keys()
+        assert not missing, (
+            f"Feed tools {sorted(missing)} not found in {sorted(tools_by_name)} (transport: {transport})"
+        )
 
-        for tool in tools_response.tools:
-            if tool.name in feed_tool_names:
-                assert tool.description, (
-                    f"Feed tool {tool.name} missing description (transport: {transport})"
-                )
+    @pytest.mark.parametrize("expected_tool", EXPECTED_TOOLS)
+    async def test_no_kwargs_in_feed_tool_schemas(self, mcp_session, schema_props, expected_tool):
+        """Test that no feed tool has a 'kwargs' parameter (MCP compatibility)."""
+        session, transport = mcp_session
+
+        assert "kwargs" not in schema_props[expected_tool], (
+            f"Feed tool {expected_tool} has kwargs parameter which breaks MCP compatibility (transport: {transport})"
+        )
+
+    @pytest.mark.parametrize("expected_tool", EXPECTED_TOOLS)
+    async def test_feed_tools_have_descriptions(self, mcp_session, tools_by_name, expected_tool):
+        """Test that each feed tool has a description."""
+        session, transport = mcp_session
+
+        assert tools_by_name[expected_tool].description, (
+            f"Feed tool {expected_tool} missing description (transport: {transport})"
+        )
 
 
 class TestListBlogsExecution:
@@ -96,6 +157,9 @@ class TestListBlogsExecution:
     async def test_list_blogs_empty(self, mcp_session):
         """Test list_blogs returns empty list when no blogs exist.
 
+        The class starts on a fresh database, seeds no blog, and mcp_session
+        removes any blog a test adds, so the database is empty here.
+
         This test runs with both STDIO and Streamable HTTP transports.
         """
         session, transport = mcp_session
@@ -103,14 +167,13 @@ class TestListBlogsExecution:
         result = await session.call_tool("list_blogs", {})
 
         assert not result.isError, f"Tool execution failed: {result}"
+        assert result.structuredContent is not None, "Tool result should carry structuredContent"
 
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
+        data = LIST_BLOGS_RESPONSE.validate_python(parse_result(result))
 
         assert data["success"] is True
-        assert "count" in data
-        assert "blogs" in data
-        assert isinstance(data["blogs"], list)
+        assert data["count"] == 0
+        assert data["blogs"] == []
 
 
 class TestAddBlogExecution:
@@ -134,23 +197,22 @@ class TestAddBlogExecution:
         This test runs with both STDIO and Streamable HTTP transports.
         """
         session, transport = mcp_session
-        test_id = unique_id()
+        name, url, feed_url = _blog_urls(unique_id())
 
         result = await session.call_tool("add_blog", {
-            "name": f"Test Blog {test_id}",
-            "url": f"https://example-{test_id}.com/test-feed-url",
-            "feed_url": f"https://example-{test_id}.com/feed.xml",
+            "name": name,
+            "url": url,
+            "feed_url": feed_url,
         })
 
         assert not result.isError, f"Tool execution failed: {result}"
 
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
+        data = parse_result(result)
 
         assert data["success"] is True
         assert "blog" in data
-        assert data["blog"]["name"] == f"Test Blog {test_id}"
-        assert data["blog"]["feed_url"] == f"https://example-{test_id}.com/feed.xml"
+        assert data["blog"]["name"] == name
+        assert data["blog"]["feed_url"] == feed_url
 
     async def test_add_blog_with_scrape_selector(self, mcp_session):
         """Test add_blog with scrape selector instead of feed URL.
@@ -158,89 +220,74 @@ class TestAddBlogExecution:
         This test runs with both STDIO and Streamable HTTP transports.
         """
         session, transport = mcp_session
-        test_id = unique_id()
+        name, url, _ = _blog_urls(unique_id(), "Scrape Blog")
 
         result = await session.call_tool("add_blog", {
-            "name": f"Scrape Blog {test_id}",
-            "url": f"https://example-scrape-{test_id}.com/scrape-test",
+            "name": name,
+            "url": url,
             "scrape_selector": "article.post a",
         })
 
         assert not result.isError, f"Tool execution failed: {result}"
 
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
+        data = parse_result(result)
 
         assert data["success"] is True
         assert data["blog"]["scrape_selector"] == "article.post a"
 
 
-class TestRemoveBlogExecution:
-    """Test remove_blog tool execution."""
-
-    async def test_remove_blog_not_found(self, mcp_session):
-        """Test remove_blog returns error for non-existent blog.
-
-        This test runs with both STDIO and Streamable HTTP transports.
-        """
-        session, transport = mcp_session
-
-        result = await session.call_tool("remove_blog", {
-            "name": "Nonexistent Blog 12345",
-        })
-
-        assert not result.isError, f"Tool should return success=False, not error: {result}"
-
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
-
-        assert data["success"] is False
-        assert "error" in data or "not found" in str(data).lower()
-
-
 class TestBlogLifecycle:
     """Test complete blog lifecycle: add → list → remove."""
 
     async def test_blog_lifecycle(self, mcp_session):
-        """Test adding, listing, and removing a blog.
+        """Test adding, listing, and removing several blogs.
+
+        Adds and removes are independent of each other, so each batch is
+        issued concurrently over the one session.
 
         This test runs with both STDIO and Streamable HTTP transports.
         """
         session, transport = mcp_session
-        test_id = unique_id()
-        blog_name = f"Lifecycle Test Blog {test_id}"
-
-        # Step 1: Add blog
-        add_result = await session.call_tool("add_blog", {
-            "name": blog_name,
-            "url": f"https://lifecycle-test-{test_id}.com",
-            "feed_url": f"https://lifecycle-test-{test_id}.com/feed.xml",
-        })
+        blogs = [_blog_urls(unique_id(), "Lifecycle Test Blog") for _ in range(4)]
+        blog_names = [name for name, _, _ in blogs]
 
-        assert not add_result.isError, f"Add failed: {add_result}"
-        add_data = json.loads(extract_text_content(add_result))
-        assert add_data["success"] is True
+        # Step 1: Add blogs
+        add_results = await asyncio.gather(*[
+            session.call_tool("add_blog", {"name": name, "url": url, "feed_url": feed_url})
+            for name, url, feed_url in blogs
+        ])
 
-        # Step 2: List blogs - should include our blog
+        for add_result in add_results:
+            assert not add_result.isError, f"Add failed: {add_result}"
+            add_data = parse_result(add_result)
+            assert add_data["success"] is True
+
+        # Step 2: List blogs - should include all of ours
         list_result = await session.call_tool("list_blogs", {})
         assert not list_result.isError, f"List failed: {list_result}"
-        list_data = json.loads(extract_text_content(list_result))
+        list_data = parse_result(list_result)
+
+        listed_names = {b["name"] for b in list_data["blogs"]}
+        for name in blog_names:
+            assert name in listed_names, f"Blog not found in list: {sorted(listed_names)}"
 
-        blog_names = [b["name"] for b in list_data["blogs"]]
-        assert blog_name in blog_names, f"Blog not found in list: {blog_names}"
+        # Step 3: Remove blogs
+        remove_results = await asyncio.gather(*[
+            session.call_tool("remove_blog", {"name": name}) for name in blog_names
+        ])
 
-        # Step 3: Remove blog
-        remove_result = await session.call_tool("remove_blog", {"name": blog_name})
-        assert not remove_result.isError, f"Remove failed: {remove_result}"
-        remove_data = json.loads(extract_text_content(remove_result))
-        assert remove_data["success"] is True
+        for remove_result in remove_results:
+            assert not remove_result.isError, f"Remove failed: {remove_result}"
+            remove_data = parse_result(remove_result)
+            assert remove_data["success"] is True
 
-        # Step 4: Verify blog is gone
+        # Step 4: Verify blogs are gone
         verify_result = await session.call_tool("list_blogs", {})
-        verify_data = json.loads(extract_text_content(verify_result))
+        verify_data = parse_result(verify_result)
 
-        remaining_names = [b["name"] for b in verify_data["blogs"]]
-        assert blog_name not in remaining_names, f"Blog still exists after removal: {remaining_names}"
+        remaining_names = {b["name"] for b in verify_data["blogs"]}
+        for name in blog_names:
+            assert name not in remaining_names, f"Blog still exists after removal: {sorted(remaining_names)}"
 
 
 class TestListArticlesExecution:
@@ -257,77 +304,29 @@ class TestListArticlesExecution:
 
         assert not result.isError, f"Tool execution failed: {result}"
 
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
+        data = LIST_ARTICLES_RESPONSE.validate_python(parse_result(result))
 
         assert data["success"] is True
-        assert "count" in data
-        assert "articles" in data
-        assert isinstance(data["articles"], list)
 
-    async def test_list_articles_with_filters(self, mcp_session):
-        """Test list_articles with optional filters.
+    async def test_list_articles_with_filters(self, mcp_session, seeded_blog):
+        """Test list_articles with optional filters, including an existing blog.
 
         This test runs with both STDIO and Streamable HTTP transports.
         """
         session, transport = mcp_session
 
         result = await session.call_tool("list_articles", {
+            "blog_name": seeded_blog["name"],
             "include_read": "true",
             "limit": "10",
         })
 
         assert not result.isError, f"Tool execution failed: {result}"
 
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
+        data = parse_result(result)
 
         assert data["success"] is True
-
-
-class TestMarkArticleReadExecution:
-    """Test mark_article_read tool execution."""
-
-    async def test_mark_article_read_not_found(self, mcp_session):
-        """Test mark_article_read with non-existent article ID.
-
-        This test runs with both STDIO and Streamable HTTP transports.
-        """
-        session, transport = mcp_session
-
-        result = await session.call_tool("mark_article_read", {
-            "article_id": "99999",
-        })
-
-        assert not result.isError, f"Tool should return success=False, not error: {result}"
-
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
-
-        assert data["success"] is False
-        assert "error" in data or "not found" in str(data).lower()
-
-
-class TestMarkArticleUnreadExecution:
-    """Test mark_article_unread tool execution."""
-
-    async def test_mark_article_unread_not_found(self, mcp_session):
-        """Test mark_article_unread with non-existent article ID.
-
-        This test runs with both STDIO and Streamable HTTP transports.
-        """
-        session, transport = mcp_session
-
-        result = await session.call_tool("mark_article_unread", {
-            "article_id": "99999",
-        })
-
-        assert not result.isError, f"Tool should return success=False, not error: {result}"
-
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
-
-        assert data["success"] is False
+        assert data["filters_applied"]["blog_name"] == seeded_blog["name"]
 
 
 class TestMarkAllReadExecution:
@@ -344,30 +343,11 @@ class TestMarkAllReadExecution:
 
         assert not result.isError, f"Tool execution failed: {result}"
 
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
+        data = parse_result(result)
 
         assert data["success"] is True
         assert "articles_marked_read" in data
 
-    async def test_mark_all_read_nonexistent_blog(self, mcp_session):
-        """Test mark_all_read with non-existent blog filter.
-
-        This test runs with both STDIO and Streamable HTTP transports.
-        """
-        session, transport = mcp_session
-
-        result = await session.call_tool("mark_all_read", {
-            "blog_name": "Nonexistent Blog 99999",
-        })
-
-        assert not result.isError, f"Tool should return success=False, not error: {result}"
-
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
-
-        assert data["success"] is False
-
 
 class TestScanBlogsExecution:
     """Test scan_blogs tool execution."""
@@ -383,55 +363,59 @@ class TestScanBlogsExecution:
 
         assert not result.isError, f"Tool execution failed: {result}"
 
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
+        data = SCAN_BLOGS_RESPONSE.validate_python(parse_result(result))
 
         assert data["success"] is True
-        assert "blogs_scanned" in data
-        assert "total_new_articles" in data
 
-    async def test_scan_blogs_nonexistent_blog(self, mcp_session):
-        """Test scan_blogs with non-existent blog name.
+
+class TestMissingEntities:
+    """Test that tools report missing blogs as failures, not MCP errors.
+
+    Missing articles are covered by TestArticleReadStatusLifecycle.
+    """
+
+    @pytest.mark.parametrize("tool_name, payload", [
+        ("remove_blog", {"name": "Nonexistent Blog 12345"}),
+        ("mark_all_read", {"blog_name": "Nonexistent Blog 99999"}),
+        ("scan_blogs", {"blog_name": "Nonexistent Blog 99999"}),
+    ])
+    async def test_tool_returns_success_false_for_missing_entity(self, mcp_session, tool_name, payload):
+        """Test that a tool given a nonexistent blog or article returns success=False.
 
         This test runs with both STDIO and Streamable HTTP transports.
         """
         session, transport = mcp_session
 
-        result = await session.call_tool("scan_blogs", {
-            "blog_name": "Nonexistent Blog 99999",
-        })
+        result = await session.call_tool(tool_name, payload)
 
         assert not result.isError, f"Tool should return success=False, not error: {result}"
 
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
+        data = parse_result(result)
 
         assert data["success"] is False
+        assert "not found" in data["error"]
 
 
 class TestArticleReadStatusLifecycle:
     """Test article read/unread status lifecycle."""
 
-    async def test_article_status_requires_valid_id(self, mcp_session):
-        """Test that article status tools handle invalid IDs gracefully.
+    async def test_mark_article_read_unread_not_found(self, mcp_session):
+        """Test that both article status tools report a nonexistent ID as not found.
 
         This test runs with both STDIO and Streamable HTTP transports.
         """
         session, transport = mcp_session
 
-        # Test mark_article_read with invalid ID
-        read_result = await session.call_tool("mark_article_read", {
-            "article_id": "999999",
-        })
-        read_data = json.loads(extract_text_content(read_result))
-        assert read_data["success"] is False
+        results = await asyncio.gather(
+            session.call_tool("mark_article_read", {"article_id": "999999"}),
+            session.call_tool("mark_article_unread", {"article_id": "999999"}),
+        )
 
-        # Test mark_article_unread with invalid ID
-        unread_result = await session.call_tool("mark_article_unread", {
-            "article_id": "999999",
-        })
-        unread_data = json.loads(extract_text_content(unread_result))
-        assert unread_data["success"] is False
+        for result in results:
+            assert not result.isError, f"Tool should return success=False, not error: {result}"
+            data = parse_result(result)
+            assert data["success"] is False
+            assert "not found" in data["error"]
 
 
 class TestParameterConversion:
@@ -452,8 +436,7 @@ class TestParameterConversion:
 
         assert not result.isError, f"Tool execution failed: {result}"
 
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
+        data = parse_result(result)
 
         assert data["success"] is True
 
@@ -476,104 +459,38 @@ class TestParameterConversion:
 class TestListArticlesDateFiltering:
     """Test list_articles date filtering parameters."""
 
-    async def test_list_articles_with_days_parameter(self, mcp_session):
-        """Test list_articles with days parameter for recent articles.
-
-        This test runs with both STDIO and Streamable HTTP transports.
-        """
-        session, transport = mcp_session
-
-        result = await session.call_tool("list_articles", {
-            "days": "7",
-        })
-
-        assert not result.isError, f"Tool execution failed: {result}"
-
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
-
-        assert data["success"] is True
-        assert "filters_applied" in data
-        assert data["filters_applied"]["days"] == 7
-
-    async def test_list_articles_with_since_parameter(self, mcp_session):
-        """Test list_articles with since parameter for date range.
-
-        This test runs with both STDIO and Streamable HTTP transports.
-        """
-        session, transport = mcp_session
-
-        result = await session.call_tool("list_articles", {
-            "since": "2025-01-01",
-        })
-
-        assert not result.isError, f"Tool execution failed: {result}"
-
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
-
-        assert data["success"] is True
-        assert "filters_applied" in data
-        assert data["filters_applied"]["since"] == "2025-01-01"
-
-    async def test_list_articles_with_before_parameter(self, mcp_session):
-        """Test list_articles with before parameter for date range.
-
-        This test runs with both STDIO and Streamable HTTP transports.
-        """
-        session, transport = mcp_session
-
-        result = await session.call_tool("list_articles", {
-            "before": "2025-12-31",
-        })
-
-        assert not result.isError, f"Tool execution failed: {result}"
-
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
-
-        assert data["success"] is True
-        assert "filters_applied" in data
-        assert data["filters_applied"]["before"] == "2025-12-31"
-
-    async def test_list_articles_with_date_range(self, mcp_session):
-        """Test list_articles with both since and before for a date range.
-
-        This test runs with both STDIO and Streamable HTTP transports.
-        """
-        session, transport = mcp_session
-
-        result = await session.call_tool("list_articles", {
-            "since": "2025-01-01",
-            "before": "2025-06-30",
-        })
-
-        assert not result.isError, f"Tool execution failed: {result}"
-
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
-
-        assert data["success"] is True
-        assert data["filters_applied"]["since"] == "2025-01-01"
-        assert data["filters_applied"]["before"] == "2025-06-30"
-
-    async def test_list_articles_with_datetime_format(self, mcp_session):
-        """Test list_articles accepts full ISO datetime format.
+    @pytest.mark.parametrize("args, expected_filters", [
+        pytest.param({"days": "7"}, {"days": 7}, id="days"),
+        pytest.param({"since": "2025-01-01"}, {"since": "2025-01-01"}, id="since"),
+        pytest.param({"before": "2025-12-31"}, {"before": "2025-12-31"}, id="before"),
+        pytest.param(
+            {"since": "2025-01-01", "before": "2025-06-30"},
+            {"since": "2025-01-01", "before": "2025-06-30"},
+            id="date-range",
+        ),
+        pytest.param({"since": "2025-01-01T00:00:00"}, {}, id="iso-datetime"),
+        pytest.param(
+            {"days": "30", "include_read": "true", "limit": "10"},
+            {"days": 30, "include_read": True, "limit": 10},
+            id="combined",
+        ),
+    ])
+    async def test_list_articles_date_filters(self, mcp_session, args, expected_filters):
+        """Test list_articles accepts each date filter and reports it in filters_applied.
 
         This test runs with both STDIO and Streamable HTTP transports.
         """
         session, transport = mcp_session
 
-        result = await session.call_tool("list_articles", {
-            "since": "2025-01-01T00:00:00",
-        })
+        result = await session.call_tool("list_articles", args)
 
         assert not result.isError, f"Tool execution failed: {result}"
 
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
+        data = parse_as(result, ListArticlesResult)
 
-        assert data["success"] is True
+        assert data.success is True
+        for key, value in expected_filters.items():
+            assert data.filters_applied[key] == value
 
     async def test_list_articles_invalid_date_format(self, mcp_session):
         """Test list_articles returns error for invalid date format.
@@ -588,35 +505,10 @@ class TestListArticlesDateFiltering:
 
         assert not result.isError, f"Tool should return success=False, not MCP error: {result}"
 
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
+        data = parse_as(result, ListArticlesResult)
 
-        assert data["success"] is False
-        assert "error" in data
-        assert "Invalid" in data["error"]
-
-    async def test_list_articles_combined_filters(self, mcp_session):
-        """Test list_articles with date filtering combined with other filters.
-
-        This test runs with both STDIO and Streamable HTTP transports.
-        """
-        session, transport = mcp_session
-
-        result = await session.call_tool("list_articles", {
-            "days": "30",
-            "include_read": "true",
-            "limit": "10",
-        })
-
-        assert not result.isError, f"Tool execution failed: {result}"
-
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
-
-        assert data["success"] is True
-        assert data["filters_applied"]["days"] == 30
-        assert data["filters_applied"]["include_read"] is True
-        assert data["filters_applied"]["limit"] == 10
+        assert data.success is False
+        assert "Invalid" in data.error
 
 
 # Test runner for direct execution
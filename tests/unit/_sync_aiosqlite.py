@@ -0,0 +1,95 @@
+"""Synchronous stand-in for an aiosqlite connection.
+
+aiosqlite runs every call on a worker thread and hands the result back to
+the event loop. Unit tests are single-threaded and only need the storage
+functions' SQL to run, so this adapter calls sqlite3 directly behind the
+same awaitable interface and skips the thread hop.
+
+Only the parts of the aiosqlite API used by feed_reader.storage are
+provided.
+"""
+
+import sqlite3
+from typing import Any, Iterable, List, Optional
+
+
+class SyncCursor:
+    """Awaitable wrapper around a sqlite3 cursor."""
+
+    def __init__(self, cursor: sqlite3.Cursor):
+        self._cursor = cursor
+
+    @property
+    def row_factory(self) -> Any:
+        return self._cursor.row_factory
+
+    @row_factory.setter
+    def row_factory(self, factory: Any) -> None:
+        self._cursor.row_factory = factory
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self) -> Optional[int]:
+        return self._cursor.lastrowid
+
+    async def fetchone(self) -> Optional[sqlite3.Row]:
+        return self._cursor.fetchone()
+
+    async def fetchall(self) -> List[sqlite3.Row]:
+        return self._cursor.fetchall()
+
+    async def close(self) -> None:
+        self._cursor.close()
+
+
+class SyncConnection:
+    """Awaitable wrapper around a sqlite3 connection.
+
+    sqlite3 keeps compiled statements in an LRU cache keyed on the SQL text,
+    so a statement the tests run repeatedly is only parsed once as long as
+    it's always issued with the same string and its values bound as
+    parameters.
+
+    Args:
+        database: Database path, ``:memory:`` by default
+        cached_statements: Number of compiled statements to keep
+    """
+
+    def __init__(self, database: str = ":memory:", cached_statements: int = 256):
+        self._conn = sqlite3.connect(database, cached_statements=cached_statements)
+
+    @property
+    def row_factory(self) -> Any:
+        return self._conn.row_factory
+
+    @row_factory.setter
+    def row_factory(self, factory: Any) -> None:
+        self._conn.row_factory = factory
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._conn.in_transaction
+
+    async def execute(self, sql: str, parameters: Iterable[Any] = ()) -> SyncCursor:
+        return SyncCursor(self._conn.execute(sql, parameters))
+
+    async def executemany(self, sql: str, parameters: Iterable[Iterable[Any]]) -> SyncCursor:
+        return SyncCursor(self._conn.executemany(sql, parameters))
+
+    async def executescript(self, sql_script: str) -> SyncCursor:
+        return SyncCursor(self._conn.executescript(sql_script))
+
+    async def execute_fetchall(self, sql: str, parameters: Iterable[Any] = ()) -> List[sqlite3.Row]:
+        return self._conn.execute(sql, parameters).fetchall()
+
+    async def commit(self) -> None:
+        self._conn.commit()
+
+    async def rollback(self) -> None:
+        self._conn.rollback()
+
+    async def close(self) -> None:
+        self._conn.close()
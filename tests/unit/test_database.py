@@ -1,19 +1,39 @@
 """Unit tests for database operations.
 
 Tests for the storage layer using in-memory SQLite.
+
+Most tests share one module-scoped database and are grouped so pytest-xdist
+keeps them on one worker; tests that need a database of their own use
+fresh_db and are free to run anywhere:
+
+    python -m pytest tests -n auto --dist loadgroup
+
+The same invocation covers the integration tests, whose classes are
+grouped the same way.
 """
 
+import json
 import pytest
 import aiosqlite
 from datetime import datetime, timedelta
+from typing import List
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch, AsyncMock
 
 from feed_reader.storage.database import (
+    list_article_rows,
+    _apply_pragmas,
+    _blog_cache,
+    _to_timestamp,
     init_database,
+    get_database,
+    get_reader,
+    close_database,
     add_blog,
     remove_blog,
     get_blog_by_name,
+    get_all_blogs,
     list_blogs,
     add_articles,
     get_existing_article_urls,
@@ -25,25 +45,179 @@ from feed_reader.storage.database import (
 )
 from feed_reader.models.schemas import Blog, Article
 
+from ._sync_aiosqlite import SyncConnection
 
-# Mark all tests as async
-pytestmark = pytest.mark.anyio
 
+# Mark all tests as async, on the worker that owns the shared database
+pytestmark = [pytest.mark.anyio, pytest.mark.xdist_group("shared_db")]
 
-@pytest.fixture
-async def in_memory_db():
-    """Create an in-memory database for testing."""
-    db = await aiosqlite.connect(":memory:")
+
+# Durability and locking settings nothing in these tests depends on. The
+# connection is private to the module, so it holds its lock exclusively.
+_TEST_PRAGMAS = (
+    "PRAGMA journal_mode = MEMORY",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA locking_mode = EXCLUSIVE",
+)
+
+
+@pytest.fixture(scope="module")
+def anyio_backend():
+    """Run the module on one event loop so the shared connection can span tests."""
+    return "asyncio"
+
+
+async def _open_test_db() -> SyncConnection:
+    """Open an in-memory database with the test pragmas and schema applied.
+
+    Statements run synchronously through SyncConnection rather than on an
+    aiosqlite worker thread; tests of aiosqlite-specific behaviour open a
+    real connection of their own.
+    """
+    db = SyncConnection(":memory:")
     db.row_factory = aiosqlite.Row
+    await _apply_pragmas(db, in_memory=True)
+    for pragma in _TEST_PRAGMAS:
+        await db.execute(pragma)
     await init_database(db)
+    return db
+
+
+def _route_storage_to(monkeypatch: pytest.MonkeyPatch, db) -> None:
+    """Point the storage module's get_database and get_reader at db."""
+    monkeypatch.setattr("feed_reader.storage.database.get_database", AsyncMock(return_value=db))
+    monkeypatch.setattr("feed_reader.storage.database.get_reader", AsyncMock(return_value=db))
+
+
+@pytest.fixture(scope="module")
+async def _db():
+    """Open the in-memory database once per module and route the storage layer to it.
+
+    The patch stays in place for the rest of the module; on_disk_db and
+    fresh_db override it for the tests that use them.
+    """
+    db = await _open_test_db()
+    monkeypatch = pytest.MonkeyPatch()
+    _route_storage_to(monkeypatch, db)
+
+    yield db
+
+    monkeypatch.undo()
+    await db.close()
+
+
+@pytest.fixture
+async def in_memory_db(_db):
+    """Provide the shared in-memory database, emptied again after each test.
 
-    # Patch get_database to return our in-memory connection
-    with patch("feed_reader.storage.database.get_database", AsyncMock(return_value=db)):
+    The storage functions commit their own writes, so a per-test savepoint
+    couldn't roll them back; the rows are deleted instead. Without
+    AUTOINCREMENT, ids start from 1 again once the tables are empty.
+    """
+    yield _db
+
+    _blog_cache.clear()
+    await _db.execute("DELETE FROM articles")
+    await _db.execute("DELETE FROM blogs")
+    await _db.commit()
+
+
+@pytest.fixture
+async def fresh_db():
+    """Provide a new in-memory database for a test that can't share one.
+
+    Use this for tests that change the schema itself; mark them with their
+    own xdist_group so they aren't tied to the shared database's worker.
+    """
+    db = await _open_test_db()
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        _route_storage_to(monkeypatch, db)
         yield db
 
+    _blog_cache.clear()
     await db.close()
 
 
+@pytest.fixture
+def on_disk_db(tmp_path, monkeypatch):
+    """Point the real database singleton at a file under tmp_path.
+
+    The test must call close_database when it's done.
+    """
+    monkeypatch.setenv("FEED_READER_DB_PATH", str(tmp_path / "feed_reader.db"))
+    # Undo the shared in-memory routing if an earlier test set it up
+    monkeypatch.setattr("feed_reader.storage.database.get_database", get_database)
+    monkeypatch.setattr("feed_reader.storage.database.get_reader", get_reader)
+
+
+@pytest.fixture
+async def default_blog(in_memory_db) -> Blog:
+    """Add the "Test Blog" most tests only need to exist."""
+    return await add_blog(name="Test Blog", url="https://example.com")
+
+
+@pytest.fixture(scope="module")
+def dates() -> SimpleNamespace:
+    """Reference datetimes for the date filtering tests, computed once per module."""
+    now = datetime.now()
+    return SimpleNamespace(
+        now=now,
+        recent=now - timedelta(days=2),
+        week_ago=now - timedelta(days=7),
+        middle=now - timedelta(days=15),
+        old=now - timedelta(days=30),
+        very_old=now - timedelta(days=60),
+    )
+
+
+async def _mark_read(db, *urls: str) -> None:
+    """Mark articles read by URL with a single UPDATE.
+
+    The update is left uncommitted: the storage functions read through the
+    same connection in these tests, so they already see it, and the next
+    commit (at the latest the fixture teardown) ends the transaction.
+
+    Args:
+        db: Database connection
+        urls: URLs of the articles to mark
+    """
+    await db.execute(
+        "UPDATE articles SET is_read = 1 WHERE url IN (SELECT value FROM json_each(?))",
+        (json.dumps(urls),),
+    )
+
+
+async def _seed(db, rows) -> List[int]:
+    """Insert articles directly, without add_articles, in a single executemany.
+
+    Use this for setup; call add_articles only when testing it.
+
+    Args:
+        db: Database connection
+        rows: (blog_id, title, url, is_read, published_date) tuples, where
+            published_date is a datetime or None
+
+    Returns:
+        The new article ids, in the order of rows
+    """
+    await db.executemany(
+        "INSERT INTO articles (blog_id, title, url, is_read, published_date) VALUES (?, ?, ?, ?, ?)",
+        [
+            (blog_id, title, url, int(is_read), _to_timestamp(published_date))
+            for blog_id, title, url, is_read, published_date in rows
+        ],
+    )
+    await db.commit()
+
+    # Article URLs are unique, so they map the new ids back to rows
+    urls = [url for _, _, url, _, _ in rows]
+    ids = dict(await db.execute_fetchall(
+        "SELECT url, id FROM articles WHERE url IN (SELECT value FROM json_each(?))",
+        (json.dumps(urls),),
+    ))
+    return [ids[url] for url in urls]
+
+
 class TestDatabaseInitialization:
     """Tests for database schema initialization."""
 
@@ -65,62 +239,161 @@ class TestDatabaseInitialization:
         indexes = [row[0] for row in await cursor.fetchall()]
 
         assert "idx_articles_blog_id" in indexes
-        assert "idx_articles_is_read" in indexes
-
-    async def test_init_is_idempotent(self, in_memory_db):
+        assert "idx_articles_listing" in indexes
+        assert "idx_articles_is_read" not in indexes
+
+    async def test_get_database_applies_pragmas(self, on_disk_db):
+        """Test that the singleton connection is opened in WAL mode with foreign keys on."""
+        db = await get_database()
+        try:
+            cursor = await db.execute("PRAGMA journal_mode")
+            assert (await cursor.fetchone())[0] == "wal"
+
+            cursor = await db.execute("PRAGMA foreign_keys")
+            assert (await cursor.fetchone())[0] == 1
+        finally:
+            await close_database()
+
+    async def test_concurrent_first_open_sees_schema(self, on_disk_db):
+        """Test that callers racing to open the database all get one initialized connection."""
+        import asyncio
+
+        async def open_and_query():
+            # Readers are separate connections, so they only see committed schema
+            reader = await get_reader()
+            cursor = await reader.execute("SELECT COUNT(*) FROM blogs")
+            assert (await cursor.fetchone())[0] == 0
+            return await get_database()
+
+        try:
+            writers = await asyncio.gather(*[open_and_query() for _ in range(4)])
+            assert all(writer is writers[0] for writer in writers)
+        finally:
+            await close_database()
+
+    async def test_listing_query_avoids_sort(self, in_memory_db):
+        """Test that a blog's unread listing is served by idx_articles_listing without sorting."""
+        cursor = await in_memory_db.execute("""
+            EXPLAIN QUERY PLAN
+            SELECT a.* FROM articles a JOIN blogs b ON a.blog_id = b.id
+            WHERE b.name = ? AND a.is_read = 0
+            ORDER BY COALESCE(a.published_date, a.discovered_date) DESC, a.id DESC LIMIT 50
+        """, ("Test Blog",))
+        plan = " ".join(row[3] for row in await cursor.fetchall())
+
+        assert "idx_articles_listing" in plan
+        assert "TEMP B-TREE" not in plan
+
+    async def test_init_migrates_text_dates(self):
+        """Test that ISO 8601 dates from older databases become Unix seconds."""
+        db = await aiosqlite.connect(":memory:")
+        db.row_factory = aiosqlite.Row
+        try:
+            await db.execute("CREATE TABLE blogs (id INTEGER PRIMARY KEY, name TEXT, url TEXT, feed_url TEXT, scrape_selector TEXT, last_scanned TIMESTAMP)")
+            await db.execute("CREATE TABLE articles (id INTEGER PRIMARY KEY, blog_id INTEGER, title TEXT, url TEXT, published_date TIMESTAMP, discovered_date TIMESTAMP, is_read BOOLEAN)")
+            # last_scanned was written as naive local time
+            await db.execute(
+                "INSERT INTO blogs (id, name, url, last_scanned) VALUES (1, 'Old Blog', 'https://example.com', '2024-01-16T08:00:00.123456')"
+            )
+            await db.execute(
+                "INSERT INTO articles VALUES (1, 1, 'Old Post', 'https://example.com/1', '2024-01-15T10:30:00+00:00', '2024-01-16 08:00:00', 0)"
+            )
+
+            await init_database(db)
+
+            cursor = await db.execute("SELECT published_date, discovered_date FROM articles")
+            row = await cursor.fetchone()
+            assert row["published_date"] == 1705314600
+            assert row["discovered_date"] == 1705392000
+
+            cursor = await db.execute("SELECT last_scanned FROM blogs")
+            row = await cursor.fetchone()
+            assert row["last_scanned"] == int(datetime(2024, 1, 16, 8).timestamp())
+        finally:
+            await db.close()
+
+    async def test_get_reader_is_read_only(self, on_disk_db):
+        """Test that reader connections see committed writes but can't write."""
+        try:
+            await add_blog(name="Test Blog", url="https://example.com")
+
+            reader = await get_reader()
+            assert reader is not await get_database()
+
+            cursor = await reader.execute("SELECT name FROM blogs")
+            assert [row["name"] for row in await cursor.fetchall()] == ["Test Blog"]
+
+            with pytest.raises(aiosqlite.OperationalError):
+                await reader.execute("DELETE FROM blogs")
+        finally:
+            await close_database()
+
+    @pytest.mark.xdist_group("fresh_db")
+    async def test_init_is_idempotent(self, fresh_db):
         """Test that calling init multiple times doesn't cause errors."""
         # Should not raise
-        await init_database(in_memory_db)
-        await init_database(in_memory_db)
+        await init_database(fresh_db)
+        await init_database(fresh_db)
 
 
 class TestBlogOperations:
     """Tests for blog CRUD operations."""
 
-    async def test_add_blog_minimal(self, in_memory_db):
-        """Test adding a blog with minimal required fields."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"feed_url": "https://example.com/feed.xml"},
+            {"scrape_selector": "article.post a"},
+        ],
+        ids=["minimal", "feed_url", "scrape_selector"],
+    )
+    async def test_add_blog_optional_fields(self, in_memory_db, kwargs):
+        """Test adding a blog with and without its optional fields."""
+        blog = await add_blog(name="Test Blog", url="https://example.com", **kwargs)
 
         assert blog.id is not None
         assert blog.name == "Test Blog"
         assert blog.url == "https://example.com"
-        assert blog.feed_url is None
-        assert blog.scrape_selector is None
+        assert blog.feed_url == kwargs.get("feed_url")
+        assert blog.scrape_selector == kwargs.get("scrape_selector")
         assert blog.last_scanned is None
 
-    async def test_add_blog_with_feed_url(self, in_memory_db):
-        """Test adding a blog with feed URL."""
-        blog = await add_blog(
-            name="Test Blog",
-            url="https://example.com",
-            feed_url="https://example.com/feed.xml",
-        )
+    @pytest.mark.parametrize(
+        "name, url",
+        [
+            ("Test Blog", "https://other.com"),
+            ("Blog Two", "https://example.com"),
+        ],
+        ids=["duplicate_name", "duplicate_url"],
+    )
+    async def test_add_blog_duplicate_raises(self, default_blog, name, url):
+        """Test that a duplicate blog name or URL raises ValueError."""
+        with pytest.raises(ValueError, match="already exists"):
+            await add_blog(name=name, url=url)
 
-        assert blog.feed_url == "https://example.com/feed.xml"
+    async def test_add_blog_alongside_concurrent_commit(self, on_disk_db):
+        """Test that another caller's commit can't land while add_blog's RETURNING is open.
 
-    async def test_add_blog_with_scrape_selector(self, in_memory_db):
-        """Test adding a blog with scrape selector."""
-        blog = await add_blog(
-            name="Test Blog",
-            url="https://example.com",
-            scrape_selector="article.post a",
-        )
+        Runs on disk because the interleaving only exists on aiosqlite's
+        worker thread queue.
+        """
+        import asyncio
 
-        assert blog.scrape_selector == "article.post a"
+        try:
+            blog = await add_blog(name="Blog One", url="https://example.com")
 
-    async def test_add_blog_duplicate_name_raises(self, in_memory_db):
-        """Test that duplicate blog names raise ValueError."""
-        await add_blog(name="Test Blog", url="https://example.com")
+            # update_last_scanned is scheduled first, so its commit is queued
+            # between add_blog's INSERT and the fetch of its returned id
+            await asyncio.gather(
+                update_last_scanned(blog.id),
+                add_blog(name="Blog Two", url="https://other.com"),
+            )
 
-        with pytest.raises(ValueError, match="already exists"):
-            await add_blog(name="Test Blog", url="https://other.com")
-
-    async def test_add_blog_duplicate_url_raises(self, in_memory_db):
-        """Test that duplicate URLs raise ValueError."""
-        await add_blog(name="Blog One", url="https://example.com")
-
-        with pytest.raises(ValueError, match="already exists"):
-            await add_blog(name="Blog Two", url="https://example.com")
+            assert (await get_blog_by_name("Blog Two")).id is not None
+        finally:
+            _blog_cache.clear()
+            await close_database()
 
     async def test_get_blog_by_name_found(self, in_memory_db):
         """Test retrieving an existing blog by name."""
@@ -138,19 +411,52 @@ class TestBlogOperations:
 
         assert blog is None
 
+    async def test_get_blog_by_name_is_cached(self, in_memory_db):
+        """Test that repeated lookups skip the database and removal invalidates the cache."""
+        await add_blog(name="Test Blog", url="https://example.com")
+        _blog_cache.clear()
+
+        first = await get_blog_by_name("Test Blog")
+        with patch.object(in_memory_db, "execute", AsyncMock(side_effect=AssertionError("queried"))):
+            assert await get_blog_by_name("Test Blog") == first
+
+        await remove_blog("Test Blog")
+        assert await get_blog_by_name("Test Blog") is None
+
+    async def test_get_blog_by_name_returns_copies(self, default_blog):
+        """Test that callers never share the cached Blog instance."""
+        first = await get_blog_by_name("Test Blog")
+        first.url = "https://changed.com"
+
+        await update_last_scanned(default_blog.id)
+
+        assert first.last_scanned is None
+        second = await get_blog_by_name("Test Blog")
+        assert second.url == "https://example.com"
+        assert second.last_scanned is not None
+
+    async def test_get_all_blogs(self, in_memory_db):
+        """Test getting every blog as Blog objects, ordered by name."""
+        await add_blog(name="Zeta", url="https://zeta.com", feed_url="https://zeta.com/feed")
+        await add_blog(name="Alpha", url="https://alpha.com")
+
+        blogs = await get_all_blogs()
+
+        assert [b.name for b in blogs] == ["Alpha", "Zeta"]
+        assert all(isinstance(b, Blog) for b in blogs)
+        assert blogs[1].feed_url == "https://zeta.com/feed"
+
     async def test_list_blogs_empty(self, in_memory_db):
         """Test listing blogs when none exist."""
         blogs = await list_blogs()
 
         assert blogs == []
 
-    async def test_list_blogs_with_counts(self, in_memory_db):
+    async def test_list_blogs_with_counts(self, in_memory_db, default_blog):
         """Test listing blogs includes article counts."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
-
         # Add some articles
         await add_articles(
-            blog.id,
+            default_blog.id,
             [
                 {"title": "Post 1", "url": "https://example.com/1"},
                 {"title": "Post 2", "url": "https://example.com/2"},
@@ -158,11 +464,7 @@ class TestBlogOperations:
         )
 
         # Mark one as read
-        await in_memory_db.execute(
-            "UPDATE articles SET is_read = 1 WHERE url = ?",
-            ("https://example.com/1",),
-        )
-        await in_memory_db.commit()
+        await _mark_read(in_memory_db, "https://example.com/1")
 
         blogs = await list_blogs()
 
@@ -171,11 +473,10 @@ class TestBlogOperations:
         assert blogs[0]["total_articles"] == 2
         assert blogs[0]["unread_articles"] == 1
 
-    async def test_remove_blog_success(self, in_memory_db):
+    async def test_remove_blog_success(self, in_memory_db, default_blog):
         """Test removing an existing blog."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
         await add_articles(
-            blog.id,
+            default_blog.id,
             [
                 {"title": "Post 1", "url": "https://example.com/1"},
                 {"title": "Post 2", "url": "https://example.com/2"},
@@ -187,8 +488,10 @@ class TestBlogOperations:
         assert success is True
         assert article_count == 2
 
-        # Verify blog is gone
+        # Verify blog is gone and its articles were cascaded
         assert await get_blog_by_name("Test Blog") is None
+        cursor = await in_memory_db.execute("SELECT COUNT(*) FROM articles")
+        assert (await cursor.fetchone())[0] == 0
 
     async def test_remove_blog_not_found(self, in_memory_db):
         """Test removing a non-existent blog."""
@@ -201,12 +504,40 @@ class TestBlogOperations:
 class TestArticleOperations:
     """Tests for article CRUD operations."""
 
-    async def test_add_articles(self, in_memory_db):
-        """Test adding articles to a blog."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
+    async def test_add_articles_for_removed_blog(self, in_memory_db, default_blog):
+        """Test that a blog removed behind the cache is reported and evicted."""
+        assert await get_blog_by_name("Test Blog") is not None
+
+        # As if another process sharing the database file removed it
+        await in_memory_db.execute("DELETE FROM blogs WHERE id = ?", (default_blog.id,))
+        await in_memory_db.commit()
+
+        with pytest.raises(ValueError, match="not found"):
+            await add_articles(default_blog.id, [{"title": "Post 1", "url": "https://example.com/1"}])
+
+        assert await get_blog_by_name("Test Blog") is None
+
+    async def test_add_articles_for_removed_blog_keeps_concurrent_rows(self, in_memory_db, default_blog):
+        """Test that a removed blog's failed insert doesn't discard another scan's rows."""
+        other = await add_blog(name="Other Blog", url="https://other.com")
+
+        # Another scan's rows, queued on the shared writer but not yet committed
+        await in_memory_db.execute(
+            "INSERT INTO articles (blog_id, title, url) VALUES (?, ?, ?)",
+            (other.id, "Other Post", "https://other.com/1"),
+        )
+        await in_memory_db.execute("DELETE FROM blogs WHERE id = ?", (default_blog.id,))
+
+        with pytest.raises(ValueError, match="not found"):
+            await add_articles(default_blog.id, [{"title": "Post 1", "url": "https://example.com/1"}])
+
+        await in_memory_db.commit()
+        assert [a.title for a in await list_articles(blog_name="Other Blog")] == ["Other Post"]
 
+    async def test_add_articles(self, default_blog):
+        """Test adding articles to a blog."""
         count = await add_articles(
-            blog.id,
+            default_blog.id,
             [
                 {"title": "Post 1", "url": "https://example.com/1"},
                 {"title": "Post 2", "url": "https://example.com/2"},
@@ -215,12 +546,10 @@ class TestArticleOperations:
 
         assert count == 2
 
-    async def test_add_articles_with_dates(self, in_memory_db):
+    async def test_add_articles_with_dates(self, default_blog):
         """Test adding articles with published dates."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
-
         count = await add_articles(
-            blog.id,
+            default_blog.id,
             [
                 {
                     "title": "Post 1",
@@ -235,19 +564,14 @@ class TestArticleOperations:
         articles = await list_articles(include_read=True)
         assert articles[0].published_date is not None
 
-    async def test_add_articles_skips_duplicates(self, in_memory_db):
+    async def test_add_articles_skips_duplicates(self, in_memory_db, default_blog):
         """Test that duplicate URLs are skipped."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
-
-        # Add first batch
-        await add_articles(
-            blog.id,
-            [{"title": "Post 1", "url": "https://example.com/1"}],
-        )
+        # Existing article
+        await _seed(in_memory_db, [(default_blog.id, "Post 1", "https://example.com/1", False, None)])
 
         # Add second batch with duplicate
         count = await add_articles(
-            blog.id,
+            default_blog.id,
             [
                 {"title": "Post 1 Again", "url": "https://example.com/1"},
                 {"title": "Post 2", "url": "https://example.com/2"},
@@ -256,11 +580,23 @@ class TestArticleOperations:
 
         assert count == 1  # Only new one added
 
-    async def test_get_existing_article_urls(self, in_memory_db):
+    async def test_add_articles_skips_duplicates_within_batch(self, default_blog):
+        """Test that a URL repeated within one batch is only added once."""
+        count = await add_articles(
+            default_blog.id,
+            [
+                {"title": "Post 1", "url": "https://example.com/1"},
+                {"title": "Post 1 Again", "url": "https://example.com/1"},
+            ],
+        )
+
+        assert count == 1
+        assert await add_articles(default_blog.id, []) == 0
+
+    async def test_get_existing_article_urls(self, default_blog):
         """Test checking for existing article URLs."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
         await add_articles(
-            blog.id,
+            default_blog.id,
             [
                 {"title": "Post 1", "url": "https://example.com/1"},
                 {"title": "Post 2", "url": "https://example.com/2"},
@@ -268,7 +604,7 @@ class TestArticleOperations:
         )
 
         existing = await get_existing_article_urls(
-            blog.id,
+            default_blog.id,
             [
                 "https://example.com/1",  # exists
                 "https://example.com/3",  # doesn't exist
@@ -277,19 +613,27 @@ class TestArticleOperations:
 
         assert existing == {"https://example.com/1"}
 
-    async def test_get_existing_article_urls_empty(self, in_memory_db):
-        """Test checking for existing URLs with empty list."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
+    async def test_get_existing_article_urls_many(self, default_blog):
+        """Test checking more URLs than older SQLite builds allow as bound parameters."""
+        await add_articles(default_blog.id, [{"title": "Post 1", "url": "https://example.com/1"}])
+
+        urls = [f"https://example.com/{i}" for i in range(40000)]
+        existing = await get_existing_article_urls(default_blog.id, urls)
 
-        existing = await get_existing_article_urls(blog.id, [])
+        assert existing == {"https://example.com/1"}
+
+    async def test_get_existing_article_urls_empty(self, default_blog):
+        """Test that an empty list returns without touching the database."""
+        with patch("feed_reader.storage.database.get_reader", AsyncMock()) as get_reader:
+            existing = await get_existing_article_urls(default_blog.id, [])
 
         assert existing == set()
+        get_reader.assert_not_awaited()
 
-    async def test_list_articles_default(self, in_memory_db):
+    async def test_list_articles_default(self, in_memory_db, default_blog):
         """Test listing unread articles by default."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
         await add_articles(
-            blog.id,
+            default_blog.id,
             [
                 {"title": "Post 1", "url": "https://example.com/1"},
                 {"title": "Post 2", "url": "https://example.com/2"},
@@ -297,22 +641,17 @@ class TestArticleOperations:
         )
 
         # Mark one as read
-        await in_memory_db.execute(
-            "UPDATE articles SET is_read = 1 WHERE url = ?",
-            ("https://example.com/1",),
-        )
-        await in_memory_db.commit()
+        await _mark_read(in_memory_db, "https://example.com/1")
 
         articles = await list_articles()
 
         assert len(articles) == 1
         assert articles[0].url == "https://example.com/2"
 
-    async def test_list_articles_include_read(self, in_memory_db):
+    async def test_list_articles_include_read(self, in_memory_db, default_blog):
         """Test listing all articles including read ones."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
         await add_articles(
-            blog.id,
+            default_blog.id,
             [
                 {"title": "Post 1", "url": "https://example.com/1"},
                 {"title": "Post 2", "url": "https://example.com/2"},
@@ -320,11 +659,7 @@ class TestArticleOperations:
         )
 
         # Mark one as read
-        await in_memory_db.execute(
-            "UPDATE articles SET is_read = 1 WHERE url = ?",
-            ("https://example.com/1",),
-        )
-        await in_memory_db.commit()
+        await _mark_read(in_memory_db, "https://example.com/1")
 
         articles = await list_articles(include_read=True)
 
@@ -335,19 +670,20 @@ class TestArticleOperations:
         blog1 = await add_blog(name="Blog One", url="https://one.com")
         blog2 = await add_blog(name="Blog Two", url="https://two.com")
 
-        await add_articles(blog1.id, [{"title": "Post 1", "url": "https://one.com/1"}])
-        await add_articles(blog2.id, [{"title": "Post 2", "url": "https://two.com/1"}])
+        await _seed(in_memory_db, [
+            (blog1.id, "Post 1", "https://one.com/1", False, None),
+            (blog2.id, "Post 2", "https://two.com/1", False, None),
+        ])
 
         articles = await list_articles(blog_name="Blog One")
 
         assert len(articles) == 1
         assert articles[0].url == "https://one.com/1"
 
-    async def test_list_articles_limit(self, in_memory_db):
+    async def test_list_articles_limit(self, default_blog):
         """Test limiting the number of articles returned."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
         await add_articles(
-            blog.id,
+            default_blog.id,
             [
                 {"title": f"Post {i}", "url": f"https://example.com/{i}"}
                 for i in range(10)
@@ -359,21 +695,66 @@ class TestArticleOperations:
         assert len(articles) == 3
 
 
-class TestArticleReadStatus:
-    """Tests for marking articles as read/unread."""
+    async def test_list_article_rows_formats_dates_as_utc(self, default_blog):
+        """Test that row dates are UTC ISO 8601 strings with an explicit offset."""
+        await add_articles(
+            default_blog.id,
+            [
+                {"title": "Naive", "url": "https://example.com/1", "published_date": "2024-01-15T10:30:00"},
+                {"title": "Offset", "url": "https://example.com/2", "published_date": "2024-01-14T10:30:00-05:00"},
+            ],
+        )
 
-    async def test_mark_article_read(self, in_memory_db):
-        """Test marking an article as read."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
+        rows = await list_article_rows(include_read=True)
+
+        assert [row["published_date"] for row in rows] == [
+            "2024-01-15T10:30:00+00:00",
+            "2024-01-14T15:30:00+00:00",
+        ]
+        assert rows[0]["discovered_date"].endswith("+00:00")
+
+    async def test_list_article_rows_matches_list_articles(self, default_blog):
+        """Test that raw rows carry the same values with ISO date strings."""
         await add_articles(
-            blog.id,
-            [{"title": "Post 1", "url": "https://example.com/1"}],
+            default_blog.id,
+            [
+                {"title": "Dated", "url": "https://example.com/1", "published_date": "2024-01-15T10:30:00"},
+                {"title": "Undated", "url": "https://example.com/2"},
+            ],
         )
 
-        # Get article ID
-        cursor = await in_memory_db.execute("SELECT id FROM articles LIMIT 1")
-        row = await cursor.fetchone()
-        article_id = row["id"]
+        articles = await list_articles(include_read=True)
+        rows = await list_article_rows(include_read=True)
+
+        assert rows == [
+            {
+                "id": a.id,
+                "blog_id": a.blog_id,
+                "title": a.title,
+                "url": a.url,
+                "published_date": a.published_date.isoformat() if a.published_date else None,
+                "discovered_date": a.discovered_date.isoformat(),
+                "is_read": a.is_read,
+            }
+            for a in articles
+        ]
+        assert rows[1]["published_date"] == "2024-01-15T10:30:00+00:00"
+
+
+    def test_article_columns_match_article_fields(self):
+        """Test that rows unpacked by _row_to_article line up with Article's fields."""
+        from dataclasses import fields
+        from feed_reader.storage.database import _ARTICLE_COLUMNS
+
+        assert _ARTICLE_COLUMNS == tuple(f.name for f in fields(Article))
+
+
+class TestArticleReadStatus:
+    """Tests for marking articles as read/unread."""
+
+    async def test_mark_article_read(self, in_memory_db, default_blog):
+        """Test marking an article as read."""
+        (article_id,) = await _seed(in_memory_db, [(default_blog.id, "Post 1", "https://example.com/1", False, None)])
 
         article = await mark_article_read(article_id)
 
@@ -386,19 +767,9 @@ class TestArticleReadStatus:
 
         assert article is None
 
-    async def test_mark_article_unread(self, in_memory_db):
+    async def test_mark_article_unread(self, in_memory_db, default_blog):
         """Test marking an article as unread."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
-        await add_articles(
-            blog.id,
-            [{"title": "Post 1", "url": "https://example.com/1"}],
-        )
-
-        # Get article ID and mark as read first
-        cursor = await in_memory_db.execute("SELECT id FROM articles LIMIT 1")
-        row = await cursor.fetchone()
-        article_id = row["id"]
-        await mark_article_read(article_id)
+        (article_id,) = await _seed(in_memory_db, [(default_blog.id, "Post 1", "https://example.com/1", True, None)])
 
         # Now mark as unread
         article = await mark_article_unread(article_id)
@@ -406,11 +777,10 @@ class TestArticleReadStatus:
         assert article is not None
         assert article.is_read is False
 
-    async def test_mark_all_read(self, in_memory_db):
+    async def test_mark_all_read(self, default_blog):
         """Test marking all articles as read."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
         await add_articles(
-            blog.id,
+            default_blog.id,
             [
                 {"title": "Post 1", "url": "https://example.com/1"},
                 {"title": "Post 2", "url": "https://example.com/2"},
@@ -455,146 +825,77 @@ class TestArticleReadStatus:
 class TestLastScanned:
     """Tests for last_scanned timestamp updates."""
 
-    async def test_update_last_scanned(self, in_memory_db):
+    async def test_update_last_scanned(self, default_blog):
         """Test updating the last_scanned timestamp."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
-
-        assert blog.last_scanned is None
+        assert default_blog.last_scanned is None
 
-        await update_last_scanned(blog.id)
+        await update_last_scanned(default_blog.id)
 
         updated_blog = await get_blog_by_name("Test Blog")
 
         assert updated_blog.last_scanned is not None
         assert isinstance(updated_blog.last_scanned, datetime)
 
+    async def test_update_last_scanned_multiple_blogs(self, in_memory_db):
+        """Test updating several blogs at once, as scan_blogs does."""
+        await add_blog(name="Blog One", url="https://one.com")
+        await add_blog(name="Blog Two", url="https://two.com")
+        await add_blog(name="Blog Three", url="https://three.com")
+        _blog_cache.clear()
 
-class TestArticleDateFiltering:
-    """Tests for list_articles date filtering functionality."""
-
-    async def test_list_articles_since_filter(self, in_memory_db):
-        """Test filtering articles since a specific date."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
-
-        # Add articles with different dates
-        now = datetime.now()
-        old_date = (now - timedelta(days=30)).isoformat()
-        recent_date = (now - timedelta(days=2)).isoformat()
-
-        await add_articles(
-            blog.id,
-            [
-                {"title": "Old Post", "url": "https://example.com/old", "published_date": old_date},
-                {"title": "Recent Post", "url": "https://example.com/recent", "published_date": recent_date},
-            ],
-        )
-
-        # Filter to last 7 days
-        since_date = now - timedelta(days=7)
-        articles = await list_articles(since=since_date)
-
-        assert len(articles) == 1
-        assert articles[0].title == "Recent Post"
-
-    async def test_list_articles_before_filter(self, in_memory_db):
-        """Test filtering articles before a specific date."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
-
-        now = datetime.now()
-        old_date = (now - timedelta(days=30)).isoformat()
-        recent_date = (now - timedelta(days=2)).isoformat()
-
-        await add_articles(
-            blog.id,
-            [
-                {"title": "Old Post", "url": "https://example.com/old", "published_date": old_date},
-                {"title": "Recent Post", "url": "https://example.com/recent", "published_date": recent_date},
-            ],
-        )
-
-        # Filter to before 7 days ago
-        before_date = now - timedelta(days=7)
-        articles = await list_articles(before=before_date, include_read=True)
-
-        assert len(articles) == 1
-        assert articles[0].title == "Old Post"
-
-    async def test_list_articles_date_range(self, in_memory_db):
-        """Test filtering articles within a date range."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
-
-        now = datetime.now()
-        very_old_date = (now - timedelta(days=60)).isoformat()
-        middle_date = (now - timedelta(days=15)).isoformat()
-        recent_date = (now - timedelta(days=2)).isoformat()
-
-        await add_articles(
-            blog.id,
-            [
-                {"title": "Very Old Post", "url": "https://example.com/very-old", "published_date": very_old_date},
-                {"title": "Middle Post", "url": "https://example.com/middle", "published_date": middle_date},
-                {"title": "Recent Post", "url": "https://example.com/recent", "published_date": recent_date},
-            ],
-        )
-
-        # Filter to between 30 and 7 days ago
-        since_date = now - timedelta(days=30)
-        before_date = now - timedelta(days=7)
-        articles = await list_articles(since=since_date, before=before_date, include_read=True)
-
-        assert len(articles) == 1
-        assert articles[0].title == "Middle Post"
-
-    async def test_list_articles_days_shorthand(self, in_memory_db):
-        """Test the days parameter shorthand for recent articles."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
-
-        now = datetime.now()
-        old_date = (now - timedelta(days=30)).isoformat()
-        recent_date = (now - timedelta(days=2)).isoformat()
-
-        await add_articles(
-            blog.id,
-            [
-                {"title": "Old Post", "url": "https://example.com/old", "published_date": old_date},
-                {"title": "Recent Post", "url": "https://example.com/recent", "published_date": recent_date},
-            ],
-        )
-
-        # Use days=7 shorthand
-        articles = await list_articles(days=7)
-
-        assert len(articles) == 1
-        assert articles[0].title == "Recent Post"
-
-    async def test_list_articles_days_overrides_since(self, in_memory_db):
-        """Test that days parameter overrides since parameter."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
+        blogs = await list_blogs()
+        await update_last_scanned(*(b["id"] for b in blogs if b["name"] != "Blog Three"))
 
-        now = datetime.now()
-        recent_date = (now - timedelta(days=2)).isoformat()
+        scanned = {b["name"]: b["last_scanned"] for b in await list_blogs()}
+        assert scanned["Blog One"].endswith("+00:00")
+        assert datetime.fromisoformat(scanned["Blog One"]) == (await get_blog_by_name("Blog One")).last_scanned
+        assert scanned["Blog Two"] is not None
+        assert scanned["Blog Three"] is None
 
-        await add_articles(
-            blog.id,
-            [
-                {"title": "Recent Post", "url": "https://example.com/recent", "published_date": recent_date},
-            ],
-        )
+        await update_last_scanned()
 
-        # days=7 should override since from 60 days ago
-        since_date = now - timedelta(days=60)
-        articles = await list_articles(since=since_date, days=7)
 
-        # Should still find the article (days=7 takes precedence)
-        assert len(articles) == 1
+class TestArticleDateFiltering:
+    """Tests for list_articles date filtering functionality."""
 
-    async def test_list_articles_fallback_to_discovered_date(self, in_memory_db):
+    @pytest.fixture
+    async def dated_articles(self, in_memory_db, default_blog, dates):
+        """Seed one unread article 60, 15 and 2 days old."""
+        await _seed(in_memory_db, [
+            (default_blog.id, "Old Post", "https://example.com/old", False, dates.very_old),
+            (default_blog.id, "Middle Post", "https://example.com/middle", False, dates.middle),
+            (default_blog.id, "Recent Post", "https://example.com/recent", False, dates.recent),
+        ])
+
+    @pytest.mark.parametrize(
+        "filters, expected",
+        [
+            ({"since": "week_ago"}, {"Recent Post"}),
+            ({"before": "week_ago"}, {"Old Post", "Middle Post"}),
+            ({"since": "old", "before": "week_ago"}, {"Middle Post"}),
+            ({"days": 7}, {"Recent Post"}),
+            # days takes precedence over since
+            ({"since": "very_old", "days": 7}, {"Recent Post"}),
+        ],
+        ids=["since", "before", "date_range", "days_shorthand", "days_overrides_since"],
+    )
+    async def test_list_articles_date_filters(self, dated_articles, dates, filters, expected):
+        """Test filtering articles by since, before and days."""
+        # since and before name one of the reference dates
+        kwargs = {
+            key: getattr(dates, value) if key in ("since", "before") else value
+            for key, value in filters.items()
+        }
+
+        articles = await list_articles(include_read=True, **kwargs)
+
+        assert {a.title for a in articles} == expected
+
+    async def test_list_articles_fallback_to_discovered_date(self, default_blog):
         """Test that articles without published_date use discovered_date for filtering."""
-        blog = await add_blog(name="Test Blog", url="https://example.com")
-
         # Add article without published_date - discovered_date will be set to now
         await add_articles(
-            blog.id,
+            default_blog.id,
             [
                 {"title": "No Pub Date", "url": "https://example.com/no-date"},
             ],
@@ -606,16 +907,15 @@ class TestArticleDateFiltering:
         assert len(articles) == 1
         assert articles[0].title == "No Pub Date"
 
-    async def test_list_articles_combined_filters(self, in_memory_db):
+    async def test_list_articles_combined_filters(self, in_memory_db, dates):
         """Test date filtering combined with other filters (blog_name, include_read)."""
         blog1 = await add_blog(name="Blog One", url="https://one.com")
         blog2 = await add_blog(name="Blog Two", url="https://two.com")
 
-        now = datetime.now()
-        recent_date = (now - timedelta(days=2)).isoformat()
-
-        await add_articles(blog1.id, [{"title": "Blog1 Post", "url": "https://one.com/1", "published_date": recent_date}])
-        await add_articles(blog2.id, [{"title": "Blog2 Post", "url": "https://two.com/1", "published_date": recent_date}])
+        await _seed(in_memory_db, [
+            (blog1.id, "Blog1 Post", "https://one.com/1", False, dates.recent),
+            (blog2.id, "Blog2 Post", "https://two.com/1", False, dates.recent),
+        ])
 
         # Filter by blog name AND days
         articles = await list_articles(blog_name="Blog One", days=7)
@@ -22,7 +22,7 @@ import tempfile
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from unittest.mock import patch, MagicMock
 import pytest
 
@@ -30,6 +30,7 @@ import pytest
 from feed_reader.decorators.exception_handler import exception_handler
 from feed_reader.decorators.tool_logger import tool_logger
 from feed_reader.decorators.parallelize import parallelize
+from feed_reader.decorators.type_converter import type_converter
 from feed_reader.decorators.sqlite_logger import (
     SQLiteLoggerSink, 
     initialize_sqlite_logging,
@@ -151,6 +152,56 @@ class TestToolLogger:
         assert sig.return_annotation == Dict[str, Any]
 
 
+    def test_module_logger_resolves_correlation_id_per_message(self):
+        """Test that a module-level logger picks up the current correlation ID."""
+        from loguru import logger as loguru_logger
+        from feed_reader.log_system.unified_logger import UnifiedLogger
+        from feed_reader.log_system.correlation import set_correlation_id, clear_correlation_id
+        
+        correlation_ids = []
+        handler_id = loguru_logger.add(
+            lambda message: correlation_ids.append(message.record["extra"]["correlation_id"])
+        )
+        module_logger = UnifiedLogger.get_module_logger("test.module")
+        
+        try:
+            set_correlation_id("req_first")
+            module_logger.info("first")
+            set_correlation_id("req_second")
+            module_logger.info("second")
+        finally:
+            loguru_logger.remove(handler_id)
+            clear_correlation_id()
+        
+        assert correlation_ids == ["req_first", "req_second"]
+
+
+class TestTypeConverter:
+    """Test type_converter decorator functionality."""
+    
+    @pytest.mark.asyncio
+    async def test_string_parameters_converted(self):
+        """Test that string inputs are converted using the annotations."""
+        
+        @type_converter
+        async def test_tool(count: int, enabled: bool, label: Optional[str] = None, limit: int = 5) -> Dict[str, Any]:
+            return {"count": count, "enabled": enabled, "label": label, "limit": limit}
+        
+        result = await test_tool(count="3", enabled="true")
+        assert result == {"count": 3, "enabled": True, "label": None, "limit": 5}
+    
+    @pytest.mark.asyncio
+    async def test_optional_annotation_unwrapped(self):
+        """Test that Optional[int] parameters are converted to int."""
+        
+        @type_converter
+        async def test_tool(value: Optional[int] = None) -> Optional[int]:
+            return value
+        
+        assert await test_tool(value="42") == 42
+        assert await test_tool(value=None) is None
+
+
 class TestParallelize:
     """Test parallelize decorator functionality."""
     
@@ -607,6 +658,13 @@ class TestIntegrationPattern:
             sig = inspect.signature(decorated_func)
             assert list(sig.parameters.keys()) == ["kwargs_list", "ctx"]
             assert sig.parameters["kwargs_list"].annotation == List[Dict[str, Any]]
+    
+    def test_server_package_reuses_app_instance(self):
+        """Test that the package-level server is the instance built in app.py."""
+        from feed_reader.server import server as package_server
+        from feed_reader.server.app import server as app_server
+        
+        assert package_server is app_server
 
 
 if __name__ == "__main__":
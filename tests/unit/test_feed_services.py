@@ -3,19 +3,117 @@
 Tests for feed discovery, feed parsing, and HTML scraping services.
 """
 
+import httpx
 import pytest
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from unittest.mock import AsyncMock, patch, MagicMock
-from datetime import datetime
-
-from feed_reader.services.feed_discovery import discover_feed_url, _validate_feed
-from feed_reader.services.feed_parser import parse_feed, ParsedArticle, _parse_date
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Dict, Optional
+
+from feed_reader.services.feed_discovery import (
+    discover_feed_url,
+    _validate_feed,
+    _find_alternate_links,
+    _is_feed_mime_type,
+    clear_discovery_cache,
+    VALIDATION_PREFIX_BYTES,
+)
+from feed_reader.services.feed_parser import (
+    parse_feed,
+    ParsedArticle,
+    _parse_date,
+    clear_feed_cache,
+)
 from feed_reader.services.scraper import scrape_blog
+from feed_reader.services.http_client import get_client, close_client
 
 
 # Mark all tests as async
 pytestmark = pytest.mark.anyio
 
 
+@dataclass(slots=True)
+class FakeResponse:
+    """Minimal stand-in for httpx.Response, much cheaper than a MagicMock."""
+
+    status_code: int = 200
+    content: bytes = b""
+    headers: Dict[str, str] = field(default_factory=dict)
+    charset_encoding: Optional[str] = None
+
+    def raise_for_status(self) -> None:
+        """Raise httpx.HTTPStatusError for 4xx and 5xx, like httpx.Response."""
+        if self.status_code >= 400:
+            request = httpx.Request("GET", "https://example.com")
+            raise httpx.HTTPStatusError(
+                f"{self.status_code} error",
+                request=request,
+                response=httpx.Response(self.status_code, request=request),
+            )
+
+    async def aiter_bytes(self) -> AsyncIterator[bytes]:
+        """Yield the content in 4 KiB chunks, like a streamed body."""
+        for start in range(0, len(self.content), 4096):
+            yield self.content[start:start + 4096]
+
+
+def mock_stream(get):
+    """Adapt a mock client.get coroutine to client.stream for streamed fetches."""
+    @asynccontextmanager
+    async def stream(method, url, **kwargs):
+        yield await get(url, **kwargs)
+
+    return stream
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    """Start every test with empty feed discovery and conditional request caches."""
+    clear_discovery_cache()
+    clear_feed_cache()
+    yield
+    clear_discovery_cache()
+    clear_feed_cache()
+
+
+class TestHttpClient:
+    """Tests for the shared HTTP client."""
+
+    async def test_get_client_reuses_instance(self):
+        """Test that repeated calls return the same pooled client."""
+        try:
+            first = await get_client()
+            second = await get_client()
+            assert first is second
+        finally:
+            await close_client()
+
+    async def test_get_client_uses_http2_when_available(self):
+        """Test that HTTP/2 is only requested when h2 can be imported."""
+        with patch("feed_reader.services.http_client.httpx.AsyncClient") as client_cls, \
+                patch("feed_reader.services.http_client.HTTP2_AVAILABLE", False):
+            client_cls.return_value.aclose = AsyncMock()
+            try:
+                await get_client()
+            finally:
+                await close_client()
+
+        assert client_cls.call_args.kwargs["http2"] is False
+
+    async def test_close_client_resets_singleton(self):
+        """Test that closing the client causes a fresh one to be created."""
+        first = await get_client()
+        await close_client()
+        assert first.is_closed
+
+        second = await get_client()
+        try:
+            assert second is not first
+        finally:
+            await close_client()
+
+
 class TestFeedDiscovery:
     """Tests for feed URL discovery."""
 
@@ -39,27 +137,25 @@ class TestFeedDiscovery:
         </rss>
         """
 
-        mock_response_html = MagicMock()
-        mock_response_html.status_code = 200
-        mock_response_html.text = html
-        mock_response_html.raise_for_status = MagicMock()
+        mock_response_html = FakeResponse(status_code=200, content=html.encode())
 
-        mock_response_feed = MagicMock()
-        mock_response_feed.status_code = 200
-        mock_response_feed.text = rss_feed
-        mock_response_feed.raise_for_status = MagicMock()
+        mock_response_feed = FakeResponse(
+            status_code=200,
+            content=rss_feed.encode(),
+            headers={"content-type": "application/rss+xml"},
+        )
 
         async def mock_get(url, **kwargs):
             if url.endswith("/feed.xml"):
                 return mock_response_feed
             return mock_response_html
 
-        with patch("feed_reader.services.feed_discovery.httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get = mock_get
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_instance
+        mock_instance = AsyncMock()
+        mock_instance.get = mock_get
+        mock_instance.head = mock_get
+        mock_instance.stream = mock_stream(mock_get)
+
+        with patch("feed_reader.services.feed_discovery.get_client", AsyncMock(return_value=mock_instance)):
 
             result = await discover_feed_url("https://example.com")
 
@@ -78,17 +174,15 @@ class TestFeedDiscovery:
         </rss>
         """
 
-        mock_response_html = MagicMock()
-        mock_response_html.status_code = 200
-        mock_response_html.text = html
-        mock_response_html.raise_for_status = MagicMock()
+        mock_response_html = FakeResponse(status_code=200, content=html.encode())
 
-        mock_response_feed = MagicMock()
-        mock_response_feed.status_code = 200
-        mock_response_feed.text = rss_feed
+        mock_response_feed = FakeResponse(
+            status_code=200,
+            content=rss_feed.encode(),
+            headers={"content-type": "application/rss+xml"},
+        )
 
-        mock_response_404 = MagicMock()
-        mock_response_404.status_code = 404
+        mock_response_404 = FakeResponse(status_code=404)
 
         async def mock_get(url, **kwargs):
             if url == "https://example.com":
@@ -97,56 +191,288 @@ class TestFeedDiscovery:
                 return mock_response_feed
             return mock_response_404
 
-        with patch("feed_reader.services.feed_discovery.httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get = mock_get
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_instance
+        mock_instance = AsyncMock()
+        mock_instance.get = mock_get
+        mock_instance.head = mock_get
+        mock_instance.stream = mock_stream(mock_get)
+
+        with patch("feed_reader.services.feed_discovery.get_client", AsyncMock(return_value=mock_instance)):
 
             result = await discover_feed_url("https://example.com")
 
             assert result == "https://example.com/feed"
 
+    async def test_discover_feed_probes_paths_concurrently(self):
+        """Test that slow probes run together rather than one after another."""
+        import asyncio
+
+        rss_feed = """<?xml version="1.0"?>
+        <rss version="2.0">
+            <channel>
+                <title>Test Blog</title>
+                <item><title>Post 1</title><link>https://example.com/post1</link></item>
+            </channel>
+        </rss>
+        """
+
+        mock_response_html = FakeResponse(status_code=200, content=b"<html><head></head><body></body></html>")
+
+        mock_response_feed = FakeResponse(
+            status_code=200,
+            content=rss_feed.encode(),
+            headers={"content-type": "application/rss+xml"},
+        )
+
+        async def mock_get(url, **kwargs):
+            if url == "https://example.com":
+                return mock_response_html
+            elif url == "https://example.com/blog/rss":
+                return mock_response_feed
+            # Every other probe is slow to fail; one after another they'd
+            # take well over the timeout below
+            await asyncio.sleep(0.5)
+            return FakeResponse(status_code=404)
+
+        mock_instance = AsyncMock()
+        mock_instance.get = mock_get
+        mock_instance.head = mock_get
+        mock_instance.stream = mock_stream(mock_get)
+
+        with patch("feed_reader.services.feed_discovery.get_client", AsyncMock(return_value=mock_instance)):
+            result = await asyncio.wait_for(discover_feed_url("https://example.com"), timeout=2)
+
+            assert result == "https://example.com/blog/rss"
+
+    async def test_discover_feed_probes_prefer_path_order(self):
+        """Test that the highest-priority valid path wins over a faster one."""
+        import asyncio
+
+        rss_feed = b"""<?xml version="1.0"?>
+        <rss version="2.0"><channel><title>Test Blog</title></channel></rss>
+        """
+
+        async def mock_get(url, **kwargs):
+            if url == "https://example.com":
+                return FakeResponse(status_code=200, content=b"<html><head></head><body></body></html>")
+            if url == "https://example.com/feed":
+                await asyncio.sleep(0.05)
+                return FakeResponse(status_code=200, content=rss_feed)
+            if url == "https://example.com/atom.xml":
+                return FakeResponse(status_code=200, content=rss_feed)
+            return FakeResponse(status_code=404)
+
+        mock_instance = AsyncMock()
+        mock_instance.get = mock_get
+        mock_instance.head = mock_get
+        mock_instance.stream = mock_stream(mock_get)
+
+        with patch("feed_reader.services.feed_discovery.get_client", AsyncMock(return_value=mock_instance)):
+            assert await discover_feed_url("https://example.com") == "https://example.com/feed"
+
+    async def test_discover_validates_link_tags_concurrently(self):
+        """Test that advertised feeds are validated together and the first valid one in page order wins."""
+        import asyncio
+
+        html = """
+        <html><head>
+            <link rel="alternate" type="application/rss+xml" href="/broken.xml">
+            <link rel="alternate" type="application/rss+xml" href="/rss.xml">
+            <link rel="alternate" type="application/atom+xml" href="/atom.xml">
+        </head><body></body></html>
+        """
+
+        rss_feed = """<?xml version="1.0"?>
+        <rss version="2.0">
+            <channel>
+                <title>Test Blog</title>
+                <item><title>Post 1</title><link>https://example.com/post1</link></item>
+            </channel>
+        </rss>
+        """
+
+        mock_response_html = FakeResponse(status_code=200, content=html.encode())
+        mock_response_feed = FakeResponse(status_code=200, content=rss_feed.encode())
+        mock_response_404 = FakeResponse(status_code=404)
+        started = []
+
+        async def mock_get(url, **kwargs):
+            if url == "https://example.com":
+                return mock_response_html
+            started.append(url)
+            # The broken feed only answers once every candidate has been requested
+            while url.endswith("/broken.xml") and len(started) < 3:
+                await asyncio.sleep(0)
+            return mock_response_404 if url.endswith("/broken.xml") else mock_response_feed
+
+        mock_instance = AsyncMock()
+        mock_instance.get = mock_get
+        mock_instance.stream = mock_stream(mock_get)
+
+        with patch("feed_reader.services.feed_discovery.get_client", AsyncMock(return_value=mock_instance)):
+            result = await asyncio.wait_for(discover_feed_url("https://example.com"), timeout=5)
+
+            assert result == "https://example.com/rss.xml"
+            assert len(started) == 3
+
     async def test_discover_feed_none_found(self):
         """Test returns None when no feed is found."""
         html = "<html><head></head><body></body></html>"
 
-        mock_response_html = MagicMock()
-        mock_response_html.status_code = 200
-        mock_response_html.text = html
-        mock_response_html.raise_for_status = MagicMock()
+        mock_response_html = FakeResponse(status_code=200, content=html.encode())
 
-        mock_response_404 = MagicMock()
-        mock_response_404.status_code = 404
+        mock_response_404 = FakeResponse(status_code=404)
 
         async def mock_get(url, **kwargs):
             if url == "https://example.com":
                 return mock_response_html
             return mock_response_404
 
-        with patch("feed_reader.services.feed_discovery.httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get = mock_get
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_instance
+        mock_instance = AsyncMock()
+        mock_instance.get = mock_get
+        mock_instance.head = mock_get
+        mock_instance.stream = mock_stream(mock_get)
+
+        with patch("feed_reader.services.feed_discovery.get_client", AsyncMock(return_value=mock_instance)):
 
             result = await discover_feed_url("https://example.com")
 
             assert result is None
 
+    async def test_discover_caches_results(self):
+        """Test that repeated discovery for the same URL is served from cache."""
+        html = "<html><head></head><body></body></html>"
+
+        mock_response_html = FakeResponse(status_code=200, content=html.encode())
+
+        mock_response_404 = FakeResponse(status_code=404)
+
+        captured_urls = []
+
+        async def mock_get(url, **kwargs):
+            captured_urls.append(url)
+            if url == "https://example.com":
+                return mock_response_html
+            return mock_response_404
+
+        mock_instance = AsyncMock()
+        mock_instance.get = mock_get
+        mock_instance.head = mock_get
+        mock_instance.stream = mock_stream(mock_get)
+
+        with patch("feed_reader.services.feed_discovery.get_client", AsyncMock(return_value=mock_instance)):
+            assert await discover_feed_url("https://example.com") is None
+            requests_made = len(captured_urls)
+
+            assert await discover_feed_url("example.com") is None
+            assert len(captured_urls) == requests_made
+
+    async def test_discover_does_not_cache_network_failures(self):
+        """Test that a miss caused by an unreachable homepage is retried."""
+        from feed_reader.services import feed_discovery
+
+        captured_urls = []
+
+        async def mock_get(url, **kwargs):
+            captured_urls.append(url)
+            raise httpx.ConnectTimeout("timed out")
+
+        mock_instance = AsyncMock()
+        mock_instance.get = mock_get
+        mock_instance.head = mock_get
+        mock_instance.stream = mock_stream(mock_get)
+
+        with patch("feed_reader.services.feed_discovery.get_client", AsyncMock(return_value=mock_instance)):
+            assert await discover_feed_url("https://example.com") is None
+            requests_made = len(captured_urls)
+
+            assert await discover_feed_url("https://example.com") is None
+            assert len(captured_urls) == 2 * requests_made
+
+        assert not feed_discovery._discovery_cache
+        assert not feed_discovery._discovery_locks
+
+    async def test_discover_does_not_cache_homepage_server_error(self):
+        """Test that a 5xx homepage is treated as a transient failure."""
+        from feed_reader.services import feed_discovery
+
+        async def mock_get(url, **kwargs):
+            if url == "https://example.com":
+                return FakeResponse(status_code=503)
+            return FakeResponse(status_code=404)
+
+        mock_instance = AsyncMock()
+        mock_instance.get = mock_get
+        mock_instance.head = mock_get
+        mock_instance.stream = mock_stream(mock_get)
+
+        with patch("feed_reader.services.feed_discovery.get_client", AsyncMock(return_value=mock_instance)):
+            assert await discover_feed_url("https://example.com") is None
+
+        assert not feed_discovery._discovery_cache
+
+    async def test_clear_discovery_cache_keeps_held_locks(self):
+        """Test that clearing the cache doesn't drop a lock a discovery still holds."""
+        import asyncio
+        from feed_reader.services import feed_discovery
+
+        release = asyncio.Event()
+
+        async def mock_discover(url):
+            await release.wait()
+            return url + "/feed"
+
+        with patch.object(feed_discovery, "_discover", mock_discover):
+            task = asyncio.create_task(discover_feed_url("https://example.com"))
+            await asyncio.sleep(0)
+
+            clear_discovery_cache()
+            assert "https://example.com" in feed_discovery._discovery_locks
+
+            release.set()
+            assert await task == "https://example.com/feed"
+
+        assert not feed_discovery._discovery_locks
+
+    async def test_discover_cache_is_bounded(self):
+        """Test that the least recently used result is evicted past the size limit."""
+        from feed_reader.services import feed_discovery
+
+        async def mock_discover(url):
+            return url + "/feed"
+
+        with patch.object(feed_discovery, "DISCOVERY_CACHE_MAX_ENTRIES", 2), \
+                patch.object(feed_discovery, "_discover", mock_discover):
+            await discover_feed_url("https://one.com")
+            await discover_feed_url("https://two.com")
+            await discover_feed_url("https://one.com")
+            await discover_feed_url("https://three.com")
+
+        assert list(feed_discovery._discovery_cache) == ["https://one.com", "https://three.com"]
+        assert not feed_discovery._discovery_locks
+
+    async def test_discover_refreshes_stale_entry_in_background(self):
+        """Test that a stale cache entry is returned while being refreshed."""
+        import asyncio
+        from feed_reader.services import feed_discovery
+
+        feed_discovery._discovery_cache["https://example.com"] = ("https://example.com/old-feed", 0.0)
+
+        with patch.object(feed_discovery, "_discover", AsyncMock(return_value="https://example.com/feed")) as mock_discover:
+            result = await discover_feed_url("https://example.com")
+            assert result == "https://example.com/old-feed"
+
+            await asyncio.gather(*feed_discovery._refresh_tasks.values())
+
+            mock_discover.assert_awaited_once_with("https://example.com")
+            assert await discover_feed_url("https://example.com") == "https://example.com/feed"
+
     async def test_discover_adds_https_if_missing(self):
         """Test that https:// is added if protocol is missing."""
         html = "<html><head></head><body></body></html>"
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = html
-        mock_response.raise_for_status = MagicMock()
+        mock_response = FakeResponse(status_code=200, content=html.encode())
 
-        mock_response_404 = MagicMock()
-        mock_response_404.status_code = 404
+        mock_response_404 = FakeResponse(status_code=404)
 
         captured_urls = []
 
@@ -156,12 +482,12 @@ class TestFeedDiscovery:
                 return mock_response
             return mock_response_404
 
-        with patch("feed_reader.services.feed_discovery.httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get = mock_get
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_instance
+        mock_instance = AsyncMock()
+        mock_instance.get = mock_get
+        mock_instance.head = mock_get
+        mock_instance.stream = mock_stream(mock_get)
+
+        with patch("feed_reader.services.feed_discovery.get_client", AsyncMock(return_value=mock_instance)):
 
             await discover_feed_url("example.com")
 
@@ -169,6 +495,128 @@ class TestFeedDiscovery:
             assert captured_urls[0] == "https://example.com"
 
 
+    def test_find_alternate_links_regex_scan(self):
+        """Test the byte-level scan handles quoting, case and entities."""
+        html = (
+            b'<head><LINK Rel="alternate" type="application/rss+xml" href="/feed?a=1&amp;b=2">'
+            b"<link rel=alternate type=application/atom+xml href=/atom.xml />"
+            b'<link rel="stylesheet" href="/style.css"></head>'
+        )
+
+        assert _find_alternate_links(html) == [
+            ("application/rss+xml", "/feed?a=1&b=2"),
+            ("application/atom+xml", "/atom.xml"),
+        ]
+
+    def test_find_alternate_links_stops_at_head(self):
+        """Test the scan ignores the body, and the full parse still finds body links."""
+        head_and_body = (
+            b'<html><head><link rel="alternate" type="application/rss+xml" href="/feed"></head>'
+            b'<body><link rel="alternate" type="application/atom+xml" href="/atom.xml"></body></html>'
+        )
+        body_only = b'<html><head></head><body><link rel="alternate" href="/atom.xml"></body></html>'
+
+        assert _find_alternate_links(head_and_body) == [("application/rss+xml", "/feed")]
+        assert _find_alternate_links(body_only) == [("", "/atom.xml")]
+
+    def test_is_feed_mime_type_ignores_parameters(self):
+        """Test MIME type matching ignores case and parameters."""
+        assert _is_feed_mime_type("Application/RSS+XML; charset=utf-8")
+        assert not _is_feed_mime_type("text/html")
+        assert not _is_feed_mime_type("")
+
+    async def test_validate_feed_large_feed(self):
+        """Test that a feed larger than the validation prefix still validates."""
+        rss_feed = (
+            '<?xml version="1.0"?><rss version="2.0"><channel><title>Big Blog</title>'
+            + "<item><title>Post</title><link>https://example.com/post</link></item>" * 500
+            + "</channel></rss>"
+        )
+
+        mock_response = FakeResponse(
+            status_code=200,
+            content=rss_feed.encode(),
+            headers={"content-type": "application/xml"},
+        )
+
+        mock_client = AsyncMock()
+        mock_client.head = AsyncMock(return_value=mock_response)
+        mock_client.stream = mock_stream(AsyncMock(return_value=mock_response))
+
+        assert await _validate_feed(mock_client, "https://example.com/feed")
+
+    async def test_validate_feed_json_feed(self):
+        """Test that a JSON Feed validates even though feedparser can't read it."""
+        json_feed = '{"version": "https://jsonfeed.org/version/1.1", "title": "Test Blog", "items": []}'
+
+        mock_response = FakeResponse(
+            status_code=200,
+            content=json_feed.encode(),
+            headers={"content-type": "application/feed+json"},
+        )
+
+        mock_client = AsyncMock()
+        mock_client.head = AsyncMock(return_value=mock_response)
+        mock_client.stream = mock_stream(AsyncMock(return_value=mock_response))
+
+        assert await _validate_feed(mock_client, "https://example.com/feed.json")
+
+    async def test_validate_feed_rejects_large_html(self):
+        """Test that a large HTML page is not mistaken for a feed."""
+        html = "<html><head><title>Home</title></head><body>" + "<p>text</p>" * 2000 + "</body></html>"
+
+        mock_response = FakeResponse(
+            status_code=200,
+            content=html.encode(),
+            headers={"content-type": "application/xml"},
+        )
+
+        mock_client = AsyncMock()
+        mock_client.head = AsyncMock(return_value=mock_response)
+        mock_client.stream = mock_stream(AsyncMock(return_value=mock_response))
+
+        assert not await _validate_feed(mock_client, "https://example.com/feed")
+
+    async def test_validate_feed_skips_get_after_failed_head(self):
+        """Test that missing pages and HTML responses are rejected from the HEAD alone."""
+        mock_response_404 = FakeResponse(status_code=404)
+
+        mock_response_html = FakeResponse(
+            status_code=200,
+            headers={"content-type": "text/html; charset=utf-8"},
+        )
+
+        mock_client = AsyncMock()
+        mock_client.stream = MagicMock()
+
+        for head_response in (mock_response_404, mock_response_html):
+            mock_client.head = AsyncMock(return_value=head_response)
+            assert not await _validate_feed(mock_client, "https://example.com/feed")
+
+        mock_client.stream.assert_not_called()
+
+    async def test_validate_feed_falls_back_to_ranged_get(self):
+        """Test that a server rejecting HEAD gets a ranged GET instead."""
+        rss_feed = (
+            '<?xml version="1.0"?><rss version="2.0"><channel><title>Big Blog</title>'
+            + "<item><title>Post</title><link>https://example.com/post</link></item>" * 20
+        )
+
+        mock_response_405 = FakeResponse(status_code=405)
+
+        mock_response_partial = FakeResponse(status_code=206, content=rss_feed.encode())
+
+        mock_client = AsyncMock()
+        mock_client.head = AsyncMock(return_value=mock_response_405)
+        mock_get = AsyncMock(return_value=mock_response_partial)
+        mock_client.stream = mock_stream(mock_get)
+
+        assert await _validate_feed(mock_client, "https://example.com/feed")
+
+        range_header = mock_get.await_args.kwargs["headers"]["Range"]
+        assert range_header == f"bytes=0-{VALIDATION_PREFIX_BYTES - 1}"
+
+
 class TestFeedParser:
     """Tests for RSS/Atom feed parsing."""
 
@@ -191,17 +639,13 @@ class TestFeedParser:
         </rss>
         """
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = rss_feed
-        mock_response.raise_for_status = MagicMock()
+        mock_response = FakeResponse(status_code=200, content=rss_feed.encode())
+
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(return_value=mock_response)
+        mock_instance.stream = mock_stream(mock_instance.get)
 
-        with patch("feed_reader.services.feed_parser.httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get = AsyncMock(return_value=mock_response)
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_instance
+        with patch("feed_reader.services.feed_parser.get_client", AsyncMock(return_value=mock_instance)):
 
             articles = await parse_feed("https://example.com/feed.xml")
 
@@ -225,17 +669,13 @@ class TestFeedParser:
         </feed>
         """
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = atom_feed
-        mock_response.raise_for_status = MagicMock()
+        mock_response = FakeResponse(status_code=200, content=atom_feed.encode())
 
-        with patch("feed_reader.services.feed_parser.httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get = AsyncMock(return_value=mock_response)
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_instance
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(return_value=mock_response)
+        mock_instance.stream = mock_stream(mock_instance.get)
+
+        with patch("feed_reader.services.feed_parser.get_client", AsyncMock(return_value=mock_instance)):
 
             articles = await parse_feed("https://example.com/atom.xml")
 
@@ -243,6 +683,121 @@ class TestFeedParser:
             assert articles[0].title == "Atom Post"
             assert articles[0].url == "https://example.com/atom-post"
 
+    async def test_parse_rdf_feed(self):
+        """Test parsing an RSS 1.0 (RDF) feed with Dublin Core dates."""
+        rdf_feed = """<?xml version="1.0"?>
+        <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+                 xmlns="http://purl.org/rss/1.0/"
+                 xmlns:dc="http://purl.org/dc/elements/1.1/">
+            <channel rdf:about="https://example.com/">
+                <title>Test Blog</title>
+            </channel>
+            <item rdf:about="https://example.com/rdf-post">
+                <title>RDF Post</title>
+                <link>https://example.com/rdf-post</link>
+                <dc:date>2024-01-15T10:30:00Z</dc:date>
+            </item>
+        </rdf:RDF>
+        """
+
+        mock_response = FakeResponse(content=rdf_feed.encode())
+
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(return_value=mock_response)
+        mock_instance.stream = mock_stream(mock_instance.get)
+
+        with patch("feed_reader.services.feed_parser.get_client", AsyncMock(return_value=mock_instance)):
+            articles = await parse_feed("https://example.com/index.rdf")
+
+            assert len(articles) == 1
+            assert articles[0].url == "https://example.com/rdf-post"
+            assert articles[0].published_date.day == 15
+
+    async def test_parse_feed_falls_back_for_malformed_xml(self):
+        """Test that feeds lxml rejects, like ones using HTML entities, go to feedparser."""
+        rss_feed = """<?xml version="1.0"?>
+        <rss version="2.0">
+            <channel>
+                <title>Test&nbsp;Blog</title>
+                <item>
+                    <title>Loose Post</title>
+                    <guid>https://example.com/loose</guid>
+                </item>
+            </channel>
+        </rss>
+        """
+
+        mock_response = FakeResponse(content=rss_feed.encode())
+
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(return_value=mock_response)
+        mock_instance.stream = mock_stream(mock_instance.get)
+
+        from feed_reader.services import feed_parser
+
+        with patch("feed_reader.services.feed_parser.get_client", AsyncMock(return_value=mock_instance)), \
+                patch.object(feed_parser, "_FeedReader", wraps=feed_parser._FeedReader) as reader_cls:
+            articles = await parse_feed("https://example.com/feed.xml")
+
+            assert [a.url for a in articles] == ["https://example.com/loose"]
+            # The strict lxml pass isn't repeated before falling back
+            assert reader_cls.call_count == 1
+
+    async def test_parse_json_feed(self):
+        """Test parsing a JSON Feed."""
+        json_feed = """
+        {
+            "version": "https://jsonfeed.org/version/1.1",
+            "title": "Test Blog",
+            "items": [
+                {"id": "1", "title": "JSON Post", "url": "https://example.com/json-post",
+                 "date_published": "2024-01-15T10:30:00Z"},
+                {"id": "2", "content_text": "Untitled note", "url": "https://example.com/note"}
+            ]
+        }
+        """
+
+        mock_response = FakeResponse(content=json_feed.encode())
+
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(return_value=mock_response)
+        mock_instance.stream = mock_stream(mock_instance.get)
+
+        with patch("feed_reader.services.feed_parser.get_client", AsyncMock(return_value=mock_instance)):
+            articles = await parse_feed("https://example.com/feed.json")
+
+            assert len(articles) == 1
+            assert articles[0].title == "JSON Post"
+            assert articles[0].url == "https://example.com/json-post"
+            assert articles[0].published_date.day == 15
+
+    async def test_parse_json_feed_mixed_types(self):
+        """Test that non-string JSON Feed fields are treated as missing."""
+        json_feed = """
+        {
+            "version": "https://jsonfeed.org/version/1.1",
+            "items": [
+                {"title": 2024, "url": "https://example.com/numeric-title"},
+                {"title": "No URL", "url": ["https://example.com/list"]},
+                {"title": "Bad Date", "url": "https://example.com/bad-date", "date_published": 1705314600},
+                {"title": "Good", "url": "https://example.com/good", "date_published": "2024-01-15T10:30:00Z"}
+            ]
+        }
+        """
+
+        mock_instance = AsyncMock()
+        mock_instance.stream = mock_stream(AsyncMock(return_value=FakeResponse(content=json_feed.encode())))
+
+        with patch("feed_reader.services.feed_parser.get_client", AsyncMock(return_value=mock_instance)):
+            articles = await parse_feed("https://example.com/feed.json")
+
+        assert [(a.title, a.url) for a in articles] == [
+            ("Bad Date", "https://example.com/bad-date"),
+            ("Good", "https://example.com/good"),
+        ]
+        assert articles[0].published_date is None
+        assert articles[1].published_date == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+
     async def test_parse_feed_skips_missing_title(self):
         """Test that entries without title are skipped."""
         rss_feed = """<?xml version="1.0"?>
@@ -260,38 +815,153 @@ class TestFeedParser:
         </rss>
         """
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = rss_feed
-        mock_response.raise_for_status = MagicMock()
+        mock_response = FakeResponse(status_code=200, content=rss_feed.encode())
 
-        with patch("feed_reader.services.feed_parser.httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get = AsyncMock(return_value=mock_response)
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_instance
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(return_value=mock_response)
+        mock_instance.stream = mock_stream(mock_instance.get)
+
+        with patch("feed_reader.services.feed_parser.get_client", AsyncMock(return_value=mock_instance)):
 
             articles = await parse_feed("https://example.com/feed.xml")
 
             assert len(articles) == 1
             assert articles[0].title == "Has Title"
 
+    async def test_parse_feed_max_articles(self):
+        """Test that parsing stops once max_articles is reached."""
+        rss_feed = (
+            '<?xml version="1.0"?><rss version="2.0"><channel><title>Test Blog</title>'
+            + "".join(
+                f"<item><title>Post {i}</title><link>https://example.com/post{i}</link></item>"
+                for i in range(10)
+            )
+            + "</channel></rss>"
+        )
+
+        mock_response = FakeResponse(status_code=200, content=rss_feed.encode())
+
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(return_value=mock_response)
+        mock_instance.stream = mock_stream(mock_instance.get)
+
+        with patch("feed_reader.services.feed_parser.get_client", AsyncMock(return_value=mock_instance)):
+            articles = await parse_feed("https://example.com/feed.xml", max_articles=4)
+
+            assert len(articles) == 4
+            assert articles[-1].title == "Post 3"
+
+    async def test_parse_feed_stops_reading_at_max_articles(self):
+        """Test that a feed is only parsed up to the last article needed."""
+        # The document is cut off after the items, so it's never well-formed
+        rss_feed = (
+            '<?xml version="1.0"?><rss version="2.0"><channel><title>Test Blog</title>'
+            + "".join(
+                f"<item><title>Post {i}</title><link>https://example.com/post{i}</link></item>"
+                for i in range(10)
+            )
+            + "<item><title>Trunc"
+        )
+
+        mock_response = FakeResponse(content=rss_feed.encode())
+
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(return_value=mock_response)
+        mock_instance.stream = mock_stream(mock_instance.get)
+
+        with patch("feed_reader.services.feed_parser.get_client", AsyncMock(return_value=mock_instance)), \
+                patch("feed_reader.services.feed_parser.feedparser.parse") as feedparser_parse:
+            articles = await parse_feed("https://example.com/feed.xml", max_articles=4)
+
+            assert [a.title for a in articles] == [f"Post {i}" for i in range(4)]
+            feedparser_parse.assert_not_called()
+
+    async def test_parse_feed_not_modified(self):
+        """Test that a 304 answer to a conditional GET reuses the last articles."""
+        rss_feed = """<?xml version="1.0"?>
+        <rss version="2.0">
+            <channel>
+                <title>Test Blog</title>
+                <item>
+                    <title>First Post</title>
+                    <link>https://example.com/post1</link>
+                </item>
+            </channel>
+        </rss>
+        """
+
+        full_response = FakeResponse(
+            status_code=200,
+            content=rss_feed.encode(),
+            headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 12:00:00 GMT"},
+        )
+
+        not_modified = FakeResponse(status_code=304)
+
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(side_effect=[full_response, not_modified])
+        mock_instance.stream = mock_stream(mock_instance.get)
+
+        with patch("feed_reader.services.feed_parser.get_client", AsyncMock(return_value=mock_instance)):
+            first = await parse_feed("https://example.com/feed.xml")
+            second = await parse_feed("https://example.com/feed.xml")
+
+            assert second == first
+            assert [a.title for a in second] == ["First Post"]
+            assert mock_instance.get.call_args.kwargs["headers"] == {
+                "If-None-Match": '"v1"',
+                "If-Modified-Since": "Mon, 01 Jan 2024 12:00:00 GMT",
+            }
+
+    async def test_feed_cache_is_bounded_and_forgettable(self):
+        """Test that the conditional request cache evicts old feeds and forgets removed ones."""
+        from feed_reader.services import feed_parser
+
+        async def mock_get(url, **kwargs):
+            return FakeResponse(content=b"<rss><channel></channel></rss>", headers={"ETag": '"v1"'})
+
+        mock_instance = AsyncMock()
+        mock_instance.stream = mock_stream(mock_get)
+
+        with patch("feed_reader.services.feed_parser.get_client", AsyncMock(return_value=mock_instance)), \
+                patch.object(feed_parser, "FEED_CACHE_MAX_ENTRIES", 2):
+            await parse_feed("https://one.com/feed")
+            await parse_feed("https://two.com/feed")
+            await parse_feed("https://two.com/feed", max_articles=5)
+
+        assert list(feed_parser._feed_cache) == [("https://two.com/feed", 200), ("https://two.com/feed", 5)]
+
+        feed_parser.forget_feed("https://two.com/feed")
+        assert not feed_parser._feed_cache
+
     async def test_parse_feed_http_error(self):
         """Test handling of HTTP errors."""
         import httpx
 
-        with patch("feed_reader.services.feed_parser.httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get = AsyncMock(side_effect=httpx.HTTPError("Connection failed"))
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_instance
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(side_effect=httpx.HTTPError("Connection failed"))
+        mock_instance.stream = mock_stream(mock_instance.get)
+
+        with patch("feed_reader.services.feed_parser.get_client", AsyncMock(return_value=mock_instance)):
 
             articles = await parse_feed("https://example.com/feed.xml")
 
             assert articles == []
 
+    async def test_parse_feed_error_status(self):
+        """Test that an error status is reported as no articles."""
+        rss_feed = b"""<?xml version="1.0"?>
+        <rss version="2.0"><channel>
+            <item><title>Post 1</title><link>https://example.com/post1</link></item>
+        </channel></rss>
+        """
+
+        mock_instance = AsyncMock()
+        mock_instance.stream = mock_stream(AsyncMock(return_value=FakeResponse(status_code=500, content=rss_feed)))
+
+        with patch("feed_reader.services.feed_parser.get_client", AsyncMock(return_value=mock_instance)):
+            assert await parse_feed("https://example.com/feed.xml") == []
+
     def test_parse_date_rfc2822(self):
         """Test parsing RFC 2822 date format."""
         entry = {"published": "Mon, 01 Jan 2024 12:00:00 GMT"}
@@ -310,6 +980,38 @@ class TestFeedParser:
         assert result.month == 1
         assert result.day == 15
 
+    def test_parse_date_prefers_parsed_struct(self):
+        """Test that feedparser's parsed time struct is used over the raw string."""
+        import time
+
+        entry = {
+            "published": "Mon, 01 Jan 2024 12:00:00 GMT",
+            "published_parsed": time.struct_time((2024, 2, 3, 4, 5, 6, 5, 34, 0)),
+        }
+        result = _parse_date(entry)
+        assert result == datetime(2024, 2, 3, 4, 5, 6, tzinfo=timezone.utc)
+        assert result.utcoffset() == timedelta(0)
+
+    def test_parse_date_falls_back_to_updated(self):
+        """Test that the updated field is used when published is missing."""
+        entry = {"updated": "2024-03-10T08:00:00Z"}
+        result = _parse_date(entry)
+        assert result is not None
+        assert result.month == 3
+        assert result.day == 10
+
+    def test_parse_date_uncommon_format(self):
+        """Test that formats neither RFC 2822 nor ISO 8601 still parse."""
+        entry = {"published": "  15 Jan 2024\n"}
+        result = _parse_date(entry)
+        assert result == datetime(2024, 1, 15, tzinfo=timezone.utc)
+
+    def test_parse_date_us_zone_abbreviation(self):
+        """Test that month-first dates with a US zone abbreviation keep their offset."""
+        entry = {"published": "Jan 15, 2024 10:00 EST"}
+        result = _parse_date(entry)
+        assert result == datetime(2024, 1, 15, 15, 0, tzinfo=timezone.utc)
+
     def test_parse_date_invalid(self):
         """Test handling of invalid date."""
         entry = {"published": "not a date"}
@@ -334,17 +1036,12 @@ class TestScraper:
         </html>
         """
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = html
-        mock_response.raise_for_status = MagicMock()
+        mock_response = FakeResponse(status_code=200, content=html.encode(), charset_encoding="utf-8")
+
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(return_value=mock_response)
 
-        with patch("feed_reader.services.scraper.httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get = AsyncMock(return_value=mock_response)
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_instance
+        with patch("feed_reader.services.scraper.get_client", AsyncMock(return_value=mock_instance)):
 
             articles = await scrape_blog("https://example.com", "a.post-link")
 
@@ -369,23 +1066,50 @@ class TestScraper:
         </html>
         """
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = html
-        mock_response.raise_for_status = MagicMock()
+        mock_response = FakeResponse(status_code=200, content=html.encode(), charset_encoding="utf-8")
 
-        with patch("feed_reader.services.scraper.httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get = AsyncMock(return_value=mock_response)
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_instance
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(return_value=mock_response)
+
+        with patch("feed_reader.services.scraper.get_client", AsyncMock(return_value=mock_instance)):
 
             articles = await scrape_blog("https://example.com", "article.post")
 
             assert len(articles) == 2
             assert articles[0].url == "https://example.com/article1"
 
+    async def test_scrape_blog_resolves_href_forms(self):
+        """Test absolute, protocol-relative, root-relative and relative hrefs, skipping non-article ones."""
+        html = """
+        <html>
+        <body>
+            <a href="https://other.com/abs" class="link">Absolute</a>
+            <a href="//cdn.example.com/proto" class="link">Protocol Relative</a>
+            <a href="/root" class="link">Root Relative</a>
+            <a href="relative" class="link">Relative</a>
+            <a href="/a/../dotted" class="link">Dotted</a>
+            <a href="#top" class="link">Fragment</a>
+            <a href="mailto:author@example.com" class="link">Email</a>
+        </body>
+        </html>
+        """
+
+        mock_response = FakeResponse(status_code=200, content=html.encode(), charset_encoding="utf-8")
+
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(return_value=mock_response)
+
+        with patch("feed_reader.services.scraper.get_client", AsyncMock(return_value=mock_instance)):
+            articles = await scrape_blog("https://example.com/blog/index.html", "a.link")
+
+            assert [a.url for a in articles] == [
+                "https://other.com/abs",
+                "https://cdn.example.com/proto",
+                "https://example.com/root",
+                "https://example.com/blog/relative",
+                "https://example.com/dotted",
+            ]
+
     async def test_scrape_blog_deduplicates_urls(self):
         """Test that duplicate URLs are removed."""
         html = """
@@ -393,57 +1117,103 @@ class TestScraper:
         <body>
             <a href="/same-post" class="link">First Link</a>
             <a href="/same-post" class="link">Duplicate Link</a>
+            <a href="https://example.com/same-post" class="link">Absolute Duplicate</a>
             <a href="/other-post" class="link">Other Post</a>
         </body>
         </html>
         """
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = html
-        mock_response.raise_for_status = MagicMock()
+        mock_response = FakeResponse(status_code=200, content=html.encode(), charset_encoding="utf-8")
+
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(return_value=mock_response)
 
-        with patch("feed_reader.services.scraper.httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get = AsyncMock(return_value=mock_response)
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_instance
+        with patch("feed_reader.services.scraper.get_client", AsyncMock(return_value=mock_instance)):
 
             articles = await scrape_blog("https://example.com", "a.link")
 
-            assert len(articles) == 2
+            assert [(a.title, a.url) for a in articles] == [
+                ("First Link", "https://example.com/same-post"),
+                ("Other Post", "https://example.com/other-post"),
+            ]
+
+    async def test_scrape_blog_falls_back_for_unsupported_selector(self):
+        """Test that selectors lxml can't handle fall back to BeautifulSoup."""
+        html = """
+        <html>
+        <body>
+            <a href="/first" class="link">First Post</a>
+            <a href="/second" class="link">Second Post</a>
+        </body>
+        </html>
+        """
+
+        mock_response = FakeResponse(status_code=200, content=html.encode(), charset_encoding="utf-8")
+
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(return_value=mock_response)
+
+        with patch("feed_reader.services.scraper.get_client", AsyncMock(return_value=mock_instance)):
+            articles = await scrape_blog("https://example.com", 'a:-soup-contains("First")')
+
+            assert len(articles) == 1
+            assert articles[0].url == "https://example.com/first"
+
+    def test_compile_selector_is_cached(self):
+        """Test that repeated scrapes reuse the compiled selector."""
+        from feed_reader.services.scraper import _compile_selector
+
+        assert _compile_selector("article h2 a") is _compile_selector("article h2 a")
+
+    async def test_scrape_blog_max_articles(self):
+        """Test that scraping stops once max_articles is reached."""
+        html = "<html><body>" + "".join(
+            f'<a href="/post{i}" class="link">Post {i}</a>' for i in range(10)
+        ) + "</body></html>"
+
+        mock_response = FakeResponse(status_code=200, content=html.encode(), charset_encoding="utf-8")
+
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(return_value=mock_response)
+
+        with patch("feed_reader.services.scraper.get_client", AsyncMock(return_value=mock_instance)):
+            articles = await scrape_blog("https://example.com", "a.link", max_articles=3)
+
+            assert [a.title for a in articles] == ["Post 0", "Post 1", "Post 2"]
 
     async def test_scrape_blog_no_matches(self):
         """Test scraping returns empty list when no elements match."""
         html = "<html><body><p>No posts here</p></body></html>"
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = html
-        mock_response.raise_for_status = MagicMock()
+        mock_response = FakeResponse(status_code=200, content=html.encode(), charset_encoding="utf-8")
+
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(return_value=mock_response)
 
-        with patch("feed_reader.services.scraper.httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get = AsyncMock(return_value=mock_response)
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_instance
+        with patch("feed_reader.services.scraper.get_client", AsyncMock(return_value=mock_instance)):
 
             articles = await scrape_blog("https://example.com", "article.post")
 
             assert articles == []
 
+    async def test_scrape_blog_error_status(self):
+        """Test that an error status is reported as no articles."""
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(
+            return_value=FakeResponse(status_code=404, content=b'<a class="post-link" href="/p">Post</a>')
+        )
+
+        with patch("feed_reader.services.scraper.get_client", AsyncMock(return_value=mock_instance)):
+            assert await scrape_blog("https://example.com", "a.post-link") == []
+
     async def test_scrape_blog_http_error(self):
         """Test handling of HTTP errors during scraping."""
         import httpx
 
-        with patch("feed_reader.services.scraper.httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get = AsyncMock(side_effect=httpx.HTTPError("Connection failed"))
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_instance
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(side_effect=httpx.HTTPError("Connection failed"))
+
+        with patch("feed_reader.services.scraper.get_client", AsyncMock(return_value=mock_instance)):
 
             articles = await scrape_blog("https://example.com", "a.post-link")
 